@@ -1,7 +1,9 @@
+from app.application.dto.event import EventKey
 from app.application.dto.inbox import InboxDTO, InboxDTOResponse
 from app.application.dto.order import (OrderDTO, OrderDTOResponse,
                                        OrderStatusDTO)
-from app.application.dto.outbox import OutboxDTO, OutboxDTOResponse
+from app.application.dto.outbox import (DispatchResult, OutboxDTO,
+                                        OutboxDTOResponse, RetryPolicy)
 from app.application.dto.payment import PaymentDTO
 
 __all__ = [
@@ -13,4 +15,7 @@ __all__ = [
     "InboxDTOResponse",
     "OutboxDTO",
     "PaymentDTO",
+    "DispatchResult",
+    "RetryPolicy",
+    "EventKey",
 ]
@@ -0,0 +1,11 @@
+from datetime import datetime
+from typing import NamedTuple
+from uuid import UUID
+
+
+class EventKey(NamedTuple):
+    """Identifies an outbox or inbox row; ``created_at`` is the partition
+    key, so updates filtering on both only touch the partition of the row."""
+
+    id: UUID
+    created_at: datetime
@@ -1,7 +1,9 @@
 from dataclasses import asdict, dataclass
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+from app.application.dto.event import EventKey
 from app.application.enums.events import EventTypeEnum, InboxEventStatusEnum
 
 
@@ -23,6 +25,11 @@ class InboxDTOResponse:
     payload: dict[str, Any]
     status: InboxEventStatusEnum
     idempotency_key: UUID
+    created_at: datetime
+
+    @property
+    def key(self) -> EventKey:
+        return EventKey(id=self.id, created_at=self.created_at)
 
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
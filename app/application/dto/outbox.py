@@ -1,21 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
+from app.application.dto.event import EventKey
 from app.application.enums.events import EventTypeEnum, OutboxEventStatusEnum
 
 if TYPE_CHECKING:
     from app.application.interfaces.contracts import (BrokerMessageRequest,
-                                                      NotificationRequest,
+                                                      NotificationEvent,
                                                       PaymentRequest)
 
 
 @dataclass
 class OutboxDTO:
     event_type: EventTypeEnum
-    payload: NotificationRequest | PaymentRequest | BrokerMessageRequest
+    payload: NotificationEvent | PaymentRequest | BrokerMessageRequest
     status: OutboxEventStatusEnum
 
     def to_dict(self) -> dict[str, Any]:
@@ -28,6 +30,45 @@ class OutboxDTOResponse:
     event_type: EventTypeEnum
     payload: dict[str, Any]
     status: OutboxEventStatusEnum
+    created_at: datetime
+    attempts: int = 0
+    last_error: str | None = None
+
+    @property
+    def key(self) -> EventKey:
+        return EventKey(id=self.id, created_at=self.created_at)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class DispatchResult:
+    sent: list[UUID] = field(default_factory=list)
+    failed: dict[UUID, str] = field(default_factory=dict)
+    # Events not attempted because an earlier event of their order failed,
+    # mapped to that event.
+    held_back: dict[UUID, UUID] = field(default_factory=dict)
+    # Failed events that used up their attempts.
+    dead_lettered: list[UUID] = field(default_factory=list)
+
+    @property
+    def claimed(self) -> int:
+        return len(self.sent) + len(self.failed) + len(self.held_back)
 
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff for failed outbox deliveries.
+
+    The n-th failed attempt is retried after ``base_delay * 2 ** (n - 1)``
+    seconds, capped at ``max_delay``; after ``max_attempts`` failures the
+    event becomes a dead letter.
+    """
+
+    max_attempts: int = 10
+    base_delay: float = 5.0
+    max_delay: float = 3600.0
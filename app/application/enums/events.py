@@ -13,6 +13,7 @@ class EventTypeEnum(StrEnum):
 class OutboxEventStatusEnum(StrEnum):
     PENDING = "pending"
     SENT = "sent"
+    DEAD_LETTER = "dead_letter"
 
 
 class InboxEventStatusEnum(StrEnum):
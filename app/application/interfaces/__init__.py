@@ -1,6 +1,7 @@
 from app.application.interfaces.catalog import CatalogServiceProtocol
 from app.application.interfaces.contracts import (BrokerMessageRequest,
                                                   BrokerMessageResponse,
+                                                  NotificationEvent,
                                                   NotificationRequest,
                                                   PaymentRequest)
 from app.application.interfaces.message_broker import (MessageConsumerProtocol,
@@ -12,6 +13,7 @@ from app.application.interfaces.uow import UnitOfWorkProtocol
 
 __all__ = [
     "CatalogServiceProtocol",
+    "NotificationEvent",
     "NotificationRequest",
     "PaymentRequest",
     "UnitOfWorkProtocol",
@@ -1,8 +1,14 @@
-from typing import Protocol
+from typing import Iterable, Protocol
 from uuid import UUID
 
 from app.core.value_objects.item import Item
 
 
 class CatalogServiceProtocol(Protocol):
-    async def get_item_stock(self, item_id: UUID) -> Item: ...
+    async def get_item(self, item_id: UUID) -> Item | None: ...
+    async def get_item_stock(
+        self, item_id: UUID, max_stock_age: float | None = None
+    ) -> Item | None: ...
+    async def get_items_stock(
+        self, item_ids: Iterable[UUID], max_stock_age: float | None = None
+    ) -> dict[UUID, Item | None]: ...
@@ -12,6 +12,14 @@ class NotificationRequest(TypedDict):
     idempotency_key: str
 
 
+# Outbox payload of a notification. order_id is not sent to the notifications
+# service; it keeps an order's notifications in one outbox partition, in order.
+class NotificationEvent(TypedDict):
+    order_id: str
+    message: str
+    idempotency_key: str
+
+
 class BrokerMessageResponse(TypedDict):
     event_type: str
     order_id: str
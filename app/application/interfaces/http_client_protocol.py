@@ -4,7 +4,9 @@ from typing import Any, Protocol, Self
 class HTTPBaseClientProtocol(Protocol):
     async def __aenter__(self) -> Self: ...
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None: ...
+    async def start(self) -> None: ...
     async def close(self) -> None: ...
+    def pool_stats(self) -> dict[str, dict[str, int]]: ...
     async def get(
         self,
         url: str,
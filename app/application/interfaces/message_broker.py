@@ -1,4 +1,4 @@
-from typing import Protocol, Self
+from typing import Awaitable, Protocol, Self, Sequence
 
 from .contracts import BrokerMessageRequest
 
@@ -10,6 +10,15 @@ class MessageProducerProtocol(Protocol):
         key: str | None = None,
         topic: str | None = None,
     ) -> None: ...
+    async def send_message(
+        self,
+        message: BrokerMessageRequest,
+        key: str | None = None,
+        topic: str | None = None,
+    ) -> Awaitable[None]: ...
+    async def publish_many(
+        self, messages: Sequence[BrokerMessageRequest]
+    ) -> list[Exception | None]: ...
     async def __aenter__(self) -> Self: ...
     async def __aexit__(self, exc_type, exc_val, exc_tb): ...
     async def start(self) -> None: ...
@@ -1,9 +1,9 @@
-from typing import Protocol
+from typing import Mapping, Protocol, Sequence
 from uuid import UUID
 
-from app.application.dto import (InboxDTO, InboxDTOResponse, OrderDTO,
-                                 OrderDTOResponse, OrderStatusDTO, OutboxDTO,
-                                 OutboxDTOResponse)
+from app.application.dto import (EventKey, InboxDTO, InboxDTOResponse,
+                                 OrderDTO, OrderDTOResponse, OrderStatusDTO,
+                                 OutboxDTO, OutboxDTOResponse, RetryPolicy)
 from app.application.enums.events import (EventTypeEnum, InboxEventStatusEnum,
                                           OutboxEventStatusEnum)
 
@@ -12,12 +12,14 @@ class OrderRepositoryProtocol(Protocol):
     async def create(self, entity: OrderDTO) -> OrderDTOResponse: ...
     async def get_by_id(self, entity_id: UUID) -> OrderDTOResponse | None: ...
     async def get_order(self, idempotency_key: UUID) -> OrderDTOResponse | None: ...
+    async def get_top_item_ids(self, limit: int) -> list[UUID]: ...
     async def update(self, entity: OrderDTO, order_id: UUID) -> OrderDTO | None: ...
     async def delete(self, entity_id: UUID) -> None: ...
 
 
 class OutboxRepositoryProtocol(Protocol):
     async def create(self, entity: OutboxDTO) -> None: ...
+    async def create_many(self, entities: Sequence[OutboxDTO]) -> None: ...
     async def get_events(
         self,
         event_type: EventTypeEnum | None,
@@ -25,6 +27,27 @@ class OutboxRepositoryProtocol(Protocol):
         limit: int | None = 100,
     ) -> list[OutboxDTOResponse] | list[None]: ...
     async def mark_as_sent(self, event_id: UUID) -> None: ...
+    async def claim_batch(
+        self,
+        event_type: EventTypeEnum | Sequence[EventTypeEnum],
+        lease_owner: str,
+        limit: int = 100,
+        lease_seconds: float = 30.0,
+        partitions: Sequence[int] | None = None,
+    ) -> list[OutboxDTOResponse]: ...
+    async def mark_sent_many(self, event_keys: Sequence[EventKey]) -> None: ...
+    async def schedule_retries(
+        self, failures: Mapping[EventKey, str], retry_policy: RetryPolicy
+    ) -> None: ...
+    async def hold_back(self, holds: Mapping[EventKey, EventKey]) -> None: ...
+    async def release_many(
+        self, event_keys: Sequence[EventKey], lease_owner: str
+    ) -> None: ...
+    async def requeue_dead_letters(
+        self,
+        event_ids: Sequence[UUID] | None = None,
+        event_type: EventTypeEnum | None = None,
+    ) -> list[UUID]: ...
     async def get_unsent_notifications(
         self,
     ) -> list[OutboxDTOResponse] | list[None]: ...
@@ -32,6 +55,7 @@ class OutboxRepositoryProtocol(Protocol):
 
 class InboxRepositoryProtocol(Protocol):
     async def create(self, entity: InboxDTO) -> None: ...
+    async def create_many(self, entities: Sequence[InboxDTO]) -> set[UUID]: ...
     async def get_events(
         self,
         event_type: EventTypeEnum | None = None,
@@ -39,7 +63,7 @@ class InboxRepositoryProtocol(Protocol):
         limit: int | None = 100,
     ) -> list[InboxDTOResponse]: ...
     async def get_event(self, idempotency_key: UUID) -> InboxDTOResponse | None: ...
-    async def mark_as_processed(self, event_id: UUID) -> None: ...
+    async def mark_as_processed(self, event_key: EventKey) -> None: ...
 
 
 class OrderStatusRepositoryProtocol(Protocol):
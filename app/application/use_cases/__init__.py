@@ -3,9 +3,13 @@ from app.application.use_cases.create_payment import CreatePaymentUseCase
 from app.application.use_cases.payments_response import \
     HandlePaymentResponseUseCase
 from app.application.use_cases.register_shipping import RegisterShippingUseCase
+from app.application.use_cases.requeue_dead_letters import \
+    RequeueDeadLettersUseCase
 from app.application.use_cases.send_notification import SendNotificationUseCase
 from app.application.use_cases.shipping_response import ShippingResponseUseCase
 from app.application.use_cases.update_status import UpdateOrderStatusUseCase
+from app.application.use_cases.warm_catalog_cache import \
+    WarmCatalogCacheUseCase
 
 __all__ = [
     "CreateOrderUseCase",
@@ -15,4 +19,6 @@ __all__ = [
     "ShippingResponseUseCase",
     "CreatePaymentUseCase",
     "SendNotificationUseCase",
+    "WarmCatalogCacheUseCase",
+    "RequeueDeadLettersUseCase",
 ]
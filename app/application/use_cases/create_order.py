@@ -5,7 +5,7 @@ from app.application.dto import (OrderDTO, OrderDTOResponse, OrderStatusDTO,
 from app.application.enums.events import (EventTypeEnum, OrderStatusEnum,
                                           OutboxEventStatusEnum)
 from app.application.interfaces import (CatalogServiceProtocol,
-                                        NotificationRequest, PaymentRequest,
+                                        NotificationEvent, PaymentRequest,
                                         UnitOfWorkProtocol)
 from app.core.exceptions import (ItemNotFoundError, NotEnoughStocksError,
                                  OrderAlreadyExistsError, OrderResponseData)
@@ -55,8 +55,10 @@ class CreateOrderUseCase:
             )
             status_event = OutboxDTO(
                 event_type=EventTypeEnum.ORDER_CREATED,
-                payload=NotificationRequest(
-                    message="Order created", idempotency_key=str(uuid.uuid4())
+                payload=NotificationEvent(
+                    order_id=str(created_order.id),
+                    message="Order created",
+                    idempotency_key=str(uuid.uuid4()),
                 ),
                 status=OutboxEventStatusEnum.PENDING,
             )
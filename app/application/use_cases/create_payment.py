@@ -1,30 +1,69 @@
-from app.application.enums.events import EventTypeEnum, OutboxEventStatusEnum
+from typing import Sequence
+
+from app.application.dto import DispatchResult, OutboxDTOResponse, RetryPolicy
+from app.application.enums.events import EventTypeEnum
 from app.application.interfaces import (PaymentRequest, PaymentServiceProtocol,
                                         UnitOfWorkProtocol)
+from app.application.use_cases.outbox_dispatch import (
+    DEFAULT_DISPATCH_CONCURRENCY, dispatch_events, record_dispatch)
 
 
 class CreatePaymentUseCase:
     def __init__(
-        self, uow: UnitOfWorkProtocol, payments_service: PaymentServiceProtocol
+        self,
+        uow: UnitOfWorkProtocol,
+        payments_service: PaymentServiceProtocol,
+        lease_owner: str,
+        batch_size: int = 100,
+        lease_seconds: float = 30.0,
+        partitions: Sequence[int] | None = None,
+        concurrency: int = DEFAULT_DISPATCH_CONCURRENCY,
+        retry_policy: RetryPolicy | None = None,
     ):
         self.uow = uow
         self.payment_service = payments_service
+        self.lease_owner = lease_owner
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.partitions = partitions
+        self.concurrency = concurrency
+        self.retry_policy = retry_policy or RetryPolicy()
 
-    async def __call__(self) -> None:
+    async def __call__(self) -> DispatchResult:
         async with self.uow:
-            events = await self.uow.outbox.get_events(
+            events = await self.uow.outbox.claim_batch(
                 event_type=EventTypeEnum.PAYMENT_REQUESTED,
-                status=OutboxEventStatusEnum.PENDING,
+                lease_owner=self.lease_owner,
+                limit=self.batch_size,
+                lease_seconds=self.lease_seconds,
+                partitions=self.partitions,
+            )
+            await self.uow.commit()
+        if not events:
+            return DispatchResult()
+        result = DispatchResult()
+        try:
+            await dispatch_events(
+                events=events,
+                send=self._send,
+                concurrency=self.concurrency,
+                result=result,
             )
-            if not events:
-                return None
-            for event in events:
-                payload = PaymentRequest(
-                    order_id=event.payload.get("order_id"),
-                    amount=event.payload.get("amount"),
-                    idempotency_key=event.payload.get("idempotency_key"),
-                )
-                if await self.payment_service.create_payment(payload=payload):
-                    await self.uow.outbox.mark_as_sent(event_id=event.id)
-                    await self.uow.commit()
-            return None
+        finally:
+            # Also on cancellation: record what went out, release the rest.
+            await record_dispatch(
+                uow=self.uow,
+                claimed=events,
+                result=result,
+                retry_policy=self.retry_policy,
+                lease_owner=self.lease_owner,
+            )
+        return result
+
+    async def _send(self, event: OutboxDTOResponse) -> bool:
+        payload = PaymentRequest(
+            order_id=event.payload.get("order_id"),
+            amount=event.payload.get("amount"),
+            idempotency_key=event.payload.get("idempotency_key"),
+        )
+        return await self.payment_service.create_payment(payload=payload)
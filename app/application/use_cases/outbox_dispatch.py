@@ -0,0 +1,106 @@
+import asyncio
+from typing import Awaitable, Callable, Sequence
+
+from app.application.dto import DispatchResult, OutboxDTOResponse, RetryPolicy
+from app.application.interfaces import UnitOfWorkProtocol
+
+DEFAULT_DISPATCH_CONCURRENCY = 20
+
+
+async def dispatch_events(
+    events: Sequence[OutboxDTOResponse],
+    send: Callable[[OutboxDTOResponse], Awaitable[bool]],
+    concurrency: int,
+    result: DispatchResult,
+) -> None:
+    """Send ``events`` with at most ``concurrency`` calls in flight.
+
+    Events of the same order are sent one after another in claim order, and
+    the ones after a failure are held back for the next attempt so the order
+    sees them in sequence. A failure never stops other orders' events.
+    Outcomes are added to ``result`` as they arrive, so a caller cancelled
+    mid-batch still knows which events went out.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def dispatch(event: OutboxDTOResponse) -> bool:
+        async with semaphore:
+            try:
+                delivered = await send(event)
+            except Exception as e:
+                result.failed[event.id] = str(e) or type(e).__name__
+                return False
+        if delivered:
+            result.sent.append(event.id)
+        else:
+            result.failed[event.id] = "rejected"
+        return delivered
+
+    async def dispatch_in_order(order_events: list[OutboxDTOResponse]) -> None:
+        for position, event in enumerate(order_events):
+            if not await dispatch(event):
+                for held_back in order_events[position + 1 :]:
+                    result.held_back[held_back.id] = event.id
+                return None
+
+    by_order: dict[str, list[OutboxDTOResponse]] = {}
+    for event in events:
+        order_key = str(event.payload.get("order_id") or event.id)
+        by_order.setdefault(order_key, []).append(event)
+
+    await asyncio.gather(*(dispatch_in_order(group) for group in by_order.values()))
+
+
+async def record_dispatch(
+    uow: UnitOfWorkProtocol,
+    claimed: Sequence[OutboxDTOResponse],
+    result: DispatchResult,
+    retry_policy: RetryPolicy,
+    lease_owner: str,
+) -> None:
+    """Mark sent events, schedule retries for failed ones and release the
+    rest of the ``claimed`` batch in one transaction.
+
+    Held-back events were never attempted: they keep their attempt count and
+    last error and become due together with the failure that blocked them,
+    and ``claim_batch`` does not hand them out before it is sent. Events
+    with no outcome were never dispatched because the worker was stopped
+    mid-batch; their leases are released so that another worker picks them
+    up at once instead of after the lease expires. Failures that used up
+    their attempts are added to ``result.dead_lettered``.
+    """
+    keys = {event.id: event.key for event in claimed}
+    sent = set(result.sent)
+    unprocessed = [
+        event.key
+        for event in claimed
+        if event.id not in sent
+        and event.id not in result.failed
+        and event.id not in result.held_back
+    ]
+    if not sent and not result.failed and not result.held_back and not unprocessed:
+        return None
+    result.dead_lettered = [
+        event.id
+        for event in claimed
+        if event.id in result.failed and event.attempts + 1 >= retry_policy.max_attempts
+    ]
+    async with uow:
+        await uow.outbox.mark_sent_many(
+            event_keys=[keys[event_id] for event_id in result.sent]
+        )
+        await uow.outbox.schedule_retries(
+            failures={
+                keys[event_id]: error for event_id, error in result.failed.items()
+            },
+            retry_policy=retry_policy,
+        )
+        # After schedule_retries, so the blockers' next attempt is known.
+        await uow.outbox.hold_back(
+            holds={
+                keys[event_id]: keys[blocker_id]
+                for event_id, blocker_id in result.held_back.items()
+            }
+        )
+        await uow.outbox.release_many(event_keys=unprocessed, lease_owner=lease_owner)
+        await uow.commit()
@@ -5,8 +5,7 @@ from app.application.enums.events import (EventTypeEnum, InboxEventStatusEnum,
                                           OutboxEventStatusEnum,
                                           PaymentStatusEnum)
 from app.application.interfaces import (BrokerMessageRequest,
-                                        NotificationRequest,
-                                        UnitOfWorkProtocol)
+                                        NotificationEvent, UnitOfWorkProtocol)
 
 
 class HandlePaymentResponseUseCase:
@@ -27,8 +26,10 @@ class HandlePaymentResponseUseCase:
                 outbox_dto = OutboxDTO(
                     event_type=EventTypeEnum.ORDER_PAID,
                     status=OutboxEventStatusEnum.PENDING,
-                    payload=NotificationRequest(
-                        message="Order is paid", idempotency_key=str(uuid.uuid4())
+                    payload=NotificationEvent(
+                        order_id=str(payment.order_id),
+                        message="Order is paid",
+                        idempotency_key=str(uuid.uuid4()),
                     ),
                 )
                 order = await self.uow.orders.get_by_id(entity_id=payment.order_id)
@@ -57,8 +58,10 @@ class HandlePaymentResponseUseCase:
                 outbox_dto = OutboxDTO(
                     event_type=EventTypeEnum.ORDER_CANCELLED,
                     status=OutboxEventStatusEnum.PENDING,
-                    payload=NotificationRequest(
-                        message="Order is cancelled", idempotency_key=str(uuid.uuid4())
+                    payload=NotificationEvent(
+                        order_id=str(payment.order_id),
+                        message="Order is cancelled",
+                        idempotency_key=str(uuid.uuid4()),
                     ),
                 )
                 await self.uow.inbox.create(entity=inbox_dto)
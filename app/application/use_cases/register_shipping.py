@@ -1,34 +1,87 @@
-from app.application.enums.events import EventTypeEnum, OutboxEventStatusEnum
+from typing import Sequence
+
+from app.application.dto import DispatchResult, OutboxDTOResponse, RetryPolicy
+from app.application.enums.events import EventTypeEnum
 from app.application.interfaces import (BrokerMessageRequest,
                                         MessageProducerProtocol,
                                         UnitOfWorkProtocol)
+from app.application.use_cases.outbox_dispatch import record_dispatch
 
 
 class RegisterShippingUseCase:
-    def __init__(self, uow: UnitOfWorkProtocol, broker: MessageProducerProtocol):
+    def __init__(
+        self,
+        uow: UnitOfWorkProtocol,
+        broker: MessageProducerProtocol,
+        lease_owner: str,
+        batch_size: int = 100,
+        lease_seconds: float = 30.0,
+        partitions: Sequence[int] | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
         self.uow = uow
         self.broker = broker
+        self.lease_owner = lease_owner
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.partitions = partitions
+        self.retry_policy = retry_policy or RetryPolicy()
 
-    async def __call__(self) -> None:
+    async def __call__(self) -> DispatchResult:
         async with self.uow:
-            messages = await self.uow.outbox.get_events(
+            messages = await self.uow.outbox.claim_batch(
                 event_type=EventTypeEnum.SHIPPING_REQUESTED,
-                status=OutboxEventStatusEnum.PENDING,
+                lease_owner=self.lease_owner,
+                limit=self.batch_size,
+                lease_seconds=self.lease_seconds,
+                partitions=self.partitions,
             )
-            if not messages:
-                return None
-        async with self.broker:
-            for message in messages:
-                async with self.uow as uow:
-                    await self.broker.publish_message(
-                        message=BrokerMessageRequest(
-                            event_type=message.payload.get("event_type"),
-                            order_id=message.payload.get("order_id"),
-                            item_id=message.payload.get("item_id"),
-                            quantity=message.payload.get("quantity"),
-                            idempotency_key=message.payload.get("idempotency_key"),
-                        )
+            await self.uow.commit()
+        if not messages:
+            return DispatchResult()
+        result = DispatchResult()
+        try:
+            await self._publish(messages=messages, result=result)
+        finally:
+            # Also on cancellation: record what was published, release the rest.
+            await record_dispatch(
+                uow=self.uow,
+                claimed=messages,
+                result=result,
+                retry_policy=self.retry_policy,
+                lease_owner=self.lease_owner,
+            )
+        return result
+
+    async def _publish(
+        self, messages: Sequence[OutboxDTOResponse], result: DispatchResult
+    ) -> None:
+        """Publish the batch in as few produce requests as the producer can.
+
+        The producer keeps messages in order per partition. If the batch
+        cannot be handed over at all, every message is retried with the error.
+        """
+        try:
+            await self.broker.start()
+            errors = await self.broker.publish_many(
+                messages=[
+                    BrokerMessageRequest(
+                        event_type=message.payload.get("event_type"),
+                        order_id=message.payload.get("order_id"),
+                        item_id=message.payload.get("item_id"),
+                        quantity=message.payload.get("quantity"),
+                        idempotency_key=message.payload.get("idempotency_key"),
                     )
-                    await uow.outbox.mark_as_sent(event_id=message.id)
-                    await uow.commit()
+                    for message in messages
+                ]
+            )
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            for message in messages:
+                result.failed[message.id] = error
             return None
+        for message, error in zip(messages, errors):
+            if error is None:
+                result.sent.append(message.id)
+            else:
+                result.failed[message.id] = str(error) or type(error).__name__
@@ -0,0 +1,22 @@
+from typing import Sequence
+from uuid import UUID
+
+from app.application.enums.events import EventTypeEnum
+from app.application.interfaces import UnitOfWorkProtocol
+
+
+class RequeueDeadLettersUseCase:
+    def __init__(self, uow: UnitOfWorkProtocol):
+        self.uow = uow
+
+    async def __call__(
+        self,
+        event_ids: Sequence[UUID] | None = None,
+        event_type: EventTypeEnum | None = None,
+    ) -> list[UUID]:
+        async with self.uow:
+            requeued = await self.uow.outbox.requeue_dead_letters(
+                event_ids=event_ids, event_type=event_type
+            )
+            await self.uow.commit()
+        return requeued
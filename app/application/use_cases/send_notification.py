@@ -1,6 +1,19 @@
+from typing import Sequence
+
+from app.application.dto import DispatchResult, OutboxDTOResponse, RetryPolicy
+from app.application.enums.events import EventTypeEnum
 from app.application.interfaces import (NotificationRequest,
                                         NotificationsServiceProtocol,
                                         UnitOfWorkProtocol)
+from app.application.use_cases.outbox_dispatch import (
+    DEFAULT_DISPATCH_CONCURRENCY, dispatch_events, record_dispatch)
+
+NOTIFICATION_EVENT_TYPES = (
+    EventTypeEnum.ORDER_CREATED,
+    EventTypeEnum.ORDER_PAID,
+    EventTypeEnum.ORDER_CANCELLED,
+    EventTypeEnum.ORDER_SHIPPED,
+)
 
 
 class SendNotificationUseCase:
@@ -8,22 +21,57 @@ class SendNotificationUseCase:
         self,
         uow: UnitOfWorkProtocol,
         notification_service: NotificationsServiceProtocol,
+        lease_owner: str,
+        batch_size: int = 100,
+        lease_seconds: float = 30.0,
+        partitions: Sequence[int] | None = None,
+        concurrency: int = DEFAULT_DISPATCH_CONCURRENCY,
+        retry_policy: RetryPolicy | None = None,
     ):
         self.uow = uow
         self.notifications_service = notification_service
+        self.lease_owner = lease_owner
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.partitions = partitions
+        self.concurrency = concurrency
+        self.retry_policy = retry_policy or RetryPolicy()
 
-    async def __call__(self) -> None:
+    async def __call__(self) -> DispatchResult:
         async with self.uow:
-            notifications = await self.uow.outbox.get_unsent_notifications()
-            if not notifications:
-                return None
-            for notification in notifications:
-                if await self.notifications_service.send_notification(
-                    payload=NotificationRequest(
-                        message=notification.payload.get("message"),
-                        idempotency_key=notification.payload.get("idempotency_key"),
-                    )
-                ):
-                    await self.uow.outbox.mark_as_sent(notification.id)
-                    await self.uow.commit()
-            return None
+            notifications = await self.uow.outbox.claim_batch(
+                event_type=NOTIFICATION_EVENT_TYPES,
+                lease_owner=self.lease_owner,
+                limit=self.batch_size,
+                lease_seconds=self.lease_seconds,
+                partitions=self.partitions,
+            )
+            await self.uow.commit()
+        if not notifications:
+            return DispatchResult()
+        result = DispatchResult()
+        try:
+            await dispatch_events(
+                events=notifications,
+                send=self._send,
+                concurrency=self.concurrency,
+                result=result,
+            )
+        finally:
+            # Also on cancellation: record what went out, release the rest.
+            await record_dispatch(
+                uow=self.uow,
+                claimed=notifications,
+                result=result,
+                retry_policy=self.retry_policy,
+                lease_owner=self.lease_owner,
+            )
+        return result
+
+    async def _send(self, notification: OutboxDTOResponse) -> bool:
+        return await self.notifications_service.send_notification(
+            payload=NotificationRequest(
+                message=notification.payload.get("message"),
+                idempotency_key=notification.payload.get("idempotency_key"),
+            )
+        )
@@ -1,10 +1,11 @@
 import uuid
+from typing import Sequence
 
 from app.application.dto import InboxDTO, OutboxDTO
 from app.application.enums.events import (EventTypeEnum, InboxEventStatusEnum,
                                           OrderStatusEnum,
                                           OutboxEventStatusEnum)
-from app.application.interfaces import NotificationRequest, UnitOfWorkProtocol
+from app.application.interfaces import NotificationEvent, UnitOfWorkProtocol
 from app.application.interfaces.contracts import BrokerMessageResponse
 
 
@@ -13,54 +14,79 @@ class ShippingResponseUseCase:
         self.uow = uow
 
     async def __call__(self, message: BrokerMessageResponse) -> None:
-        if not message:
-            return None
+        await self.handle_many(messages=[message])
 
-        async with self.uow:
-            if await self.uow.inbox.get_event(
-                idempotency_key=uuid.UUID(message.get("order_id"))
-            ):
-                return None
-            event_type = message.get("event_type")
-            if event_type == EventTypeEnum.ORDER_SHIPPED:
-                inbox_dto = InboxDTO(
-                    event_type=EventTypeEnum.ORDER_SHIPPED,
-                    status=InboxEventStatusEnum.PENDING,
-                    idempotency_key=uuid.UUID(message.get("order_id")),
-                    payload={
-                        "order_id": uuid.UUID(message.get("order_id")),
-                        "status": OrderStatusEnum.SHIPPED,
-                    },
-                )
-                outbox_dto = OutboxDTO(
-                    event_type=EventTypeEnum.ORDER_SHIPPED,
-                    status=OutboxEventStatusEnum.PENDING,
-                    payload=NotificationRequest(
-                        message="Order has been shipped",
-                        idempotency_key=str(uuid.uuid4()),
-                    ),
-                )
-            else:
-                inbox_dto = InboxDTO(
-                    event_type=EventTypeEnum.ORDER_CANCELLED,
-                    status=InboxEventStatusEnum.PENDING,
-                    idempotency_key=uuid.UUID(message.get("order_id")),
-                    payload={
-                        "order_id": uuid.UUID(message.get("order_id")),
-                        "status": OrderStatusEnum.CANCELLED,
-                    },
-                )
-                outbox_dto = OutboxDTO(
-                    event_type=EventTypeEnum.ORDER_CANCELLED,
-                    status=OutboxEventStatusEnum.PENDING,
-                    payload=NotificationRequest(
-                        message="Order has been cancelled",
-                        idempotency_key=str(uuid.uuid4()),
-                    ),
-                )
+    async def handle_many(self, messages: Sequence[BrokerMessageResponse]) -> list[int]:
+        """Store a batch of shipping responses in one transaction.
 
-            await self.uow.inbox.create(entity=inbox_dto)
-            await self.uow.outbox.create(entity=outbox_dto)
+        Only the first response per order counts, within the batch as across
+        batches; the notification of a response is only queued if its inbox
+        event is new. Malformed messages (not an object, or without a valid
+        ``order_id``) are skipped so they cannot hold up the rest; returns
+        their positions in ``messages``.
+        """
+        events: dict[uuid.UUID, tuple[InboxDTO, OutboxDTO]] = {}
+        invalid: list[int] = []
+        for position, message in enumerate(messages):
+            if not message:
+                continue
+            order_id = self._order_id(message)
+            if order_id is None:
+                invalid.append(position)
+            elif order_id not in events:
+                events[order_id] = self._events(message, order_id)
+        if not events:
+            return invalid
+
+        async with self.uow:
+            created = await self.uow.inbox.create_many(
+                entities=[inbox_dto for inbox_dto, _ in events.values()]
+            )
+            await self.uow.outbox.create_many(
+                entities=[
+                    outbox_dto
+                    for order_id, (_, outbox_dto) in events.items()
+                    if order_id in created
+                ]
+            )
             await self.uow.commit()
 
+        return invalid
+
+    @staticmethod
+    def _order_id(message: BrokerMessageResponse) -> uuid.UUID | None:
+        if not isinstance(message, dict):
+            return None
+        try:
+            return uuid.UUID(message.get("order_id"))
+        except (TypeError, ValueError, AttributeError):
             return None
+
+    @staticmethod
+    def _events(
+        message: BrokerMessageResponse, order_id: uuid.UUID
+    ) -> tuple[InboxDTO, OutboxDTO]:
+        if message.get("event_type") == EventTypeEnum.ORDER_SHIPPED:
+            event_type = EventTypeEnum.ORDER_SHIPPED
+            status = OrderStatusEnum.SHIPPED
+            notification = "Order has been shipped"
+        else:
+            event_type = EventTypeEnum.ORDER_CANCELLED
+            status = OrderStatusEnum.CANCELLED
+            notification = "Order has been cancelled"
+        inbox_dto = InboxDTO(
+            event_type=event_type,
+            status=InboxEventStatusEnum.PENDING,
+            idempotency_key=order_id,
+            payload={"order_id": str(order_id), "status": status},
+        )
+        outbox_dto = OutboxDTO(
+            event_type=event_type,
+            status=OutboxEventStatusEnum.PENDING,
+            payload=NotificationEvent(
+                order_id=str(order_id),
+                message=notification,
+                idempotency_key=str(uuid.uuid4()),
+            ),
+        )
+        return inbox_dto, outbox_dto
@@ -22,7 +22,7 @@ class UpdateOrderStatusUseCase:
                         status=OrderStatusEnum.PAID,
                     )
                     await self.uow.order_status.create(entity=order_status_dto)
-                    await self.uow.inbox.mark_as_processed(event_id=event.id)
+                    await self.uow.inbox.mark_as_processed(event_key=event.key)
                     await self.uow.commit()
 
                 if event.event_type == EventTypeEnum.ORDER_SHIPPED:
@@ -31,7 +31,7 @@ class UpdateOrderStatusUseCase:
                         status=OrderStatusEnum.SHIPPED,
                     )
                     await self.uow.order_status.create(entity=order_status_dto)
-                    await self.uow.inbox.mark_as_processed(event_id=event.id)
+                    await self.uow.inbox.mark_as_processed(event_key=event.key)
                     await self.uow.commit()
                 if event.event_type == EventTypeEnum.ORDER_CANCELLED:
                     order_status_dto = OrderStatusDTO(
@@ -39,6 +39,6 @@ class UpdateOrderStatusUseCase:
                         status=OrderStatusEnum.CANCELLED,
                     )
                     await self.uow.order_status.create(entity=order_status_dto)
-                    await self.uow.inbox.mark_as_processed(event_id=event.id)
+                    await self.uow.inbox.mark_as_processed(event_key=event.key)
                     await self.uow.commit()
             return None
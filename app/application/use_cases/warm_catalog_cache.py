@@ -0,0 +1,25 @@
+from app.application.interfaces import (CatalogServiceProtocol,
+                                        UnitOfWorkProtocol)
+
+
+class WarmCatalogCacheUseCase:
+    def __init__(
+        self,
+        uow: UnitOfWorkProtocol,
+        catalog_service: CatalogServiceProtocol,
+        top_n: int,
+    ):
+        self.uow = uow
+        self.catalog_service = catalog_service
+        self.top_n = top_n
+
+    async def __call__(self) -> int:
+        async with self.uow:
+            item_ids = await self.uow.orders.get_top_item_ids(limit=self.top_n)
+        if not item_ids:
+            return 0
+        # max_stock_age=0 skips the cached copy and reloads it from the catalog.
+        items = await self.catalog_service.get_items_stock(
+            item_ids=item_ids, max_stock_age=0
+        )
+        return sum(item is not None for item in items.values())
@@ -1,11 +1,15 @@
 from app.infrastructure.adapters.catalog import CatalogService
+from app.infrastructure.adapters.catalog_cache import CatalogCache
 from app.infrastructure.adapters.httpx_client import BaseHTTPXClient
 from app.infrastructure.adapters.notifications import NotificationsService
 from app.infrastructure.adapters.payments import PaymentsService
+from app.infrastructure.adapters.single_flight import SingleFlight
 
 __all__ = [
     "CatalogService",
+    "CatalogCache",
     "BaseHTTPXClient",
     "NotificationsService",
     "PaymentsService",
+    "SingleFlight",
 ]
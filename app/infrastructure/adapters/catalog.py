@@ -1,12 +1,15 @@
-from decimal import Decimal
-from typing import Any
+import asyncio
+from typing import Any, Iterable
 from uuid import UUID
 
-from adaptix import Retort, loader
+import httpx
 from fastapi import status
 
 from app.core.value_objects.item import Item
+from app.infrastructure.adapters.catalog_cache import CatalogCache
 from app.infrastructure.adapters.httpx_client import BaseHTTPXClient
+from app.infrastructure.adapters.item_decoder import decode_item
+from app.infrastructure.adapters.single_flight import SingleFlight
 from app.infrastructure.config.logging import get_logger
 from app.infrastructure.config.settings import Settings
 
@@ -14,26 +17,100 @@ logger = get_logger(__name__)
 
 
 class CatalogService:
-    def __init__(self, client: BaseHTTPXClient, settings: Settings):
+    """Catalog lookups served from ``CatalogCache`` where possible.
+
+    Concurrent misses for the same item share one request, and items the
+    Catalog service reported as missing are not asked for again while the
+    cache remembers them.
+    """
+
+    def __init__(
+        self, client: BaseHTTPXClient, settings: Settings, cache: CatalogCache
+    ):
         self.client = client
         self.base_url = settings.api_catalog_service
         self.access_token = settings.access_token
+        self.hedge_requests = settings.catalog_hedge_requests
+        self.batch_concurrency = settings.catalog_batch_concurrency
+        self.cache = cache
+        self.in_flight: SingleFlight[UUID, Item | None] = SingleFlight()
+
+    async def get_item(self, item_id: UUID) -> Item | None:
+        return await self._get_cached(item_id=item_id, max_age=self.cache.static_ttl)
+
+    async def get_item_stock(
+        self, item_id: UUID, max_stock_age: float | None = None
+    ) -> Item | None:
+        if max_stock_age is None:
+            max_stock_age = self.cache.stock_ttl
+        return await self._get_cached(item_id=item_id, max_age=max_stock_age)
+
+    async def get_items_stock(
+        self, item_ids: Iterable[UUID], max_stock_age: float | None = None
+    ) -> dict[UUID, Item | None]:
+        """Look up several items at once, keyed by id (``None`` if not found).
+
+        The Catalog service has no bulk endpoint, so misses are fetched with
+        at most ``batch_concurrency`` parallel requests per call. An item whose
+        lookup fails is left out of the result instead of failing the others.
+        """
+        unique_ids = list(dict.fromkeys(item_ids))
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def lookup(item_id: UUID) -> Item | None:
+            async with semaphore:
+                return await self.get_item_stock(
+                    item_id=item_id, max_stock_age=max_stock_age
+                )
 
-    async def get_item_stock(self, item_id: UUID) -> Item | None:
-        async with self.client as client:
-            response = await client.get(
-                url=f"{self.base_url}/{item_id}",
-                headers={"X-API-Key": self.access_token},
+        results = await asyncio.gather(
+            *(lookup(item_id) for item_id in unique_ids), return_exceptions=True
+        )
+        items: dict[UUID, Item | None] = {}
+        failures: dict[str, str] = {}
+        for item_id, result in zip(unique_ids, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                failures[str(item_id)] = str(result) or type(result).__name__
+            else:
+                items[item_id] = result
+        if failures:
+            logger.warning(
+                "Catalog batch lookup failed for some items",
+                failed=len(failures),
+                total=len(unique_ids),
+                errors=dict(list(failures.items())[:10]),
             )
-            if response.status_code != status.HTTP_200_OK:
-                return None
-            return self._to_value_object(response.json())
+        return items
 
-    def _to_value_object(self, data: dict[str, Any]) -> Item:
-        self._retort = Retort(
-            recipe=[
-                loader(Decimal, lambda x: Decimal(str(x))),
-                loader(UUID, lambda x: UUID(str(x))),
-            ]
+    async def _get_cached(self, item_id: UUID, max_age: float) -> Item | None:
+        if max_age > 0 and self.cache.is_missing(item_id):
+            return None
+        cached = await self.cache.get(item_id=item_id, max_age=max_age)
+        if cached is not None:
+            return cached.item
+        return await self.in_flight.do(
+            key=item_id, fn=lambda: self._load_item(item_id=item_id)
         )
-        return self._retort.load(data, Item)
+
+    async def _load_item(self, item_id: UUID) -> Item | None:
+        response = await self._fetch_item(item_id=item_id)
+        if response.status_code == status.HTTP_404_NOT_FOUND:
+            self.cache.set_missing(item_id)
+            return None
+        if response.status_code != status.HTTP_200_OK:
+            return None
+        item = self._to_value_object(response.json())
+        await self.cache.set(item=item)
+        return item
+
+    async def _fetch_item(self, item_id: UUID) -> httpx.Response:
+        return await self.client.get(
+            url=f"{self.base_url}/{item_id}",
+            headers={"X-API-Key": self.access_token},
+            hedge=self.hedge_requests,
+        )
+
+    def _to_value_object(self, data: dict[str, Any]) -> Item:
+        return decode_item(data)
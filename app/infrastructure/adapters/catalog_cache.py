@@ -0,0 +1,202 @@
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, Hashable, TypeVar
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.value_objects.item import Item
+from app.infrastructure.adapters.item_decoder import decode_item
+from app.infrastructure.config.logging import get_logger
+from app.infrastructure.config.settings import Settings
+
+logger = get_logger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True, slots=True)
+class CachedItem:
+    item: Item
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class LocalTTLCache(Generic[K, V]):
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.evictions = 0
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class CatalogCache:
+    """Two-tier cache of catalog items: in-process LRU in front of Redis.
+
+    Entries live for ``static_ttl`` (name and price rarely change); readers
+    pass the maximum age they accept, so stock-sensitive checks can ask for
+    an entry younger than ``stock_ttl`` or bypass the cache with ``0``.
+
+    Items the Catalog service reported as missing are remembered in the
+    in-process tier for ``negative_ttl`` seconds.
+    """
+
+    KEY_PREFIX = "catalog:item:"
+
+    def __init__(self, settings: Settings, redis: Redis | None = None):
+        self.static_ttl = settings.cache_ttl
+        self.stock_ttl = settings.catalog_stock_ttl
+        self.negative_ttl = settings.catalog_negative_ttl
+        self.redis = redis
+        self.local: LocalTTLCache[UUID, CachedItem] = LocalTTLCache(
+            max_size=settings.catalog_cache_max_size
+        )
+        self.missing: LocalTTLCache[UUID, bool] = LocalTTLCache(
+            max_size=settings.catalog_cache_max_size
+        )
+        self._hits_local = 0
+        self._hits_redis = 0
+        self._hits_negative = 0
+        self._misses = 0
+
+    async def get(self, item_id: UUID, max_age: float) -> CachedItem | None:
+        if max_age <= 0:
+            self._misses += 1
+            return None
+
+        cached = self.local.get(item_id)
+        if cached is not None and cached.age <= max_age:
+            self._hits_local += 1
+            return cached
+
+        cached = await self._redis_get(item_id)
+        if cached is not None and cached.age <= max_age:
+            self._hits_redis += 1
+            self.local.set(item_id, cached, ttl=self._local_ttl(cached))
+            return cached
+
+        self._misses += 1
+        return None
+
+    async def set(self, item: Item) -> CachedItem:
+        cached = CachedItem(item=item, fetched_at=time.time())
+        self.local.set(item.id, cached, ttl=self.static_ttl)
+        self.missing.delete(item.id)
+        await self._redis_set(cached)
+        return cached
+
+    def is_missing(self, item_id: UUID) -> bool:
+        if self.missing.get(item_id) is None:
+            return False
+        self._hits_negative += 1
+        return True
+
+    def set_missing(self, item_id: UUID) -> None:
+        if self.negative_ttl > 0:
+            self.missing.set(item_id, True, ttl=self.negative_ttl)
+
+    async def invalidate(self, item_id: UUID) -> None:
+        self.local.delete(item_id)
+        self.missing.delete(item_id)
+        if self.redis is None:
+            return
+        try:
+            await self.redis.delete(self._key(item_id))
+        except RedisError as e:
+            logger.warning("Catalog cache invalidation failed", error=str(e))
+
+    async def close(self) -> None:
+        self.local.clear()
+        self.missing.clear()
+        if self.redis is not None:
+            await self.redis.aclose()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self.local),
+            "hits_local": self._hits_local,
+            "hits_redis": self._hits_redis,
+            "hits_negative": self._hits_negative,
+            "misses": self._misses,
+            "evictions": self.local.evictions,
+        }
+
+    def _local_ttl(self, cached: CachedItem) -> float:
+        return max(0.0, self.static_ttl - cached.age)
+
+    def _key(self, item_id: UUID) -> str:
+        return f"{self.KEY_PREFIX}{item_id}"
+
+    async def _redis_get(self, item_id: UUID) -> CachedItem | None:
+        if self.redis is None:
+            return None
+        try:
+            raw = await self.redis.get(self._key(item_id))
+        except RedisError as e:
+            logger.warning("Catalog cache read failed", error=str(e))
+            return None
+        if raw is None:
+            return None
+        return self._decode(raw)
+
+    async def _redis_set(self, cached: CachedItem) -> None:
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(
+                self._key(cached.item.id),
+                self._encode(cached),
+                ex=self.static_ttl,
+            )
+        except RedisError as e:
+            logger.warning("Catalog cache write failed", error=str(e))
+
+    @staticmethod
+    def _encode(cached: CachedItem) -> str:
+        return json.dumps(
+            {
+                "id": str(cached.item.id),
+                "name": cached.item.name,
+                "price": str(cached.item.price),
+                "available_qty": cached.item.available_qty,
+                "fetched_at": cached.fetched_at,
+            }
+        )
+
+    @staticmethod
+    def _decode(raw: str | bytes) -> CachedItem:
+        data = json.loads(raw)
+        return CachedItem(item=decode_item(data), fetched_at=data["fetched_at"])
@@ -0,0 +1,48 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+# Absolute deadline on the time.monotonic() clock, set per incoming request.
+_request_deadline: ContextVar[float | None] = ContextVar(
+    "request_deadline", default=None
+)
+
+
+def get_deadline() -> float | None:
+    return _request_deadline.get()
+
+
+def resolve_deadline(
+    deadline: float | None = None, budget: float | None = None
+) -> float | None:
+    candidates = [
+        value
+        for value in (
+            _request_deadline.get(),
+            deadline,
+            time.monotonic() + budget if budget is not None else None,
+        )
+        if value is not None
+    ]
+    return min(candidates) if candidates else None
+
+
+def remaining(deadline: float | None) -> float | None:
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@contextmanager
+def deadline_scope(budget: float) -> Iterator[float]:
+    """Bound everything awaited inside the block by ``budget`` seconds.
+
+    Nested scopes can only shorten the deadline, never extend it.
+    """
+    deadline = resolve_deadline(budget=budget)
+    token = _request_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _request_deadline.reset(token)
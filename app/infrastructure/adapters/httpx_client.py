@@ -1,12 +1,21 @@
 import asyncio
 import random
+import time
+from collections import defaultdict
 from typing import Any, Self
 
 import httpx
 from fastapi import status
 
+from app.infrastructure.adapters.deadline import remaining, resolve_deadline
+from app.infrastructure.adapters.resilience import (CircuitBreaker,
+                                                    CircuitStateEnum,
+                                                    RetryBudget,
+                                                    RollingLatencyHistogram)
 from app.infrastructure.config.http_client import HTTPClientSettings
 from app.infrastructure.config.logging import get_logger
+from app.infrastructure.exceptions.http_exc import (CircuitOpenException,
+                                                    DeadlineExceededException)
 
 logger = get_logger(__name__)
 
@@ -15,6 +24,7 @@ class BaseHTTPXClient:
     RETRYABLE_STATUS_CODES = (
         status.HTTP_408_REQUEST_TIMEOUT,
         status.HTTP_500_INTERNAL_SERVER_ERROR,
+        status.HTTP_502_BAD_GATEWAY,
         status.HTTP_503_SERVICE_UNAVAILABLE,
         status.HTTP_504_GATEWAY_TIMEOUT,
     )
@@ -26,28 +36,210 @@ class BaseHTTPXClient:
         httpx.ReadTimeout,
     )
 
+    HEDGEABLE_METHODS = ("GET", "HEAD", "OPTIONS")
+
     def __init__(self, config: HTTPClientSettings):
         self.config = config
         self._client: httpx.AsyncClient | None = None
         self._base_delay = 1.0
+        self._requests_total: defaultdict[str, int] = defaultdict(int)
+        self._requests_in_flight: defaultdict[str, int] = defaultdict(int)
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        self._retry_budgets: dict[str, RetryBudget] = {}
+        self._latencies: dict[str, RollingLatencyHistogram] = {}
+        self._hedge_budgets: dict[str, RetryBudget] = {}
 
     async def __aenter__(self) -> Self:
-        timeout = httpx.Timeout(
-            read=self.config.timeout_read,
-            connect=5.0,
-            write=5.0,
-            pool=5.0,
-        )
-        self._client = httpx.AsyncClient(timeout=timeout)
+        await self.start()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         await self.close()
 
+    async def start(self) -> None:
+        if self._client is not None:
+            return
+        timeout = httpx.Timeout(
+            read=self.config.timeout_read,
+            connect=self.config.timeout_connect,
+            write=self.config.timeout_write,
+            pool=self.config.timeout_pool,
+        )
+        limits = httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
+        )
+        self._client = httpx.AsyncClient(timeout=timeout, limits=limits)
+        logger.info(
+            "HTTP connection pool opened",
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
+        )
+
     async def close(self) -> None:
         if self._client is not None:
             await self._client.aclose()
             self._client = None
+            logger.info("HTTP connection pool closed")
+
+    @property
+    def is_started(self) -> bool:
+        return self._client is not None
+
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        stats: dict[str, dict[str, int]] = {}
+        for host in self._requests_total.keys() | self._requests_in_flight.keys():
+            stats[host] = self._empty_host_stats(host)
+
+        for connection in self._pool_connections():
+            origin = getattr(connection, "_origin", None)
+            if origin is None:
+                continue
+            host = origin.host.decode("ascii")
+            host_stats = stats.setdefault(host, self._empty_host_stats(host))
+            host_stats["connections"] += 1
+            if connection.is_idle():
+                host_stats["idle_connections"] += 1
+            else:
+                host_stats["active_connections"] += 1
+        return stats
+
+    def _empty_host_stats(self, host: str) -> dict[str, int]:
+        return {
+            "connections": 0,
+            "active_connections": 0,
+            "idle_connections": 0,
+            "requests_total": self._requests_total.get(host, 0),
+            "requests_in_flight": self._requests_in_flight.get(host, 0),
+        }
+
+    def _pool_connections(self) -> list[Any]:
+        if self._client is None:
+            return []
+        # httpx does not expose its connection pool publicly, read it defensively
+        transport = getattr(self._client, "_transport", None)
+        pool = getattr(transport, "_pool", None)
+        return list(getattr(pool, "connections", []))
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            await self.start()
+        return self._client
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        json: dict[str, Any] | None = None,
+        deadline: float | None = None,
+    ) -> httpx.Response:
+        time_left = remaining(deadline)
+        if time_left is not None and time_left <= 0:
+            raise DeadlineExceededException(url=url)
+
+        client = await self._get_client()
+        host = httpx.URL(url).host
+        self._requests_total[host] += 1
+        self._requests_in_flight[host] += 1
+        started_at = time.monotonic()
+        try:
+            async with asyncio.timeout(time_left):
+                response = await client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    headers=headers,
+                    json=json,
+                    timeout=self._attempt_timeout(time_left),
+                )
+        except TimeoutError:
+            self._record_latency(host, started_at)
+            raise DeadlineExceededException(url=url) from None
+        except Exception:
+            # Failed and timed out attempts count too; otherwise a failing
+            # upstream would leave only its fastest answers in the histogram.
+            self._record_latency(host, started_at)
+            raise
+        finally:
+            self._requests_in_flight[host] -= 1
+        self._record_latency(host, started_at)
+        return response
+
+    def _record_latency(self, host: str, started_at: float) -> None:
+        self._get_latency_histogram(host).record(time.monotonic() - started_at)
+
+    def _attempt_timeout(self, time_left: float | None) -> httpx.Timeout:
+        def fit(value: float) -> float:
+            return value if time_left is None else min(value, time_left)
+
+        return httpx.Timeout(
+            read=fit(self.config.timeout_read),
+            connect=fit(self.config.timeout_connect),
+            write=fit(self.config.timeout_write),
+            pool=fit(self.config.timeout_pool),
+        )
+
+    async def _send_hedged(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        deadline: float | None = None,
+    ) -> httpx.Response:
+        host = httpx.URL(url).host
+        hedge_budget = self._get_hedge_budget(host)
+        hedge_budget.deposit()
+
+        def send() -> asyncio.Task[httpx.Response]:
+            return asyncio.create_task(
+                self._send(
+                    method=method,
+                    url=url,
+                    params=params,
+                    headers=headers,
+                    deadline=deadline,
+                )
+            )
+
+        primary = send()
+        tasks = {primary}
+        try:
+            delay = self._hedge_delay(host)
+            time_left = remaining(deadline)
+            if delay is None or (time_left is not None and time_left <= delay):
+                return await primary
+
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not hedge_budget.try_withdraw():
+                return await primary
+
+            logger.info("HTTP request hedged", method=method, url=url, delay=delay)
+            tasks.add(send())
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            return await primary
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _hedge_delay(self, host: str) -> float | None:
+        histogram = self._get_latency_histogram(host)
+        if len(histogram) < self.config.hedge_min_samples:
+            return None
+        delay = histogram.percentile(self.config.hedge_percentile)
+        return max(self.config.hedge_min_delay, delay)
 
     def _calculate_jitter_delay(self, attempt: int) -> float:
         exponential_delay = self._base_delay * (2**attempt)
@@ -64,9 +256,18 @@ class BaseHTTPXClient:
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         json: dict[str, Any] | None = None,
+        deadline: float | None = None,
+        budget: float | None = None,
+        hedge: bool = False,
     ) -> httpx.Response:
         last_exception = None
+        last_response = None
         total_attempts = self.config.max_retry + 1
+        upstream = httpx.URL(url).host
+        breaker = self._get_circuit_breaker(upstream)
+        retry_budget = self._get_retry_budget(upstream)
+        request_deadline = resolve_deadline(deadline=deadline, budget=budget)
+        hedge = hedge and method.upper() in self.HEDGEABLE_METHODS
 
         logger.info(
             "HTTP request initiated",
@@ -74,19 +275,55 @@ class BaseHTTPXClient:
             url=url,
         )
 
+        if not breaker.allow_request():
+            logger.warning(
+                "HTTP request rejected, circuit breaker is open",
+                method=method,
+                url=url,
+                upstream=upstream,
+            )
+            raise CircuitOpenException(upstream=upstream)
+        retry_budget.deposit()
+
         for attempt in range(total_attempts):
-            try:
-                response = await self._client.request(
-                    method=method, url=url, params=params, headers=headers, json=json
+            if attempt > 0 and not breaker.allow_request():
+                logger.warning(
+                    "HTTP request retry rejected, circuit breaker is open",
+                    method=method,
+                    url=url,
+                    upstream=upstream,
                 )
+                break
+            try:
+                if hedge:
+                    response = await self._send_hedged(
+                        method=method,
+                        url=url,
+                        params=params,
+                        headers=headers,
+                        deadline=request_deadline,
+                    )
+                else:
+                    response = await self._send(
+                        method=method,
+                        url=url,
+                        params=params,
+                        headers=headers,
+                        json=json,
+                        deadline=request_deadline,
+                    )
                 logger.info(
                     "Response data: ",
                     status_code=response.status_code,
                     content=response.content,
                 )
                 if response.status_code in self.RETRYABLE_STATUS_CODES:
-                    if attempt < self.config.max_retry:
-                        delay = self._calculate_jitter_delay(attempt)
+                    breaker.record_failure()
+                    last_response, last_exception = response, None
+                    delay = self._retry_delay(
+                        attempt, method, url, breaker, retry_budget, request_deadline
+                    )
+                    if delay is not None:
                         logger.warning(
                             "HTTP request received retryable status code, retrying",
                             method=method,
@@ -95,14 +332,19 @@ class BaseHTTPXClient:
                         )
                         await asyncio.sleep(delay)
                         continue
+                    return response
+                breaker.record_success()
                 return response
 
             except self.RETRYABLE_EXCEPTIONS as e:
-                last_exception = e
+                breaker.record_failure()
+                last_response, last_exception = None, e
                 exception_type = type(e).__name__
 
-                if attempt < self.config.max_retry:
-                    delay = self._calculate_jitter_delay(attempt)
+                delay = self._retry_delay(
+                    attempt, method, url, breaker, retry_budget, request_deadline
+                )
+                if delay is not None:
                     logger.warning(
                         "HTTP request failed with retryable exception, retrying",
                         method=method,
@@ -119,11 +361,13 @@ class BaseHTTPXClient:
                         url=url,
                         exception_type=exception_type,
                     )
+                    break
 
             except httpx.HTTPStatusError as e:
                 status_code = e.response.status_code if e.response else None
 
                 if status_code not in self.RETRYABLE_STATUS_CODES:
+                    breaker.record_success()
                     logger.error(
                         "HTTP request failed with non-retryable status code",
                         method=method,
@@ -132,9 +376,12 @@ class BaseHTTPXClient:
                     )
                     raise
 
-                last_exception = e
-                if attempt < self.config.max_retry:
-                    delay = self._calculate_jitter_delay(attempt)
+                breaker.record_failure()
+                last_response, last_exception = None, e
+                delay = self._retry_delay(
+                    attempt, method, url, breaker, retry_budget, request_deadline
+                )
+                if delay is not None:
                     logger.warning(
                         "HTTP request failed with retryable HTTP status error, retrying",
                         method=method,
@@ -150,6 +397,14 @@ class BaseHTTPXClient:
                         url=url,
                         status_code=status_code,
                     )
+                    break
+
+            except BaseException:
+                breaker.release()
+                raise
+
+        if last_response is not None:
+            return last_response
 
         if last_exception:
             logger.error(
@@ -167,15 +422,113 @@ class BaseHTTPXClient:
         )
         raise httpx.RequestError("Request failed after all retry attempts")
 
+    def _retry_delay(
+        self,
+        attempt: int,
+        method: str,
+        url: str,
+        breaker: CircuitBreaker,
+        retry_budget: RetryBudget,
+        deadline: float | None,
+    ) -> float | None:
+        if attempt >= self.config.max_retry:
+            return None
+        if breaker.state == CircuitStateEnum.OPEN:
+            logger.warning(
+                "HTTP request not retried, circuit breaker opened",
+                method=method,
+                url=url,
+                upstream=breaker.name,
+            )
+            return None
+        delay = self._calculate_jitter_delay(attempt)
+        time_left = remaining(deadline)
+        if time_left is not None and time_left <= delay:
+            logger.warning(
+                "HTTP request not retried, deadline would be exceeded",
+                method=method,
+                url=url,
+                time_left=time_left,
+            )
+            return None
+        if not retry_budget.try_withdraw():
+            logger.warning(
+                "HTTP request not retried, retry budget exhausted",
+                method=method,
+                url=url,
+                upstream=breaker.name,
+            )
+            return None
+        return delay
+
+    def _get_circuit_breaker(self, upstream: str) -> CircuitBreaker:
+        breaker = self._circuit_breakers.get(upstream)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name=upstream,
+                failure_rate_threshold=self.config.circuit_failure_rate_threshold,
+                window_seconds=self.config.circuit_window_seconds,
+                minimum_calls=self.config.circuit_minimum_calls,
+                open_seconds=self.config.circuit_open_seconds,
+                half_open_max_calls=self.config.circuit_half_open_max_calls,
+            )
+            self._circuit_breakers[upstream] = breaker
+        return breaker
+
+    def _get_retry_budget(self, upstream: str) -> RetryBudget:
+        retry_budget = self._retry_budgets.get(upstream)
+        if retry_budget is None:
+            retry_budget = RetryBudget(
+                ratio=self.config.retry_budget_ratio,
+                min_retries_per_second=self.config.retry_budget_min_per_second,
+                max_tokens=self.config.retry_budget_max_tokens,
+            )
+            self._retry_budgets[upstream] = retry_budget
+        return retry_budget
+
+    def _get_latency_histogram(self, upstream: str) -> RollingLatencyHistogram:
+        histogram = self._latencies.get(upstream)
+        if histogram is None:
+            histogram = RollingLatencyHistogram(
+                window_size=self.config.latency_window_size
+            )
+            self._latencies[upstream] = histogram
+        return histogram
+
+    def _get_hedge_budget(self, upstream: str) -> RetryBudget:
+        hedge_budget = self._hedge_budgets.get(upstream)
+        if hedge_budget is None:
+            hedge_budget = RetryBudget(
+                ratio=self.config.hedge_max_ratio,
+                min_retries_per_second=0.0,
+                max_tokens=self.config.retry_budget_max_tokens,
+            )
+            self._hedge_budgets[upstream] = hedge_budget
+        return hedge_budget
+
+    def circuit_states(self) -> dict[str, CircuitStateEnum]:
+        return {
+            upstream: breaker.state
+            for upstream, breaker in self._circuit_breakers.items()
+        }
+
     async def post(
         self,
         url: str,
         params: dict[str, Any] | None = None,
         headers: dict[str, Any] = None,
         json: dict[str, Any] | None = None,
+        deadline: float | None = None,
+        budget: float | None = None,
     ) -> httpx.Response:
         return await self.make_request(
-            method="POST", url=url, params=params, headers=headers, json=json
+            method="POST",
+            url=url,
+            params=params,
+            headers=headers,
+            json=json,
+            deadline=deadline,
+            budget=budget,
         )
 
     async def get(
@@ -183,7 +536,16 @@ class BaseHTTPXClient:
         url: str,
         params: dict[str, Any] | None = None,
         headers: dict[str, Any] | None = None,
+        deadline: float | None = None,
+        budget: float | None = None,
+        hedge: bool = False,
     ) -> httpx.Response:
         return await self.make_request(
-            method="GET", url=url, params=params, headers=headers
+            method="GET",
+            url=url,
+            params=params,
+            headers=headers,
+            deadline=deadline,
+            budget=budget,
+            hedge=hedge,
         )
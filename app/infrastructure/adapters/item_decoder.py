@@ -0,0 +1,18 @@
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import UUID
+
+from adaptix import Retort, loader
+
+from app.core.value_objects.item import Item
+
+# Built once per process: adaptix compiles the loader plan on first use, so
+# a Retort created per response would pay that cost for every catalog call.
+_retort = Retort(
+    recipe=[
+        loader(Decimal, lambda x: Decimal(str(x))),
+        loader(UUID, lambda x: UUID(str(x))),
+    ]
+)
+
+decode_item: Callable[[Any], Item] = _retort.get_loader(Item)
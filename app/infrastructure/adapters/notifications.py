@@ -3,6 +3,8 @@ from fastapi import status
 from app.infrastructure.adapters.contracts import NotificationRequest
 from app.infrastructure.adapters.httpx_client import BaseHTTPXClient
 from app.infrastructure.config.settings import Settings
+from app.infrastructure.exceptions.http_exc import (CircuitOpenException,
+                                                    DeadlineExceededException)
 
 
 class NotificationsService:
@@ -12,12 +14,14 @@ class NotificationsService:
         self.access_token = settings.access_token
 
     async def send_notification(self, payload: NotificationRequest) -> bool:
-        async with self.client as client:
-            response = await client.post(
+        try:
+            response = await self.client.post(
                 url=self.base_url,
                 headers={"X-API-Key": self.access_token},
                 json=payload,
             )
-            if response.status_code != status.HTTP_201_CREATED:
-                return False
-            return True
+        except (CircuitOpenException, DeadlineExceededException):
+            return False
+        if response.status_code != status.HTTP_201_CREATED:
+            return False
+        return True
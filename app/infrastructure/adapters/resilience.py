@@ -0,0 +1,194 @@
+import time
+from collections import deque
+from enum import StrEnum
+
+
+class CircuitStateEnum(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker shared by every caller of one upstream.
+
+    Outcomes are kept in a sliding time window. When the window holds at least
+    ``minimum_calls`` outcomes and the failure rate reaches the threshold the
+    circuit opens and requests are rejected without touching the network.
+    After ``open_seconds`` a limited number of trial requests is let through;
+    if they all succeed the circuit closes again, any failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float,
+        window_seconds: float,
+        minimum_calls: int,
+        open_seconds: float,
+        half_open_max_calls: int,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.window_seconds = window_seconds
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._failures = 0
+        self._state = CircuitStateEnum.CLOSED
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+
+    @property
+    def state(self) -> CircuitStateEnum:
+        if (
+            self._state == CircuitStateEnum.OPEN
+            and time.monotonic() - self._opened_at >= self.open_seconds
+        ):
+            self._transition(CircuitStateEnum.HALF_OPEN)
+        return self._state
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state == CircuitStateEnum.CLOSED:
+            return True
+        if state == CircuitStateEnum.OPEN:
+            return False
+        if self._half_open_in_flight >= self.half_open_max_calls:
+            return False
+        self._half_open_in_flight += 1
+        return True
+
+    def record_success(self) -> None:
+        if self._state == CircuitStateEnum.HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+            self._half_open_successes += 1
+            if self._half_open_successes >= self.half_open_max_calls:
+                self._transition(CircuitStateEnum.CLOSED)
+            return
+        self._add_outcome(failed=False)
+
+    def record_failure(self) -> None:
+        if self._state == CircuitStateEnum.HALF_OPEN:
+            self._transition(CircuitStateEnum.OPEN)
+            return
+        self._add_outcome(failed=True)
+        if self._state == CircuitStateEnum.CLOSED and self._should_open():
+            self._transition(CircuitStateEnum.OPEN)
+
+    def release(self) -> None:
+        """Give back a half-open permit of a call that ended without an outcome."""
+        if self._state == CircuitStateEnum.HALF_OPEN:
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def failure_rate(self) -> float:
+        self._evict_expired()
+        if not self._outcomes:
+            return 0.0
+        return self._failures / len(self._outcomes)
+
+    def _should_open(self) -> bool:
+        if len(self._outcomes) < self.minimum_calls:
+            return False
+        return self.failure_rate() >= self.failure_rate_threshold
+
+    def _add_outcome(self, failed: bool) -> None:
+        self._outcomes.append((time.monotonic(), failed))
+        if failed:
+            self._failures += 1
+        self._evict_expired()
+
+    def _evict_expired(self) -> None:
+        threshold = time.monotonic() - self.window_seconds
+        while self._outcomes and self._outcomes[0][0] < threshold:
+            _, failed = self._outcomes.popleft()
+            if failed:
+                self._failures -= 1
+
+    def _transition(self, state: CircuitStateEnum) -> None:
+        self._state = state
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        if state == CircuitStateEnum.OPEN:
+            self._opened_at = time.monotonic()
+        if state == CircuitStateEnum.CLOSED:
+            self._outcomes.clear()
+            self._failures = 0
+
+
+class RetryBudget:
+    """Token bucket that caps retries to a fraction of live traffic.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws a
+    whole token, so in steady state at most ``ratio`` retries are sent per
+    request. ``min_retries_per_second`` keeps a small trickle of retries
+    available for low-traffic upstreams.
+    """
+
+    def __init__(
+        self,
+        ratio: float,
+        min_retries_per_second: float,
+        max_tokens: float,
+    ):
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated_at = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def deposit(self) -> None:
+        self._refill()
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        self._refill()
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(
+            self.max_tokens, self._tokens + elapsed * self.min_retries_per_second
+        )
+
+
+class RollingLatencyHistogram:
+    """Latency samples of the most recent requests to one upstream.
+
+    Percentiles are recomputed lazily once enough new samples arrived, so
+    reading them on the hot path does not sort the window every time.
+    """
+
+    def __init__(self, window_size: int, recompute_every: int = 50):
+        self._samples: deque[float] = deque(maxlen=window_size)
+        self._recompute_every = recompute_every
+        self._since_recompute = 0
+        self._sorted: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self._since_recompute += 1
+
+    def percentile(self, percent: float) -> float | None:
+        if not self._samples:
+            return None
+        if not self._sorted or self._since_recompute >= self._recompute_every:
+            self._sorted = sorted(self._samples)
+            self._since_recompute = 0
+        index = min(len(self._sorted) - 1, int(len(self._sorted) * percent / 100))
+        return self._sorted[index]
@@ -1,5 +1,6 @@
+import asyncio
 import json
-from typing import Optional
+from typing import Any, Optional
 
 from aiokafka import AIOKafkaConsumer
 from aiokafka.structs import ConsumerRecord
@@ -18,6 +19,7 @@ class KafkaConsumer:
         self._started = False
         self.consumer_group_id = "order-service-group"
         self.use_case = use_case
+        self._stopping = asyncio.Event()
 
     async def start(self) -> None:
         if self._started:
@@ -27,13 +29,25 @@ class KafkaConsumer:
             self.config.default_topic,
             bootstrap_servers=self.config.bootstrap_server,
             group_id=self.consumer_group_id,
-            value_deserializer=lambda m: json.loads(m.decode("utf-8")) if m else None,
+            value_deserializer=self._deserialize_value,
             key_deserializer=lambda k: k.decode("utf-8") if k else None,
             auto_offset_reset="earliest",
+            enable_auto_commit=False,
         )
         await self._consumer.start()
         self._started = True
 
+    @staticmethod
+    def _deserialize_value(value: bytes | None) -> Any:
+        # A message that is not JSON would otherwise fail every fetch of its
+        # partition; it reaches the use case as an invalid message instead.
+        if not value:
+            return None
+        try:
+            return json.loads(value.decode("utf-8"))
+        except ValueError:
+            return value
+
     async def stop(self) -> None:
         if not self._started or self._consumer is None:
             return
@@ -42,24 +56,80 @@ class KafkaConsumer:
         self._started = False
         self._consumer = None
 
+    async def run(self) -> None:
+        await self.start()
+        await self.consume_message()
+
+    def shutdown(self) -> None:
+        """Stop consuming once the batch being processed is committed."""
+        self._stopping.set()
+
     async def consume_message(self) -> Optional[ConsumerRecord]:
+        """Store messages a batch at a time, committing offsets per batch.
+
+        A batch is written in one transaction; if that fails, nothing of it
+        is committed and the consumer stops, so the batch is redelivered.
+        Malformed messages are logged and skipped, and committed with the
+        rest of their batch.
+        """
         if not self._started or self._consumer is None:
             raise RuntimeError("Consumer is not started. Call start() first.")
 
         try:
-            async for message in self._consumer:
+            while (messages := await self._next_batch()) is not None:
+                if not messages:
+                    continue
                 try:
                     logger.info(
-                        "Process message",
-                        partition=message.partition,
-                        data=message.value,
+                        "Process messages",
+                        messages=len(messages),
+                        partitions=sorted({m.partition for m in messages}),
+                    )
+                    invalid = await self.use_case.handle_many(
+                        messages=[message.value for message in messages]
                     )
-                    await self.use_case(message=message.value)
+                    for position in invalid:
+                        logger.warning(
+                            "Skipping malformed message",
+                            partition=messages[position].partition,
+                            offset=messages[position].offset,
+                            value=repr(messages[position].value)[:200],
+                        )
                     await self._consumer.commit()
                 except Exception as e:
                     logger.error(
-                        "Failed to process message", data=message.value, error=str(e)
+                        "Failed to process messages",
+                        messages=len(messages),
+                        offsets={m.partition: m.offset for m in messages},
+                        error=str(e),
                     )
                     raise
         finally:
-            await self._consumer.stop()
+            await self.stop()
+
+    async def _next_batch(self) -> list[ConsumerRecord] | None:
+        """The next batch of messages, or ``None`` once ``shutdown`` was called.
+
+        Waits up to ``consumer_max_wait_ms`` for messages, so the batch may be
+        empty.
+        """
+        if self._stopping.is_set():
+            return None
+        getmany = asyncio.ensure_future(
+            self._consumer.getmany(
+                timeout_ms=self.config.consumer_max_wait_ms,
+                max_records=self.config.consumer_batch_size,
+            )
+        )
+        stopping = asyncio.ensure_future(self._stopping.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {getmany, stopping}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            stopping.cancel()
+            if not getmany.done():
+                getmany.cancel()
+        if getmany not in done:
+            return None
+        return [message for records in getmany.result().values() for message in records]
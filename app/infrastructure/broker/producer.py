@@ -1,43 +1,93 @@
+import asyncio
 import json
-from typing import Self
+from typing import Any, Awaitable, Callable, NoReturn, Self, Sequence
 
 from aiokafka import AIOKafkaProducer
-from aiokafka.errors import KafkaError
+from aiokafka.errors import KafkaError, MessageSizeTooLargeError
+from aiokafka.partitioner import DefaultPartitioner
+from aiokafka.producer.message_accumulator import BatchBuilder
 
 from app.application.interfaces.contracts import BrokerMessageRequest
-from app.infrastructure.config.kafka_config import KafkaConfig
+from app.infrastructure.config.kafka_config import (KafkaConfig,
+                                                    KafkaSerializerEnum)
 from app.infrastructure.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def make_serializer(serializer: KafkaSerializerEnum) -> Callable[[Any], bytes]:
+    if serializer is KafkaSerializerEnum.ORJSON:
+        try:
+            import orjson
+        except ImportError as e:
+            raise RuntimeError(
+                "KAFKA_SERIALIZER=orjson requires the orjson package (kafka-fast extra)"
+            ) from e
+        return orjson.dumps
+    return lambda value: json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
 class KafkaProducer:
+    """Long-lived Kafka producer shared by everything in the container.
+
+    ``start`` is cheap once the producer runs, so callers invoke it before
+    each batch; it only (re)connects on first use or after a send failed
+    with a retriable error, which is taken as a sign that the connection is
+    broken. Batching, compression and acknowledgements come from
+    ``KafkaConfig``.
+    """
+
     def __init__(self, config: KafkaConfig):
         self.config = config
+        self._serialize = make_serializer(config.serializer)
+        self._partitioner = DefaultPartitioner()
         self._producer: AIOKafkaProducer | None = None
         self._started = False
+        self._healthy = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_healthy(self) -> bool:
+        return self._started and self._healthy
 
     async def start(self) -> None:
-        if self._started:
-            return
+        async with self._lock:
+            if self.is_healthy:
+                return
+            if self._started:
+                logger.warning("Restarting Kafka producer after a failed send")
+                await self._stop()
+            await self._start()
+
+    async def stop(self) -> None:
+        async with self._lock:
+            await self._stop()
 
+    async def _start(self) -> None:
         self._producer = AIOKafkaProducer(
             bootstrap_servers=self.config.bootstrap_server,
-            enable_idempotence=True,
-            acks=1,
-            value_serializer=lambda v: json.dumps(v).encode("utf-8"),
+            enable_idempotence=self.config.enable_idempotence,
+            acks=self.config.producer_acks,
+            linger_ms=self.config.linger_ms,
+            max_batch_size=self.config.max_batch_size,
+            compression_type=self.config.producer_compression,
+            value_serializer=self._serialize,
             key_serializer=lambda k: k.encode("utf-8") if k is not None else None,
         )
         await self._producer.start()
         self._started = True
+        self._healthy = True
 
-    async def stop(self) -> None:
+    async def _stop(self) -> None:
         if not self._started or self._producer is None:
             return
 
-        await self._producer.stop()
-        self._started = False
-        self._producer = None
+        try:
+            await self._producer.stop()
+        finally:
+            self._started = False
+            self._healthy = False
+            self._producer = None
 
     async def publish_message(
         self,
@@ -45,21 +95,173 @@ class KafkaProducer:
         key: str | None = None,
         topic: str | None = None,
     ) -> None:
+        delivery = await self.send_message(message=message, key=key, topic=topic)
+        await delivery
+
+    async def send_message(
+        self,
+        message: BrokerMessageRequest,
+        key: str | None = None,
+        topic: str | None = None,
+    ) -> Awaitable[None]:
+        """Queue ``message`` and return an awaitable for its delivery.
+
+        Queueing only waits for room in the producer's buffer, so a caller
+        can put a whole batch in flight before awaiting any delivery. See
+        ``route`` for the defaults of ``key`` and ``topic``.
+        """
         if not self._started or self._producer is None:
             raise RuntimeError("Producer is not started. Call start() first.")
 
-        target_topic = self.config.default_topic
+        target_topic, key = self.route(message, key=key, topic=topic)
 
         try:
-            logger.info("Push message: ", data=message)
-            await self._producer.send_and_wait(
+            logger.info("Push message: ", topic=target_topic, key=key, data=message)
+            delivery = await self._producer.send(
                 topic=target_topic,
                 value=message,
                 key=key,
             )
         except KafkaError as e:
-            logger.error("Failed to publish message to Kafka: ", error=str(e))
-            raise RuntimeError(f"Failed to publish message to Kafka: {e}") from e
+            self._failed(e)
+        return asyncio.ensure_future(self._delivered(delivery))
+
+    def route(
+        self,
+        message: BrokerMessageRequest,
+        key: str | None = None,
+        topic: str | None = None,
+    ) -> tuple[str, str | None]:
+        """Topic and key for ``message`` unless the caller chose them.
+
+        The topic comes from ``KAFKA_TOPICS`` for the message's event type,
+        falling back to ``KAFKA_TOPIC``. The key defaults to the order id, so
+        all events of an order land on one partition and stay in order.
+        """
+        if topic is None:
+            topic = self.config.topic_for(message.get("event_type"))
+        if key is None and message.get("order_id") is not None:
+            key = str(message["order_id"])
+        return topic, key
+
+    async def publish_many(
+        self, messages: Sequence[BrokerMessageRequest]
+    ) -> list[Exception | None]:
+        """Publish ``messages`` in as few produce requests as possible.
+
+        Messages are routed like ``send_message``, grouped by partition and
+        packed into batches of up to ``max_batch_size`` bytes, each sent as
+        one (compressed) request; the batches of a partition go out in
+        message order. Returns one entry per message: ``None`` once it is
+        delivered, or the error that failed it.
+        """
+        if not self._started or self._producer is None:
+            raise RuntimeError("Producer is not started. Call start() first.")
+
+        routes = [self.route(message) for message in messages]
+        outcomes: list[Exception | None] = [None] * len(messages)
+        deliveries: list[tuple[list[int], asyncio.Future]] = []
+        try:
+            by_partition = await self._group_by_partition(routes)
+            for (topic, partition), indexes in by_partition.items():
+                for batch, batched in self._build_batches(
+                    messages, routes, indexes, outcomes
+                ):
+                    delivery = await self._producer.send_batch(
+                        batch, topic, partition=partition
+                    )
+                    deliveries.append((batched, delivery))
+        except KafkaError as e:
+            error = self._error(e)
+            queued = {index for batched, _ in deliveries for index in batched}
+            for index in range(len(messages)):
+                if index not in queued and outcomes[index] is None:
+                    outcomes[index] = error
+        results = await asyncio.gather(
+            *(delivery for _, delivery in deliveries), return_exceptions=True
+        )
+        for (batched, _), result in zip(deliveries, results):
+            if isinstance(result, KafkaError):
+                result = self._error(result)
+            if isinstance(result, Exception):
+                for index in batched:
+                    outcomes[index] = result
+        logger.info(
+            "Published message batch",
+            topics=sorted({topic for topic, _ in routes}),
+            messages=len(messages),
+            requests=len(deliveries),
+            failed=sum(outcome is not None for outcome in outcomes),
+        )
+        return outcomes
+
+    async def _group_by_partition(
+        self, routes: Sequence[tuple[str, str | None]]
+    ) -> dict[tuple[str, int], list[int]]:
+        """Message indexes per (topic, partition), in message order.
+
+        Keyed messages are hashed the way ``AIOKafkaProducer.send`` does it,
+        so ``publish_many`` and ``send_message`` agree on an order's
+        partition. Unkeyed messages stick to one partition per topic so they
+        share batches.
+        """
+        partitions: dict[str, list[int]] = {}
+        sticky: dict[str, int] = {}
+        groups: dict[tuple[str, int], list[int]] = {}
+        for index, (topic, key) in enumerate(routes):
+            if topic not in partitions:
+                partitions[topic] = sorted(await self._producer.partitions_for(topic))
+            available = partitions[topic]
+            if key is None:
+                if topic not in sticky:
+                    sticky[topic] = self._partitioner(None, available, available)
+                partition = sticky[topic]
+            else:
+                partition = self._partitioner(key.encode("utf-8"), available, available)
+            groups.setdefault((topic, partition), []).append(index)
+        return groups
+
+    def _build_batches(
+        self,
+        messages: Sequence[BrokerMessageRequest],
+        routes: Sequence[tuple[str, str | None]],
+        indexes: list[int],
+        outcomes: list[Exception | None],
+    ) -> list[tuple[BatchBuilder, list[int]]]:
+        batches = []
+        position = 0
+        while position < len(indexes):
+            batch = self._producer.create_batch()
+            batched = []
+            for index in indexes[position:]:
+                _, key = routes[index]
+                if batch.append(key=key, value=messages[index], timestamp=None) is None:
+                    break
+                batched.append(index)
+            if not batched:
+                # Too large even for an empty batch.
+                outcomes[indexes[position]] = self._error(MessageSizeTooLargeError())
+                position += 1
+                continue
+            batch.close()
+            batches.append((batch, batched))
+            position += len(batched)
+        return batches
+
+    async def _delivered(self, delivery: Awaitable) -> None:
+        try:
+            await delivery
+        except KafkaError as e:
+            self._failed(e)
+
+    def _failed(self, error: KafkaError) -> NoReturn:
+        raise self._error(error) from error
+
+    def _error(self, error: KafkaError) -> RuntimeError:
+        if error.retriable:
+            self._healthy = False
+        logger.error("Failed to publish message to Kafka: ", error=str(error))
+        return RuntimeError(f"Failed to publish message to Kafka: {error}")
 
     async def __aenter__(self) -> Self:
         await self.start()
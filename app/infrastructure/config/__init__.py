@@ -2,5 +2,12 @@ from app.infrastructure.config.database import Database
 from app.infrastructure.config.http_client import HTTPClientSettings
 from app.infrastructure.config.kafka_config import KafkaConfig
 from app.infrastructure.config.settings import Settings
+from app.infrastructure.config.workers import WorkerSettings
 
-__all__ = ["Database", "KafkaConfig", "Settings", "HTTPClientSettings"]
+__all__ = [
+    "Database",
+    "KafkaConfig",
+    "Settings",
+    "HTTPClientSettings",
+    "WorkerSettings",
+]
@@ -2,12 +2,18 @@ from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import (AsyncSession, async_sessionmaker,
-                                    create_async_engine)
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    async_sessionmaker, create_async_engine)
 
 
 class Database:
-    def __init__(self, url: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30,
+    ) -> None:
         if url.startswith("postgres://"):
             url = url.replace("postgres://", "postgresql+psycopg://", 1)
         elif url.startswith("postgresql+asyncpg://"):
@@ -15,6 +21,9 @@ class Database:
         self._async_engine = create_async_engine(
             url=url,
             pool_pre_ping=False,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
             echo=True,
         )
         self._async_session = async_sessionmaker(
@@ -22,6 +31,10 @@ class Database:
             expire_on_commit=False,
         )
 
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._async_engine
+
     def create_session(self) -> AsyncSession:
         return self._async_session()
 
@@ -6,5 +6,123 @@ class HTTPClientSettings(BaseSettings):
     timeout_read: float = Field(
         default=30.0, description="Read timeout in seconds", gt=0
     )
+    timeout_connect: float = Field(
+        default=5.0, description="Connect timeout in seconds", gt=0
+    )
+    timeout_write: float = Field(
+        default=5.0, description="Write timeout in seconds", gt=0
+    )
+    timeout_pool: float = Field(
+        default=5.0,
+        description="Seconds to wait for a free connection from the pool",
+        gt=0,
+    )
     max_delay: int = Field(default=5, description="")
     max_retry: int = Field(default=5, description="")
+
+    # Connection pool settings
+    max_connections: int = Field(
+        default=100,
+        alias="HTTP_MAX_CONNECTIONS",
+        description="Maximum number of concurrent connections across all hosts",
+        gt=0,
+    )
+    max_keepalive_connections: int = Field(
+        default=20,
+        alias="HTTP_MAX_KEEPALIVE_CONNECTIONS",
+        description="Maximum number of idle connections kept open for reuse",
+        ge=0,
+    )
+    keepalive_expiry: float = Field(
+        default=30.0,
+        alias="HTTP_KEEPALIVE_EXPIRY",
+        description="Seconds an idle keep-alive connection stays in the pool",
+        ge=0,
+    )
+
+    # Circuit breaker settings (one breaker per upstream host)
+    circuit_failure_rate_threshold: float = Field(
+        default=0.5,
+        alias="HTTP_CIRCUIT_FAILURE_RATE_THRESHOLD",
+        description="Failure rate within the window that opens the circuit",
+        gt=0,
+        le=1,
+    )
+    circuit_window_seconds: float = Field(
+        default=30.0,
+        alias="HTTP_CIRCUIT_WINDOW_SECONDS",
+        description="Length of the sliding window the failure rate is computed on",
+        gt=0,
+    )
+    circuit_minimum_calls: int = Field(
+        default=20,
+        alias="HTTP_CIRCUIT_MINIMUM_CALLS",
+        description="Calls required in the window before the circuit may open",
+        gt=0,
+    )
+    circuit_open_seconds: float = Field(
+        default=15.0,
+        alias="HTTP_CIRCUIT_OPEN_SECONDS",
+        description="Seconds the circuit stays open before trial requests",
+        gt=0,
+    )
+    circuit_half_open_max_calls: int = Field(
+        default=3,
+        alias="HTTP_CIRCUIT_HALF_OPEN_MAX_CALLS",
+        description="Trial requests allowed while the circuit is half-open",
+        gt=0,
+    )
+
+    # Retry budget settings (one token bucket per upstream host)
+    retry_budget_ratio: float = Field(
+        default=0.2,
+        alias="HTTP_RETRY_BUDGET_RATIO",
+        description="Retries allowed per request, as a fraction of live traffic",
+        ge=0,
+    )
+    retry_budget_min_per_second: float = Field(
+        default=1.0,
+        alias="HTTP_RETRY_BUDGET_MIN_PER_SECOND",
+        description="Retries per second always allowed regardless of traffic",
+        ge=0,
+    )
+    retry_budget_max_tokens: float = Field(
+        default=10.0,
+        alias="HTTP_RETRY_BUDGET_MAX_TOKENS",
+        description="Maximum number of retries that can be saved up",
+        gt=0,
+    )
+
+    # Hedged requests settings (opt-in per call, idempotent methods only)
+    hedge_percentile: float = Field(
+        default=95.0,
+        alias="HTTP_HEDGE_PERCENTILE",
+        description="Latency percentile after which a hedge request is fired",
+        gt=0,
+        lt=100,
+    )
+    hedge_min_delay: float = Field(
+        default=0.01,
+        alias="HTTP_HEDGE_MIN_DELAY",
+        description="Lower bound of the hedge delay in seconds",
+        ge=0,
+    )
+    hedge_max_ratio: float = Field(
+        default=0.1,
+        alias="HTTP_HEDGE_MAX_RATIO",
+        description="Maximum share of requests that may be hedged",
+        ge=0,
+        le=1,
+    )
+    hedge_min_samples: int = Field(
+        default=50,
+        alias="HTTP_HEDGE_MIN_SAMPLES",
+        description="Latency samples required before hedging starts",
+        gt=0,
+    )
+    latency_window_size: int = Field(
+        default=1000,
+        alias="HTTP_LATENCY_WINDOW_SIZE",
+        description="Number of recent requests kept per upstream for percentiles",
+        gt=0,
+    )
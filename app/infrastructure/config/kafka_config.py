@@ -1,5 +1,27 @@
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from enum import StrEnum
+from typing import Annotated, Any, Self
+
+from pydantic import Field, field_validator, model_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+
+
+class KafkaAcksEnum(StrEnum):
+    NONE = "0"
+    LEADER = "1"
+    ALL = "all"
+
+
+class KafkaCompressionEnum(StrEnum):
+    NONE = "none"
+    GZIP = "gzip"
+    SNAPPY = "snappy"
+    LZ4 = "lz4"
+    ZSTD = "zstd"
+
+
+class KafkaSerializerEnum(StrEnum):
+    JSON = "json"
+    ORJSON = "orjson"
 
 
 class KafkaConfig(BaseSettings):
@@ -13,3 +35,92 @@ class KafkaConfig(BaseSettings):
     default_topic: str = Field(
         default="student_system_order.events", alias="KAFKA_TOPIC"
     )
+    topics: Annotated[dict[str, str], NoDecode] = Field(
+        default_factory=dict,
+        alias="KAFKA_TOPICS",
+        description="Topic per event type as event_type=topic pairs; others go to KAFKA_TOPIC",
+    )
+
+    # Producer batching: messages for a partition are collected for up to
+    # linger_ms and sent together, up to max_batch_size bytes per request
+    acks: KafkaAcksEnum = Field(
+        default=KafkaAcksEnum.ALL,
+        alias="KAFKA_ACKS",
+        description="Replicas that must confirm a write: 0, 1 or all",
+    )
+    enable_idempotence: bool = Field(
+        default=True,
+        alias="KAFKA_ENABLE_IDEMPOTENCE",
+        description="Avoid duplicates and reordering on producer retries; needs acks=all",
+    )
+    linger_ms: int = Field(
+        default=5,
+        alias="KAFKA_LINGER_MS",
+        description="Milliseconds the producer waits to fill a batch before sending it",
+        ge=0,
+    )
+    max_batch_size: int = Field(
+        default=65536,
+        alias="KAFKA_MAX_BATCH_BYTES",
+        description="Upper bound in bytes for one batch of messages to a partition",
+        gt=0,
+    )
+    compression_type: KafkaCompressionEnum = Field(
+        default=KafkaCompressionEnum.NONE,
+        alias="KAFKA_COMPRESSION",
+        description="Batch compression codec; lz4, zstd and snappy need the kafka-fast extra",
+    )
+    serializer: KafkaSerializerEnum = Field(
+        default=KafkaSerializerEnum.JSON,
+        alias="KAFKA_SERIALIZER",
+        description="JSON encoder for message values: json (stdlib) or orjson",
+    )
+
+    # Consumer batching: up to consumer_batch_size messages are stored in one
+    # transaction and their offsets committed together
+    consumer_batch_size: int = Field(
+        default=100,
+        alias="KAFKA_CONSUMER_BATCH_SIZE",
+        description="Most messages the consumer handles per transaction",
+        gt=0,
+    )
+    consumer_max_wait_ms: int = Field(
+        default=500,
+        alias="KAFKA_CONSUMER_MAX_WAIT_MS",
+        description="Milliseconds the consumer waits for messages when none are buffered",
+        gt=0,
+    )
+
+    def topic_for(self, event_type: str | None) -> str:
+        return self.topics.get(event_type, self.default_topic)
+
+    @property
+    def producer_acks(self) -> int | str:
+        return "all" if self.acks is KafkaAcksEnum.ALL else int(self.acks)
+
+    @property
+    def producer_compression(self) -> str | None:
+        if self.compression_type is KafkaCompressionEnum.NONE:
+            return None
+        return self.compression_type.value
+
+    @field_validator("topics", mode="before")
+    @classmethod
+    def parse_topics(cls, value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        pairs = (pair.partition("=") for pair in value.split(",") if pair.strip())
+        return {event_type.strip(): topic.strip() for event_type, _, topic in pairs}
+
+    @field_validator("topics", mode="after")
+    @classmethod
+    def check_topics(cls, value: dict[str, str]) -> dict[str, str]:
+        if not all(value.values()):
+            raise ValueError("KAFKA_TOPICS needs a topic for every event type")
+        return value
+
+    @model_validator(mode="after")
+    def check_idempotence_acks(self) -> Self:
+        if self.enable_idempotence and self.acks is not KafkaAcksEnum.ALL:
+            raise ValueError("KAFKA_ENABLE_IDEMPOTENCE requires KAFKA_ACKS=all")
+        return self
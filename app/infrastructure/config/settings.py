@@ -26,6 +26,42 @@ class Settings(BaseSettings):
     redis_port: int = Field(default=6379, alias="REDIS_PORT")
     redis_db: int = Field(default=1, alias="REDIS_DB")
     cache_ttl: int = Field(default=3600)
+    catalog_stock_ttl: float = Field(
+        default=5.0,
+        alias="CATALOG_STOCK_TTL",
+        description="Maximum age in seconds of a cached item used for stock checks",
+        ge=0,
+    )
+    catalog_batch_concurrency: int = Field(
+        default=10,
+        alias="CATALOG_BATCH_CONCURRENCY",
+        description="Maximum parallel Catalog service requests of one batch lookup",
+        gt=0,
+    )
+    catalog_negative_ttl: float = Field(
+        default=30.0,
+        alias="CATALOG_NEGATIVE_TTL",
+        description="Seconds a 'not found' answer from the Catalog service is cached",
+        ge=0,
+    )
+    catalog_warmup_top_n: int = Field(
+        default=500,
+        alias="CATALOG_WARMUP_TOP_N",
+        description="Number of most-ordered items the warmup worker keeps cached",
+        gt=0,
+    )
+    catalog_warmup_interval: float = Field(
+        default=300.0,
+        alias="CATALOG_WARMUP_INTERVAL",
+        description="Seconds between catalog cache warmup runs",
+        gt=0,
+    )
+    catalog_cache_max_size: int = Field(
+        default=10_000,
+        alias="CATALOG_CACHE_MAX_SIZE",
+        description="Maximum number of items kept in the in-process catalog cache",
+        gt=0,
+    )
     decode_responses: bool = Field(default=True)
 
     # Database connection pool settings
@@ -36,6 +72,12 @@ class Settings(BaseSettings):
 
     # Application settings
     app_port: int = Field(default=8000, alias="APP_PORT")
+    request_deadline: float = Field(
+        default=10.0,
+        alias="REQUEST_DEADLINE_SECONDS",
+        description="End-to-end time budget for outgoing calls of one API request",
+        gt=0,
+    )
 
     # Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
@@ -43,6 +85,7 @@ class Settings(BaseSettings):
 
     # Catalog service settings
     api_catalog_service: str = Field(default="", alias="CATALOG_SERVICE_API_URL")
+    catalog_hedge_requests: bool = Field(default=False, alias="CATALOG_HEDGE_REQUESTS")
 
     # Payments service settings
     api_payments_service: str = Field(default="", alias="PAYMENTS_SERVICE_API_URL")
@@ -55,3 +98,10 @@ class Settings(BaseSettings):
 
     # Capashino credentials
     access_token: str = Field(default="", alias="CAPASHINO_SERVICE_ACCESS_TOKEN")
+
+    # Admin endpoints are disabled while no key is set
+    admin_api_key: str = Field(
+        default="",
+        alias="ADMIN_API_KEY",
+        description="Key admin endpoints expect in the X-Admin-Key header",
+    )
@@ -0,0 +1,305 @@
+import os
+import socket
+from enum import StrEnum
+from typing import Annotated, Any, Self
+
+from pydantic import Field, field_validator, model_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+
+from app.application.dto import RetryPolicy
+from app.application.use_cases.outbox_dispatch import \
+    DEFAULT_DISPATCH_CONCURRENCY
+
+
+def _default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class ShardingModeEnum(StrEnum):
+    OFF = "off"
+    STATIC = "static"
+    COORDINATED = "coordinated"
+
+
+class WorkerNameEnum(StrEnum):
+    KAFKA_CONSUMER = "kafka_consumer"
+    INBOX = "inbox"
+    OUTBOX_PAYMENTS = "outbox_payments"
+    OUTBOX_NOTIFICATIONS = "outbox_notifications"
+    OUTBOX_SHIPPING = "outbox_shipping"
+    CATALOG_WARMUP = "catalog_warmup"
+    PARTITION_MAINTENANCE = "partition_maintenance"
+
+
+class WorkerSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="allow",
+    )
+
+    worker_id: str = Field(
+        default_factory=_default_worker_id,
+        alias="WORKER_ID",
+        description="Lease owner recorded on claimed outbox events",
+    )
+    outbox_batch_size: int = Field(
+        default=100,
+        alias="OUTBOX_BATCH_SIZE",
+        description="Initial number of outbox events claimed per poll",
+        gt=0,
+    )
+    outbox_min_batch_size: int = Field(
+        default=10,
+        alias="OUTBOX_MIN_BATCH_SIZE",
+        description="Lower bound for the adaptive outbox batch size",
+        gt=0,
+    )
+    outbox_max_batch_size: int = Field(
+        default=1000,
+        alias="OUTBOX_MAX_BATCH_SIZE",
+        description="Upper bound for the adaptive outbox batch size",
+        gt=0,
+    )
+    outbox_target_cycle_seconds: float = Field(
+        default=1.0,
+        alias="OUTBOX_TARGET_CYCLE_SECONDS",
+        description="Batch processing time the adaptive batch size aims for",
+        gt=0,
+    )
+    outbox_lease_seconds: float = Field(
+        default=30.0,
+        alias="OUTBOX_LEASE_SECONDS",
+        description="Seconds a claimed outbox event stays invisible to other workers",
+        gt=0,
+    )
+    outbox_dispatch_concurrency: int = Field(
+        default=DEFAULT_DISPATCH_CONCURRENCY,
+        alias="OUTBOX_DISPATCH_CONCURRENCY",
+        description="Maximum remote calls in flight while dispatching a claimed batch",
+        gt=0,
+    )
+    poll_min_interval: float = Field(
+        default=0.1,
+        alias="WORKER_POLL_MIN_INTERVAL",
+        description="Pause in seconds after a partial batch; idle backoff starts here",
+        gt=0,
+    )
+    poll_interval: float = Field(
+        default=5.0,
+        alias="WORKER_POLL_INTERVAL",
+        description="Longest pause in seconds between polls when no NOTIFY arrives",
+        gt=0,
+    )
+    listen_enabled: bool = Field(
+        default=True,
+        alias="WORKER_LISTEN_ENABLED",
+        description="Wake workers through Postgres LISTEN/NOTIFY",
+    )
+
+    # Failed outbox deliveries: exponential backoff, then dead letter
+    outbox_max_attempts: int = Field(
+        default=10,
+        alias="OUTBOX_MAX_ATTEMPTS",
+        description="Failed deliveries after which an outbox event becomes a dead letter",
+        gt=0,
+    )
+    outbox_retry_base_delay: float = Field(
+        default=5.0,
+        alias="OUTBOX_RETRY_BASE_DELAY",
+        description="Seconds before the first retry; doubled on every further failure",
+        gt=0,
+    )
+    outbox_retry_max_delay: float = Field(
+        default=3600.0,
+        alias="OUTBOX_RETRY_MAX_DELAY",
+        description="Upper bound for the delay between two delivery attempts",
+        gt=0,
+    )
+
+    # Outbox sharding: each replica claims events only from its partitions
+    sharding: ShardingModeEnum = Field(
+        default=ShardingModeEnum.OFF,
+        alias="OUTBOX_SHARDING",
+        description="off, static (WORKER_SHARD_INDEX/COUNT) or coordinated via Postgres",
+    )
+    shard_index: int = Field(default=0, alias="WORKER_SHARD_INDEX", ge=0)
+    shard_count: int = Field(default=1, alias="WORKER_SHARD_COUNT", gt=0)
+    shard_member_ttl: float = Field(
+        default=15.0,
+        alias="OUTBOX_SHARD_MEMBER_TTL",
+        description="Seconds a replica stays a shard member without a heartbeat",
+        gt=0,
+    )
+
+    # Daily outbox/inbox partitions: created ahead, dropped after retention
+    partition_premake_days: int = Field(
+        default=7,
+        alias="PARTITION_PREMAKE_DAYS",
+        description="Days of outbox and inbox partitions created ahead of time",
+        gt=0,
+    )
+    partition_maintenance_interval: float = Field(
+        default=3600.0,
+        alias="PARTITION_MAINTENANCE_INTERVAL",
+        description="Seconds between two partition maintenance runs",
+        gt=0,
+    )
+    partition_min_runway_days: int = Field(
+        default=2,
+        alias="PARTITION_MIN_RUNWAY_DAYS",
+        description="Log an error when fewer days of partitions than this are left",
+        gt=0,
+    )
+    partition_maintenance_external: bool = Field(
+        default=False,
+        alias="PARTITION_MAINTENANCE_EXTERNAL",
+        description="Set when partition_maintenance runs in another process, so WORKERS may omit it",
+    )
+    outbox_retention_days: int = Field(
+        default=7,
+        alias="OUTBOX_RETENTION_DAYS",
+        description="Days a fully sent outbox partition is kept",
+        gt=0,
+    )
+    inbox_retention_days: int = Field(
+        default=7,
+        alias="INBOX_RETENTION_DAYS",
+        description="Days a fully processed inbox partition and its idempotency keys are kept",
+        gt=0,
+    )
+
+    # run_workers: which workers share the process and how many copies of each
+    workers: Annotated[list[WorkerNameEnum], NoDecode] = Field(
+        default_factory=lambda: list(WorkerNameEnum),
+        alias="WORKERS",
+        description="Comma separated workers started by run_workers, or 'all'",
+    )
+    worker_concurrency: Annotated[dict[WorkerNameEnum, int], NoDecode] = Field(
+        default_factory=dict,
+        alias="WORKER_CONCURRENCY",
+        description="Copies per worker as name=count pairs, e.g. outbox_payments=4",
+    )
+    worker_restart_delay: float = Field(
+        default=1.0,
+        alias="WORKER_RESTART_DELAY",
+        description="Seconds before a crashed worker is restarted; doubled per crash",
+        gt=0,
+    )
+    worker_max_restart_delay: float = Field(
+        default=60.0,
+        alias="WORKER_MAX_RESTART_DELAY",
+        description="Upper bound for the restart delay of a crashing worker",
+        gt=0,
+    )
+
+    worker_drain_timeout: float = Field(
+        default=20.0,
+        alias="WORKER_DRAIN_TIMEOUT",
+        description="Seconds workers get to finish in-flight work after SIGTERM",
+        gt=0,
+    )
+
+    # run_supervisor: worker processes per worker type
+    worker_processes: Annotated[dict[WorkerNameEnum, int], NoDecode] = Field(
+        default_factory=dict,
+        alias="WORKER_PROCESSES",
+        description="Processes per worker as name=count pairs; one per worker by default",
+    )
+    worker_process_db_pool_size: int = Field(
+        default=2,
+        alias="WORKER_PROCESS_DB_POOL_SIZE",
+        description="DB_POOL_SIZE of each worker process started by run_supervisor",
+        gt=0,
+    )
+    worker_process_db_max_overflow: int = Field(
+        default=2,
+        alias="WORKER_PROCESS_DB_MAX_OVERFLOW",
+        description="DB_MAX_OVERFLOW of each worker process started by run_supervisor",
+        ge=0,
+    )
+    worker_stop_timeout: float = Field(
+        default=30.0,
+        alias="WORKER_STOP_TIMEOUT",
+        description="Seconds worker processes get to exit after SIGTERM before they are killed",
+        gt=0,
+    )
+
+    @property
+    def outbox_retry_policy(self) -> RetryPolicy:
+        return RetryPolicy(
+            max_attempts=self.outbox_max_attempts,
+            base_delay=self.outbox_retry_base_delay,
+            max_delay=self.outbox_retry_max_delay,
+        )
+
+    @property
+    def worker_copies(self) -> dict[WorkerNameEnum, int]:
+        return {name: self.worker_concurrency.get(name, 1) for name in self.workers}
+
+    @property
+    def worker_process_counts(self) -> dict[WorkerNameEnum, int]:
+        return {name: self.worker_processes.get(name, 1) for name in self.workers}
+
+    @field_validator("workers", mode="before")
+    @classmethod
+    def parse_workers(cls, value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        names = [name.strip() for name in value.split(",") if name.strip()]
+        if names == ["all"]:
+            return list(WorkerNameEnum)
+        return list(dict.fromkeys(names))
+
+    @field_validator("worker_concurrency", "worker_processes", mode="before")
+    @classmethod
+    def parse_worker_counts(cls, value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        pairs = (pair.partition("=") for pair in value.split(",") if pair.strip())
+        return {name.strip(): count.strip() for name, _, count in pairs}
+
+    @field_validator("worker_concurrency", "worker_processes", mode="after")
+    @classmethod
+    def check_worker_counts(
+        cls, value: dict[WorkerNameEnum, int]
+    ) -> dict[WorkerNameEnum, int]:
+        if any(count < 1 for count in value.values()):
+            raise ValueError("Worker counts must be at least 1")
+        return value
+
+    @model_validator(mode="after")
+    def check_drain_timeout(self) -> Self:
+        if self.worker_drain_timeout >= self.worker_stop_timeout:
+            raise ValueError(
+                "WORKER_DRAIN_TIMEOUT must be lower than WORKER_STOP_TIMEOUT"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def check_partition_maintenance(self) -> Self:
+        # Without it no new daily partition is created, and every outbox and
+        # inbox insert fails once the premade days are used up.
+        if (
+            WorkerNameEnum.PARTITION_MAINTENANCE not in self.workers
+            and not self.partition_maintenance_external
+        ):
+            raise ValueError(
+                "WORKERS must include partition_maintenance unless"
+                " PARTITION_MAINTENANCE_EXTERNAL=true"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def check_partition_runway(self) -> Self:
+        if self.partition_min_runway_days > self.partition_premake_days:
+            raise ValueError(
+                "PARTITION_MIN_RUNWAY_DAYS must not exceed PARTITION_PREMAKE_DAYS"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def check_shard_index(self) -> Self:
+        if self.shard_index >= self.shard_count:
+            raise ValueError("WORKER_SHARD_INDEX must be lower than WORKER_SHARD_COUNT")
+        return self
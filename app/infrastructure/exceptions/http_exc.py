@@ -5,3 +5,24 @@ class HTTPClientException(InfrastructureException):
     def __init__(self):
         message = "Service temporarily unavailable"
         super().__init__(message)
+
+
+class CircuitOpenException(InfrastructureException):
+    def __init__(self, upstream: str):
+        self.upstream = upstream
+        message = f"Circuit breaker for {upstream} is open"
+        super().__init__(message)
+
+
+class DeadlineExceededException(InfrastructureException):
+    def __init__(self, url: str):
+        self.url = url
+        message = f"Deadline exceeded while requesting {url}"
+        super().__init__(message)
+
+
+class AdminAccessDeniedException(InfrastructureException):
+    def __init__(self, reason: str):
+        self.reason = reason
+        message = f"Admin access denied: {reason}"
+        super().__init__(message)
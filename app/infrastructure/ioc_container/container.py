@@ -2,8 +2,8 @@ from dishka import make_async_container
 
 from .providers import (ApplicationSettingsProvider,
                         AppNotificationsServiceProvider,
-                        AppPaymentsServiceProvider, CatalogServiceProvider,
-                        CreateOrderUseCaseProvider,
+                        AppPaymentsServiceProvider, CatalogCacheProvider,
+                        CatalogServiceProvider, CreateOrderUseCaseProvider,
                         CreatePaymentUseCaseProvider, DatabaseProvider,
                         DatabaseSessionProvider,
                         HandlePaymentResponseUseCaseProvider,
@@ -13,14 +13,18 @@ from .providers import (ApplicationSettingsProvider,
                         OutboxNotificationsWorkerProvider,
                         OutboxPaymentsWorkerProvider,
                         OutboxShippingWorkerProvider, PaymentsServiceProvider,
-                        UnitOfWorkProvider, UpdateOrderStatusUseCaseProvider)
+                        RequeueDeadLettersUseCaseProvider, UnitOfWorkProvider,
+                        UpdateOrderStatusUseCaseProvider,
+                        WakeupListenerProvider, WorkerSettingsProvider)
 
 container = make_async_container(
     ApplicationSettingsProvider(),
     HTTPClientSettingsProvider(),
+    WorkerSettingsProvider(),
     DatabaseProvider(),
     DatabaseSessionProvider(),
     HTTPClientProvider(),
+    CatalogCacheProvider(),
     CatalogServiceProvider(),
     PaymentsServiceProvider(),
     AppPaymentsServiceProvider(),
@@ -33,7 +37,9 @@ container = make_async_container(
     OutboxPaymentsWorkerProvider(),
     HandlePaymentResponseUseCaseProvider(),
     UpdateOrderStatusUseCaseProvider(),
+    WakeupListenerProvider(),
     InboxWorkerProvider(),
     OutboxNotificationsWorkerProvider(),
     OutboxShippingWorkerProvider(),
+    RequeueDeadLettersUseCaseProvider(),
 )
@@ -7,17 +7,23 @@ from app.application.use_cases import (CreateOrderUseCase,
                                        CreatePaymentUseCase,
                                        HandlePaymentResponseUseCase,
                                        RegisterShippingUseCase,
+                                       RequeueDeadLettersUseCase,
                                        ShippingResponseUseCase,
                                        UpdateOrderStatusUseCase)
-from app.infrastructure.adapters import (BaseHTTPXClient, CatalogService,
-                                         NotificationsService, PaymentsService)
+from app.infrastructure.adapters import (BaseHTTPXClient, CatalogCache,
+                                         CatalogService, NotificationsService,
+                                         PaymentsService)
 from app.infrastructure.broker import KafkaConsumer, KafkaProducer
 from app.infrastructure.config import (Database, HTTPClientSettings,
-                                       KafkaConfig, Settings)
+                                       KafkaConfig, Settings, WorkerSettings)
+from app.infrastructure.config.cache_client import RedisClient
 from app.infrastructure.uow import UnitOfWork
-from app.infrastructure.workers import (InboxWorker, OutboxNotificationsWorker,
+from app.infrastructure.workers import (CatalogWarmupWorker, InboxWorker,
+                                        OutboxNotificationsWorker,
                                         OutboxPaymentsWorker,
-                                        OutboxShippingWorker)
+                                        OutboxShippingWorker,
+                                        PartitionMaintenanceWorker,
+                                        PgWakeupListener)
 
 
 class ApplicationSettingsProvider(Provider):
@@ -36,12 +42,25 @@ class HTTPClientSettingsProvider(Provider):
         return HTTPClientSettings()
 
 
+class WorkerSettingsProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def provide_worker_settings(self) -> WorkerSettings:
+        return WorkerSettings()
+
+
 class DatabaseProvider(Provider):
     scope = Scope.APP
 
     @provide
     async def provide_database(self, settings: Settings) -> Database:
-        return Database(url=settings.db_url)
+        return Database(
+            url=settings.db_url,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+        )
 
 
 class DatabaseSessionProvider(Provider):
@@ -59,18 +78,36 @@ class HTTPClientProvider(Provider):
     scope = Scope.APP
 
     @provide
-    async def provide_http_client(self, config: HTTPClientSettings) -> BaseHTTPXClient:
-        return BaseHTTPXClient(config=config)
+    async def provide_http_client(
+        self, config: HTTPClientSettings
+    ) -> AsyncGenerator[BaseHTTPXClient, None]:
+        async with BaseHTTPXClient(config=config) as client:
+            yield client
+
+
+class CatalogCacheProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def provide_catalog_cache(
+        self, settings: Settings
+    ) -> AsyncGenerator[CatalogCache, None]:
+        redis = None
+        if settings.redis_host:
+            redis = await RedisClient(settings=settings).get_client()
+        cache = CatalogCache(settings=settings, redis=redis)
+        yield cache
+        await cache.close()
 
 
 class CatalogServiceProvider(Provider):
-    scope = Scope.REQUEST
+    scope = Scope.APP
 
     @provide
     async def provide_catalog_service(
-        self, client: BaseHTTPXClient, settings: Settings
+        self, client: BaseHTTPXClient, settings: Settings, cache: CatalogCache
     ) -> CatalogService:
-        return CatalogService(client=client, settings=settings)
+        return CatalogService(client=client, settings=settings, cache=cache)
 
 
 class PaymentsServiceProvider(Provider):
@@ -87,9 +124,9 @@ class AppPaymentsServiceProvider(Provider):
     scope = Scope.APP
 
     @provide
-    async def provide_app_payments_service(self, settings: Settings) -> PaymentsService:
-        http_settings = HTTPClientSettings()
-        client = BaseHTTPXClient(config=http_settings)
+    async def provide_app_payments_service(
+        self, client: BaseHTTPXClient, settings: Settings
+    ) -> PaymentsService:
         return PaymentsService(client=client, settings=settings)
 
 
@@ -98,10 +135,8 @@ class AppNotificationsServiceProvider(Provider):
 
     @provide
     async def provide_app_notifications_service(
-        self, settings: Settings
+        self, client: BaseHTTPXClient, settings: Settings
     ) -> NotificationsService:
-        http_settings = HTTPClientSettings()
-        client = BaseHTTPXClient(config=http_settings)
         return NotificationsService(client=client, settings=settings)
 
 
@@ -117,8 +152,12 @@ class KafkaProducerProvider(Provider):
     scope = Scope.APP
 
     @provide
-    async def provide_kafka_producer(self, config: KafkaConfig) -> KafkaProducer:
-        return KafkaProducer(config=config)
+    async def provide_kafka_producer(
+        self, config: KafkaConfig
+    ) -> AsyncGenerator[KafkaProducer, None]:
+        producer = KafkaProducer(config=config)
+        yield producer
+        await producer.stop()
 
 
 class UnitOfWorkProvider(Provider):
@@ -149,9 +188,20 @@ class CreatePaymentUseCaseProvider(Provider):
 
     @provide
     async def provide_create_payment_use_case(
-        self, uow: UnitOfWork, payments_service: PaymentsService
+        self,
+        uow: UnitOfWork,
+        payments_service: PaymentsService,
+        worker_settings: WorkerSettings,
     ) -> CreatePaymentUseCase:
-        return CreatePaymentUseCase(uow=uow, payments_service=payments_service)
+        return CreatePaymentUseCase(
+            uow=uow,
+            payments_service=payments_service,
+            lease_owner=worker_settings.worker_id,
+            batch_size=worker_settings.outbox_batch_size,
+            lease_seconds=worker_settings.outbox_lease_seconds,
+            concurrency=worker_settings.outbox_dispatch_concurrency,
+            retry_policy=worker_settings.outbox_retry_policy,
+        )
 
 
 class HandlePaymentResponseUseCaseProvider(Provider):
@@ -179,9 +229,26 @@ class RegisterShippingUseCaseProvider(Provider):
 
     @provide
     async def provide_register_shipping_use_case(
-        self, uow: UnitOfWork, broker: KafkaProducer
+        self, uow: UnitOfWork, broker: KafkaProducer, worker_settings: WorkerSettings
     ) -> RegisterShippingUseCase:
-        return RegisterShippingUseCase(uow=uow, broker=broker)
+        return RegisterShippingUseCase(
+            uow=uow,
+            broker=broker,
+            lease_owner=worker_settings.worker_id,
+            batch_size=worker_settings.outbox_batch_size,
+            lease_seconds=worker_settings.outbox_lease_seconds,
+            retry_policy=worker_settings.outbox_retry_policy,
+        )
+
+
+class RequeueDeadLettersUseCaseProvider(Provider):
+    scope = Scope.REQUEST
+
+    @provide
+    async def provide_requeue_dead_letters_use_case(
+        self, uow: UnitOfWork
+    ) -> RequeueDeadLettersUseCase:
+        return RequeueDeadLettersUseCase(uow=uow)
 
 
 class ShippingResponseUseCaseProvider(Provider):
@@ -194,46 +261,105 @@ class ShippingResponseUseCaseProvider(Provider):
         return ShippingResponseUseCase(uow=uow)
 
 
-class OutboxPaymentsWorkerProvider(Provider):
+class WakeupListenerProvider(Provider):
     scope = Scope.APP
 
+    @provide
+    async def provide_wakeup_listener(
+        self, database: Database
+    ) -> AsyncGenerator[PgWakeupListener, None]:
+        listener = PgWakeupListener(database=database)
+        yield listener
+        await listener.close()
+
+
+class OutboxPaymentsWorkerProvider(Provider):
+    scope = Scope.REQUEST
+
     @provide
     async def provide_outbox_payment_worker(
-        self, database: Database, payments_service: PaymentsService
+        self,
+        database: Database,
+        payments_service: PaymentsService,
+        worker_settings: WorkerSettings,
+        wakeup: PgWakeupListener,
     ) -> OutboxPaymentsWorker:
         return OutboxPaymentsWorker(
-            database=database, payments_service=payments_service
+            database=database,
+            payments_service=payments_service,
+            settings=worker_settings,
+            wakeup=wakeup,
         )
 
 
 class InboxWorkerProvider(Provider):
-    scope = Scope.APP
+    scope = Scope.REQUEST
 
     @provide
-    async def provide_inbox_worker(self, database: Database) -> InboxWorker:
-        return InboxWorker(database=database)
+    async def provide_inbox_worker(
+        self,
+        database: Database,
+        worker_settings: WorkerSettings,
+        wakeup: PgWakeupListener,
+    ) -> InboxWorker:
+        return InboxWorker(database=database, settings=worker_settings, wakeup=wakeup)
 
 
 class OutboxNotificationsWorkerProvider(Provider):
-    scope = Scope.APP
+    scope = Scope.REQUEST
 
     @provide
     async def provide_outbox_notifications_worker(
-        self, database: Database, notifications_service: NotificationsService
+        self,
+        database: Database,
+        notifications_service: NotificationsService,
+        worker_settings: WorkerSettings,
+        wakeup: PgWakeupListener,
     ) -> OutboxNotificationsWorker:
         return OutboxNotificationsWorker(
-            database=database, notifications_service=notifications_service
+            database=database,
+            notifications_service=notifications_service,
+            settings=worker_settings,
+            wakeup=wakeup,
         )
 
 
 class OutboxShippingWorkerProvider(Provider):
-    scope = Scope.APP
+    scope = Scope.REQUEST
 
     @provide
     async def provide_outbox_shipping_worker(
-        self, database: Database, broker: KafkaProducer
+        self,
+        database: Database,
+        broker: KafkaProducer,
+        worker_settings: WorkerSettings,
+        wakeup: PgWakeupListener,
     ) -> OutboxShippingWorker:
-        return OutboxShippingWorker(database=database, broker=broker)
+        return OutboxShippingWorker(
+            database=database, broker=broker, settings=worker_settings, wakeup=wakeup
+        )
+
+
+class CatalogWarmupWorkerProvider(Provider):
+    scope = Scope.REQUEST
+
+    @provide
+    async def provide_catalog_warmup_worker(
+        self, database: Database, catalog_service: CatalogService, settings: Settings
+    ) -> CatalogWarmupWorker:
+        return CatalogWarmupWorker(
+            database=database, catalog_service=catalog_service, settings=settings
+        )
+
+
+class PartitionMaintenanceWorkerProvider(Provider):
+    scope = Scope.REQUEST
+
+    @provide
+    async def provide_partition_maintenance_worker(
+        self, database: Database, worker_settings: WorkerSettings
+    ) -> PartitionMaintenanceWorker:
+        return PartitionMaintenanceWorker(database=database, settings=worker_settings)
 
 
 class KafkaConsumerProvider(Provider):
@@ -1,11 +1,18 @@
 from app.infrastructure.models.enums import (EventTypeEnum,
+                                             InboxEventStatusEnum,
                                              OutboxEventStatusEnum)
-from app.infrastructure.models.inbox import InboxModel
-from app.infrastructure.models.outbox import OutboxModel
+from app.infrastructure.models.inbox import (InboxIdempotencyKeyModel,
+                                             InboxModel)
+from app.infrastructure.models.outbox import (OUTBOX_PARTITIONS, OutboxModel,
+                                              OutboxShardMemberModel)
 
 __all__ = [
     "EventTypeEnum",
     "OutboxEventStatusEnum",
+    "InboxEventStatusEnum",
     "OutboxModel",
+    "OutboxShardMemberModel",
+    "OUTBOX_PARTITIONS",
     "InboxModel",
+    "InboxIdempotencyKeyModel",
 ]
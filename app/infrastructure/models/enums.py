@@ -20,6 +20,7 @@ class EventTypeEnum(StrEnum):
 class OutboxEventStatusEnum(StrEnum):
     PENDING = "pending"
     SENT = "sent"
+    DEAD_LETTER = "dead_letter"
 
 
 class InboxEventStatusEnum(StrEnum):
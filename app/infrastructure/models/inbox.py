@@ -1,8 +1,9 @@
+from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import JSON
 from sqlalchemy import UUID as SQLUUID
-from sqlalchemy import CheckConstraint, Enum, Index
+from sqlalchemy import CheckConstraint, DateTime, Enum, Index, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -13,8 +14,19 @@ from .enums import EventTypeEnum, InboxEventStatusEnum
 class InboxModel(BaseModel):
     __tablename__ = "inbox"
     __table_args__ = (
-        Index("idx_status_inbox", "status"),
+        Index(
+            "idx_inbox_pending",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        Index("idx_inbox_idempotency_key", "idempotency_key"),
         CheckConstraint("status IN ('pending', 'sent')", name="valid_outbox_status"),
+        # Daily partitions, created and dropped by PartitionMaintenanceWorker.
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    # The primary key of a partitioned table has to include the partition key.
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), primary_key=True
     )
     event_type: Mapped[EventTypeEnum] = mapped_column(
         Enum(
@@ -33,4 +45,18 @@ class InboxModel(BaseModel):
         ),
         default=InboxEventStatusEnum.PENDING,
     )
+    # Uniqueness across partitions is enforced by InboxIdempotencyKeyModel.
+    idempotency_key: Mapped[UUID] = mapped_column(SQLUUID)
+
+
+class InboxIdempotencyKeyModel(BaseModel):
+    """Idempotency keys of received inbox events.
+
+    A unique constraint on the partitioned ``inbox`` table would have to
+    include ``created_at``, so duplicates are rejected here instead.
+    """
+
+    __tablename__ = "inbox_idempotency_keys"
+    __table_args__ = (Index("idx_inbox_idempotency_keys_created_at", "created_at"),)
+
     idempotency_key: Mapped[UUID] = mapped_column(SQLUUID, unique=True)
@@ -0,0 +1,18 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.enums.events import EventTypeEnum
+
+
+def outbox_channel(event_type: EventTypeEnum) -> str:
+    return "outbox_" + event_type.value.replace(".", "_")
+
+
+def inbox_channel(event_type: EventTypeEnum) -> str:
+    return "inbox_" + event_type.value.replace(".", "_")
+
+
+async def notify(session: AsyncSession, channel: str) -> None:
+    # Delivered on commit (and dropped on rollback); duplicates within one
+    # transaction are folded into a single notification by Postgres.
+    await session.execute(select(func.pg_notify(channel, "")))
@@ -1,13 +1,15 @@
+from typing import Sequence
 from uuid import UUID
 
 from sqlalchemy import select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.application.dto import InboxDTO, InboxDTOResponse
+from app.application.dto import EventKey, InboxDTO, InboxDTOResponse
 from app.application.enums.events import EventTypeEnum, InboxEventStatusEnum
-from app.infrastructure.models import InboxModel
+from app.infrastructure.models import InboxIdempotencyKeyModel, InboxModel
 from app.infrastructure.repositories.base import BaseRepository
+from app.infrastructure.repositories.channels import inbox_channel, notify
 
 
 class InboxRepository(BaseRepository):
@@ -15,12 +17,39 @@ class InboxRepository(BaseRepository):
         super().__init__(session=session, model=InboxModel)
 
     async def create(self, entity: InboxDTO) -> None:
-        query = (
-            insert(self.model)
-            .values(**entity.to_dict())
+        # The partitioned inbox cannot enforce a unique idempotency key, so
+        # the key is claimed in its own table first; duplicates stop there.
+        claim_key = (
+            insert(InboxIdempotencyKeyModel)
+            .values(idempotency_key=entity.idempotency_key)
             .on_conflict_do_nothing(index_elements=["idempotency_key"])
+            .returning(InboxIdempotencyKeyModel.id)
         )
-        await self.session.execute(query)
+        if (await self.session.execute(claim_key)).scalar_one_or_none() is None:
+            return None
+        await self.session.execute(insert(self.model).values(**entity.to_dict()))
+        await notify(self.session, inbox_channel(entity.event_type))
+
+    async def create_many(self, entities: Sequence[InboxDTO]) -> set[UUID]:
+        """Insert the events whose idempotency key is new; return those keys."""
+        if not entities:
+            return set()
+        claim_keys = (
+            insert(InboxIdempotencyKeyModel)
+            .values([{"idempotency_key": e.idempotency_key} for e in entities])
+            .on_conflict_do_nothing(index_elements=["idempotency_key"])
+            .returning(InboxIdempotencyKeyModel.idempotency_key)
+        )
+        claimed = set((await self.session.execute(claim_keys)).scalars().all())
+        created = [e for e in entities if e.idempotency_key in claimed]
+        if not created:
+            return claimed
+        await self.session.execute(
+            insert(self.model).values([entity.to_dict() for entity in created])
+        )
+        for event_type in {entity.event_type for entity in created}:
+            await notify(self.session, inbox_channel(event_type))
+        return claimed
 
     async def get_events(
         self,
@@ -39,7 +68,7 @@ class InboxRepository(BaseRepository):
         if conditions:
             query = query.where(*conditions)
 
-        query = query.with_for_update(skip_locked=True)
+        query = query.order_by(self.model.created_at).with_for_update(skip_locked=True)
 
         if limit is not None:
             query = query.limit(limit)
@@ -54,10 +83,14 @@ class InboxRepository(BaseRepository):
             return None
         return self._model_to_entity(result)
 
-    async def mark_as_processed(self, event_id: UUID) -> None:
+    async def mark_as_processed(self, event_key: EventKey) -> None:
         query = (
             update(self.model)
-            .where(self.model.id == event_id)
+            .where(
+                self.model.id == event_key.id,
+                # The partition key lets Postgres skip the other partitions.
+                self.model.created_at == event_key.created_at,
+            )
             .values(status=InboxEventStatusEnum.PROCESSED)
         )
         await self.session.execute(query)
@@ -69,4 +102,5 @@ class InboxRepository(BaseRepository):
             status=model.status,
             payload=model.payload,
             idempotency_key=model.idempotency_key,
+            created_at=model.created_at,
         )
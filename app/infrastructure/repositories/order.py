@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.dto.order import OrderDTOResponse
@@ -20,6 +20,16 @@ class OrderRepository(BaseRepository):
             return None
         return self._model_to_entity(result)
 
+    async def get_top_item_ids(self, limit: int) -> list[UUID]:
+        order_count = func.count()
+        query = (
+            select(self.model.item_id)
+            .group_by(self.model.item_id)
+            .order_by(order_count.desc())
+            .limit(limit)
+        )
+        return list((await self.session.execute(query)).scalars().all())
+
     def _model_to_entity(self, model: OrderModel) -> OrderDTOResponse:
         return OrderDTOResponse(
             id=model.id,
@@ -1,13 +1,21 @@
+from datetime import timedelta
+from typing import Mapping, Sequence
 from uuid import UUID
 
-from sqlalchemy import insert, select, update
+from sqlalchemy import (bindparam, case, cast, exists, func, insert, or_,
+                        select, tuple_, update)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.application.dto import OutboxDTO, OutboxDTOResponse
+from app.application.dto import (EventKey, OutboxDTO, OutboxDTOResponse,
+                                 RetryPolicy)
 from app.infrastructure.models import (EventTypeEnum, OutboxEventStatusEnum,
                                        OutboxModel)
 
 from .base import BaseRepository
+from .channels import notify, outbox_channel
+
+_MAX_ERROR_LENGTH = 1000
 
 
 class OutboxRepository(BaseRepository):
@@ -17,6 +25,16 @@ class OutboxRepository(BaseRepository):
     async def create(self, entity: OutboxDTO) -> None:
         query = insert(self.model).values(**entity.to_dict())
         await self.session.execute(query)
+        await notify(self.session, outbox_channel(entity.event_type))
+
+    async def create_many(self, entities: Sequence[OutboxDTO]) -> None:
+        if not entities:
+            return None
+        await self.session.execute(
+            insert(self.model).values([entity.to_dict() for entity in entities])
+        )
+        for event_type in {entity.event_type for entity in entities}:
+            await notify(self.session, outbox_channel(event_type))
 
     async def get_events(
         self,
@@ -35,7 +53,7 @@ class OutboxRepository(BaseRepository):
         if conditions:
             query = query.where(*conditions)
 
-        query = query.with_for_update(skip_locked=True)
+        query = query.order_by(self.model.created_at).with_for_update(skip_locked=True)
 
         if limit is not None:
             query = query.limit(limit)
@@ -67,10 +85,255 @@ class OutboxRepository(BaseRepository):
         )
         await self.session.execute(query)
 
+    async def claim_batch(
+        self,
+        event_type: EventTypeEnum | Sequence[EventTypeEnum],
+        lease_owner: str,
+        limit: int = 100,
+        lease_seconds: float = 30.0,
+        partitions: Sequence[int] | None = None,
+    ) -> list[OutboxDTOResponse]:
+        """Lease up to ``limit`` due pending events to ``lease_owner`` in one statement.
+
+        Events waiting for a retry are not due before their
+        ``next_attempt_at``, and an event is not claimed while an earlier
+        event of the same order and worker is unsent (pending, or a dead
+        letter until it is requeued), so an order sees its events in
+        sequence across retries. Rows locked by a concurrent claim are skipped, and rows whose lease
+        has expired are claimable again, so an event held by a crashed
+        worker is picked up once its lease runs out. Commit right after the
+        claim: the lease, not a row lock, keeps other workers away.
+
+        ``partitions`` restricts the claim to the given outbox partitions
+        when the worker runs sharded.
+        """
+        # Event types are StrEnums, so a single one is recognised as a str.
+        event_types = [event_type] if isinstance(event_type, str) else list(event_type)
+        now = func.now()
+        conditions = [
+            self.model.status == OutboxEventStatusEnum.PENDING,
+            self.model.event_type.in_(event_types),
+            self.model.next_attempt_at <= now,
+            or_(
+                self.model.lease_expires_at.is_(None),
+                self.model.lease_expires_at < now,
+            ),
+            ~self._earlier_unsent(event_types),
+        ]
+        if partitions is not None:
+            conditions.append(self.model.partition.in_(partitions))
+        claimable = (
+            select(self.model.id)
+            .where(*conditions)
+            .order_by(self.model.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        query = (
+            update(self.model)
+            .where(self.model.id.in_(claimable.scalar_subquery()))
+            .values(
+                lease_owner=lease_owner,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+            )
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        results = (await self.session.execute(query)).scalars().all()
+        return [self._model_to_entity(result) for result in results]
+
+    async def mark_sent_many(self, event_keys: Sequence[EventKey]) -> None:
+        if not event_keys:
+            return None
+        query = (
+            update(self.model)
+            .where(self._in_keys(event_keys))
+            .values(
+                status=OutboxEventStatusEnum.SENT,
+                lease_owner=None,
+                lease_expires_at=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(query)
+
+    async def schedule_retries(
+        self, failures: Mapping[EventKey, str], retry_policy: RetryPolicy
+    ) -> None:
+        """Release failed events for a later attempt, or dead-letter them.
+
+        The backoff is computed from each row's own attempt count, so the
+        whole batch is updated with one executemany round trip.
+        """
+        if not failures:
+            return None
+        table = self.model.__table__
+        delay = func.least(
+            retry_policy.max_delay,
+            retry_policy.base_delay * func.power(2, table.c.attempts),
+        )
+        status = cast(
+            case(
+                (
+                    table.c.attempts + 1 >= retry_policy.max_attempts,
+                    OutboxEventStatusEnum.DEAD_LETTER.value,
+                ),
+                else_=OutboxEventStatusEnum.PENDING.value,
+            ),
+            table.c.status.type,
+        )
+        query = (
+            update(table)
+            .where(
+                table.c.id == bindparam("event_id"),
+                table.c.created_at == bindparam("event_created_at"),
+            )
+            .values(
+                attempts=table.c.attempts + 1,
+                next_attempt_at=func.now()
+                + func.make_interval(0, 0, 0, 0, 0, 0, delay),
+                last_error=bindparam("error"),
+                status=status,
+                lease_owner=None,
+                lease_expires_at=None,
+            )
+        )
+        await self.session.execute(
+            query,
+            [
+                {
+                    "event_id": key.id,
+                    "event_created_at": key.created_at,
+                    "error": error[:_MAX_ERROR_LENGTH],
+                }
+                for key, error in failures.items()
+            ],
+        )
+
+    async def hold_back(self, holds: Mapping[EventKey, EventKey]) -> None:
+        """Release events held back behind a failed event of their order.
+
+        Each becomes due together with the event blocking it; its attempts
+        and last error stay as they are, since it was not attempted.
+        """
+        if not holds:
+            return None
+        table = self.model.__table__
+        blocker = table.alias("blocker")
+        blocker_due = (
+            select(blocker.c.next_attempt_at)
+            .where(
+                blocker.c.id == bindparam("blocker_id"),
+                blocker.c.created_at == bindparam("blocker_created_at"),
+            )
+            .scalar_subquery()
+        )
+        query = (
+            update(table)
+            .where(
+                table.c.id == bindparam("event_id"),
+                table.c.created_at == bindparam("event_created_at"),
+            )
+            .values(
+                next_attempt_at=func.coalesce(blocker_due, table.c.next_attempt_at),
+                lease_owner=None,
+                lease_expires_at=None,
+            )
+        )
+        await self.session.execute(
+            query,
+            [
+                {
+                    "event_id": key.id,
+                    "event_created_at": key.created_at,
+                    "blocker_id": blocker_key.id,
+                    "blocker_created_at": blocker_key.created_at,
+                }
+                for key, blocker_key in holds.items()
+            ],
+        )
+
+    async def release_many(
+        self, event_keys: Sequence[EventKey], lease_owner: str
+    ) -> None:
+        """Hand claimed but undispatched events back before their lease ends.
+
+        Only leases still held by ``lease_owner`` are released; an event whose
+        lease already expired may have been claimed by another worker.
+        """
+        if not event_keys:
+            return None
+        query = (
+            update(self.model)
+            .where(
+                self._in_keys(event_keys),
+                self.model.lease_owner == lease_owner,
+                self.model.status == OutboxEventStatusEnum.PENDING,
+            )
+            .values(lease_owner=None, lease_expires_at=None)
+            .returning(self.model.event_type)
+            .execution_options(synchronize_session=False)
+        )
+        released = (await self.session.execute(query)).scalars().all()
+        for released_type in set(released):
+            await notify(self.session, outbox_channel(released_type))
+
+    async def requeue_dead_letters(
+        self,
+        event_ids: Sequence[UUID] | None = None,
+        event_type: EventTypeEnum | None = None,
+    ) -> list[UUID]:
+        """Make dead letters pending again with a fresh attempt budget."""
+        conditions = [self.model.status == OutboxEventStatusEnum.DEAD_LETTER]
+        if event_ids is not None:
+            conditions.append(self.model.id.in_(event_ids))
+        if event_type is not None:
+            conditions.append(self.model.event_type == event_type)
+        query = (
+            update(self.model)
+            .where(*conditions)
+            .values(
+                status=OutboxEventStatusEnum.PENDING,
+                attempts=0,
+                next_attempt_at=func.now(),
+                last_error=None,
+            )
+            .returning(self.model.id, self.model.event_type)
+            .execution_options(synchronize_session=False)
+        )
+        requeued = (await self.session.execute(query)).all()
+        for requeued_type in {row.event_type for row in requeued}:
+            await notify(self.session, outbox_channel(requeued_type))
+        return [row.id for row in requeued]
+
     def _model_to_entity(self, model: OutboxModel) -> OutboxDTOResponse:
         return OutboxDTOResponse(
             id=model.id,
             event_type=model.event_type,
             payload=model.payload,
             status=model.status,
+            created_at=model.created_at,
+            attempts=model.attempts,
+            last_error=model.last_error,
+        )
+
+    def _in_keys(self, event_keys: Sequence[EventKey]):
+        # Matching on the partition key as well lets Postgres skip every
+        # daily partition the rows cannot be in.
+        return tuple_(self.model.id, self.model.created_at).in_(
+            [tuple(key) for key in event_keys]
+        )
+
+    def _earlier_unsent(self, event_types: Sequence[EventTypeEnum]):
+        # Scoped to the claiming worker's event types: ordering is kept per
+        # stream, so a failing notification does not hold up a shipment.
+        # Served by idx_outbox_unsent_order; events without an order_id
+        # never match.
+        earlier = aliased(self.model)
+        return exists().where(
+            earlier.payload["order_id"].as_string()
+            == self.model.payload["order_id"].as_string(),
+            earlier.event_type.in_(event_types),
+            earlier.created_at < self.model.created_at,
+            earlier.status != OutboxEventStatusEnum.SENT,
         )
@@ -0,0 +1,49 @@
+from datetime import timedelta
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.outbox import OutboxShardMemberModel
+from .base import BaseRepository
+
+
+class OutboxShardRepository(BaseRepository):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session=session, model=OutboxShardMemberModel)
+
+    async def heartbeat(
+        self, shard_group: str, worker_id: str, ttl_seconds: float
+    ) -> None:
+        expires_at = func.now() + timedelta(seconds=ttl_seconds)
+        query = (
+            insert(self.model)
+            .values(shard_group=shard_group, worker_id=worker_id, expires_at=expires_at)
+            .on_conflict_do_update(
+                index_elements=["shard_group", "worker_id"],
+                set_={"expires_at": expires_at, "updated_at": func.now()},
+            )
+        )
+        await self.session.execute(query)
+
+    async def get_live_members(self, shard_group: str) -> list[str]:
+        query = (
+            select(self.model.worker_id)
+            .where(
+                self.model.shard_group == shard_group,
+                self.model.expires_at > func.now(),
+            )
+            .order_by(self.model.worker_id)
+        )
+        return list((await self.session.execute(query)).scalars().all())
+
+    async def leave(self, shard_group: str, worker_id: str) -> None:
+        await self.session.execute(
+            delete(self.model).where(
+                self.model.shard_group == shard_group,
+                self.model.worker_id == worker_id,
+            )
+        )
+        await self.session.execute(
+            delete(self.model).where(self.model.expires_at <= func.now())
+        )
@@ -0,0 +1,126 @@
+import re
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from ..models import InboxIdempotencyKeyModel
+
+# Partitions are named <table>_pYYYYMMDD after the UTC day they hold; the
+# migration that partitioned the tables left older rows in <table>_legacy.
+PARTITION_NAME = re.compile(r"^(outbox|inbox)_(p\d{8}|legacy)$")
+_UPPER_BOUND = re.compile(r"TO \('([^']+)'\)")
+
+
+@dataclass(frozen=True, slots=True)
+class TablePartition:
+    name: str
+    # None for a partition without upper bound (MAXVALUE).
+    upper: datetime | None
+    # Left behind by an interrupted DETACH ... CONCURRENTLY.
+    detach_pending: bool = False
+
+
+def partition_name(table: str, day: date) -> str:
+    return f"{table}_p{day:%Y%m%d}"
+
+
+def day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=UTC)
+
+
+class PartitionRepository:
+    """DDL for the daily ``created_at`` partitions of ``outbox`` and ``inbox``."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_partitions(self, table: str) -> list[TablePartition]:
+        query = text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid),"
+            " pg_inherits.inhdetachpending"
+            " FROM pg_inherits"
+            " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+            " WHERE pg_inherits.inhparent = CAST(:table AS regclass)"
+        )
+        rows = (await self.session.execute(query, {"table": table})).all()
+        partitions = []
+        for name, bound, detach_pending in rows:
+            match = _UPPER_BOUND.search(bound)
+            upper = None
+            if match:
+                # Bounds are rendered in the session time zone.
+                upper = datetime.fromisoformat(match.group(1)).astimezone(UTC)
+            partitions.append(
+                TablePartition(name=name, upper=upper, detach_pending=detach_pending)
+            )
+        return sorted(partitions, key=lambda p: (p.upper is None, p.upper))
+
+    async def create_partition(self, table: str, day: date) -> str | None:
+        """Create the partition holding rows created on the UTC ``day``.
+
+        The table is created first and attached afterwards: ATTACH only
+        takes a SHARE UPDATE EXCLUSIVE lock on the parent, so inserts and
+        claims keep running, whereas CREATE TABLE ... PARTITION OF would
+        block them. Concurrent creators (API instances starting up, the
+        maintenance worker) are serialised per table; returns ``None`` if
+        the partition already exists.
+        """
+        name = partition_name(table, day)
+        lower = day_start(day).isoformat()
+        upper = day_start(day + timedelta(days=1)).isoformat()
+        await self.session.execute(text("SET LOCAL lock_timeout = '5s'"))
+        await self.session.execute(
+            select(func.pg_advisory_xact_lock(func.hashtext(f"partitions:{table}")))
+        )
+        exists = await self.session.execute(select(func.to_regclass(name).is_not(None)))
+        if exists.scalar_one():
+            return None
+        await self.session.execute(
+            text(
+                f"CREATE TABLE {name}"
+                f" (LIKE {table} INCLUDING DEFAULTS INCLUDING GENERATED)"
+            )
+        )
+        await self.session.execute(
+            text(
+                f"ALTER TABLE {table} ATTACH PARTITION {name}"
+                f" FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+        )
+        return name
+
+    async def has_unfinished_rows(self, partition: str, finished_status: str) -> bool:
+        """Whether ``partition`` still holds rows not in ``finished_status``."""
+        query = text(
+            f"SELECT EXISTS (SELECT 1 FROM {partition}"
+            " WHERE status::text <> :finished_status)"
+        )
+        result = await self.session.execute(query, {"finished_status": finished_status})
+        return result.scalar_one()
+
+    async def delete_idempotency_keys_before(self, cutoff: datetime) -> int:
+        query = delete(InboxIdempotencyKeyModel).where(
+            InboxIdempotencyKeyModel.created_at < cutoff
+        )
+        return (await self.session.execute(query)).rowcount
+
+
+async def detach_and_drop_partition(
+    connection: AsyncConnection,
+    table: str,
+    partition: str,
+    detach_pending: bool = False,
+) -> None:
+    """Detach ``partition`` without blocking writers, then drop it.
+
+    ``DETACH ... CONCURRENTLY`` cannot run inside a transaction block, so
+    ``connection`` must be in autocommit mode. A partition whose concurrent
+    detach was interrupted (``detach_pending``) can only be finalized.
+    """
+    mode = "FINALIZE" if detach_pending else "CONCURRENTLY"
+    await connection.execute(
+        text(f"ALTER TABLE {table} DETACH PARTITION {partition} {mode}")
+    )
+    await connection.execute(text(f"DROP TABLE {partition}"))
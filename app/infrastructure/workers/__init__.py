@@ -1,10 +1,19 @@
+from app.infrastructure.workers.catalog_warmup_worker import \
+    CatalogWarmupWorker
 from app.infrastructure.workers.inbox_worker import InboxWorker
 from app.infrastructure.workers.outbox_worker import (
     OutboxNotificationsWorker, OutboxPaymentsWorker, OutboxShippingWorker)
+from app.infrastructure.workers.partition_maintenance_worker import (
+    PartitionMaintenanceWorker, premake_partitions)
+from app.infrastructure.workers.wakeup import PgWakeupListener
 
 __all__ = [
     "OutboxPaymentsWorker",
     "OutboxNotificationsWorker",
     "OutboxShippingWorker",
     "InboxWorker",
+    "CatalogWarmupWorker",
+    "PartitionMaintenanceWorker",
+    "PgWakeupListener",
+    "premake_partitions",
 ]
@@ -0,0 +1,165 @@
+import asyncio
+import time
+from typing import Sequence
+
+from app.application.dto import DispatchResult
+from app.application.interfaces import UnitOfWorkProtocol
+from app.infrastructure.config.database import Database
+from app.infrastructure.config.logging import get_logger
+from app.infrastructure.config.workers import WorkerSettings
+from app.infrastructure.uow import UnitOfWork
+from app.infrastructure.workers.scheduler import AdaptiveScheduler
+from app.infrastructure.workers.sharding import build_shard_assignment
+from app.infrastructure.workers.wakeup import (PgWakeupListener,
+                                               WakeupSubscription)
+
+logger = get_logger(__name__)
+
+
+class StoppableWorker:
+    """Base for workers that stop cooperatively.
+
+    ``shutdown`` asks ``run`` to return once the current unit of work is
+    done rather than cancelling it halfway; ``sleep`` returns early when a
+    shutdown is requested.
+    """
+
+    def __init__(self):
+        self._stopping = asyncio.Event()
+
+    @property
+    def stopping(self) -> bool:
+        return self._stopping.is_set()
+
+    def shutdown(self) -> None:
+        self._stopping.set()
+
+    async def sleep(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except TimeoutError:
+            pass
+
+
+class PollingWorker(StoppableWorker):
+    """Runs ``process`` whenever its channels are notified or the pause chosen
+    by its ``AdaptiveScheduler`` elapses, whichever comes first.
+
+    ``process`` returns the dispatch result of the batch it claimed, or
+    ``None`` if it does not claim batches; such workers simply wait
+    ``poll_interval`` between runs. With outbox sharding enabled, only the
+    partitions currently owned by this replica of ``shard_group`` are passed
+    to ``process``; workers without a ``shard_group`` always get ``None``.
+    Copies of a worker in one process split its partitions, see
+    ``set_copy``. After ``shutdown`` no further batch is claimed.
+    """
+
+    channels: tuple[str, ...] = ()
+    shard_group: str | None = None
+
+    def __init__(
+        self, database: Database, settings: WorkerSettings, wakeup: PgWakeupListener
+    ):
+        super().__init__()
+        self.database = database
+        self.settings = settings
+        self.wakeup = wakeup
+        self._subscription: WakeupSubscription | None = None
+        self.scheduler = AdaptiveScheduler(
+            batch_size=settings.outbox_batch_size,
+            min_batch_size=settings.outbox_min_batch_size,
+            max_batch_size=settings.outbox_max_batch_size,
+            target_cycle_seconds=settings.outbox_target_cycle_seconds,
+            min_interval=settings.poll_min_interval,
+            max_interval=settings.poll_interval,
+        )
+        self.shards = build_shard_assignment(
+            database=database, settings=settings, shard_group=self.shard_group
+        )
+
+    def set_copy(self, copy: int, copies: int) -> None:
+        """Make this copy ``copy`` out of the ``copies`` of the worker in the
+        process, so each copy polls its own share of the partitions."""
+        self.shards = build_shard_assignment(
+            database=self.database,
+            settings=self.settings,
+            shard_group=self.shard_group,
+            copy=copy,
+            copies=copies,
+        )
+
+    async def run(self):
+        channels = self.channels if self.settings.listen_enabled else ()
+        self._subscription = self.wakeup.subscribe(channels)
+        try:
+            while not self.stopping:
+                delay = await self._run_once()
+                if delay > 0 and not self.stopping:
+                    await self._subscription.wait(timeout=delay)
+        finally:
+            self._subscription.close()
+            self._subscription = None
+            if self.shards is not None:
+                await self.shards.leave()
+
+    def shutdown(self) -> None:
+        super().shutdown()
+        if self._subscription is not None:
+            self._subscription.notify()
+
+    async def _run_once(self) -> float:
+        partitions = None
+        if self.shards is not None:
+            partitions = await self.shards.current()
+        session = self.database.create_session()
+        started = time.monotonic()
+        try:
+            result = await self.process(
+                uow=UnitOfWork(session=session),
+                batch_size=self.scheduler.batch_size,
+                partitions=partitions,
+            )
+        except BaseException:
+            # Also on cancellation, so the connection goes back to the pool.
+            await session.close()
+            raise
+        if result is None:
+            return self.settings.poll_interval
+        return self.scheduler.record(
+            claimed=result.claimed, elapsed=time.monotonic() - started
+        )
+
+    async def process(
+        self,
+        uow: UnitOfWorkProtocol,
+        batch_size: int,
+        partitions: Sequence[int] | None,
+    ) -> DispatchResult | None:
+        raise NotImplementedError("Subclasses must implement process method")
+
+    def log_result(self, result: DispatchResult) -> None:
+        retried = len(result.failed) - len(result.dead_lettered)
+        if retried or result.held_back:
+            logger.warning(
+                "Outbox events not delivered, scheduled for retry",
+                worker=type(self).__name__,
+                sent=len(result.sent),
+                failed=retried,
+                held_back=len(result.held_back),
+                errors={
+                    str(event_id): error for event_id, error in result.failed.items()
+                },
+            )
+        if result.dead_lettered:
+            logger.error(
+                "Outbox events moved to dead letter after their last attempt",
+                worker=type(self).__name__,
+                dead_lettered=len(result.dead_lettered),
+                event_ids=[str(event_id) for event_id in result.dead_lettered],
+            )
+        if result.sent and not result.failed and not result.held_back:
+            logger.info(
+                "Outbox events delivered",
+                worker=type(self).__name__,
+                sent=len(result.sent),
+            )
@@ -0,0 +1,51 @@
+from app.application.use_cases import WarmCatalogCacheUseCase
+from app.infrastructure.adapters import CatalogService
+from app.infrastructure.config.database import Database
+from app.infrastructure.config.logging import get_logger
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.uow import UnitOfWork
+from app.infrastructure.workers.base import StoppableWorker
+
+logger = get_logger(__name__)
+
+
+class CatalogWarmupWorker(StoppableWorker):
+    """Keeps the most-ordered items in the catalog cache.
+
+    Runs once at startup and then every ``interval`` seconds. The items are
+    written to every cache tier, so API instances sharing the Redis tier
+    start warm too. Without Redis the worker's own in-process cache is the
+    only one it could fill, so it idles until shut down instead.
+    """
+
+    def __init__(
+        self, database: Database, catalog_service: CatalogService, settings: Settings
+    ):
+        super().__init__()
+        self.database = database
+        self.catalog_service = catalog_service
+        self.top_n = settings.catalog_warmup_top_n
+        self.interval = settings.catalog_warmup_interval
+        self.enabled = bool(settings.redis_host)
+
+    async def run(self):
+        if not self.enabled:
+            logger.warning(
+                "Catalog cache warmup disabled: REDIS_HOST is not set, so no "
+                "API instance could read the warmed items"
+            )
+            await self._stopping.wait()
+            return None
+        while not self.stopping:
+            session = self.database.create_session()
+            uow = UnitOfWork(session=session)
+            use_case = WarmCatalogCacheUseCase(
+                uow=uow, catalog_service=self.catalog_service, top_n=self.top_n
+            )
+            try:
+                warmed = await use_case()
+                logger.info("Catalog cache warmed", items=warmed, top_n=self.top_n)
+            except Exception as e:
+                # A cold cache is only slower, so keep the worker alive.
+                logger.warning("Catalog cache warmup failed", error=str(e))
+            await self.sleep(self.interval)
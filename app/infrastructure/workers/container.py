@@ -2,29 +2,37 @@ from dishka import make_async_container
 
 from app.infrastructure.ioc_container.providers import (
     ApplicationSettingsProvider, AppNotificationsServiceProvider,
-    AppPaymentsServiceProvider, DatabaseProvider, DatabaseSessionProvider,
+    AppPaymentsServiceProvider, CatalogCacheProvider, CatalogServiceProvider,
+    CatalogWarmupWorkerProvider, DatabaseProvider, DatabaseSessionProvider,
     HTTPClientProvider, HTTPClientSettingsProvider, InboxWorkerProvider,
     KafkaConfigProvider, KafkaConsumerProvider, KafkaProducerProvider,
     OutboxNotificationsWorkerProvider, OutboxPaymentsWorkerProvider,
-    OutboxShippingWorkerProvider, ShippingResponseUseCaseProvider,
-    UnitOfWorkProvider)
+    OutboxShippingWorkerProvider, PartitionMaintenanceWorkerProvider,
+    ShippingResponseUseCaseProvider, UnitOfWorkProvider,
+    WakeupListenerProvider, WorkerSettingsProvider)
 
 
 def create_workers_container():
     return make_async_container(
         ApplicationSettingsProvider(),
         HTTPClientSettingsProvider(),
+        WorkerSettingsProvider(),
         DatabaseProvider(),
         HTTPClientProvider(),
         AppPaymentsServiceProvider(),
         AppNotificationsServiceProvider(),
+        CatalogCacheProvider(),
+        CatalogServiceProvider(),
+        CatalogWarmupWorkerProvider(),
         KafkaConfigProvider(),
         KafkaProducerProvider(),
         KafkaConsumerProvider(),
+        WakeupListenerProvider(),
         InboxWorkerProvider(),
         OutboxPaymentsWorkerProvider(),
         OutboxNotificationsWorkerProvider(),
         OutboxShippingWorkerProvider(),
+        PartitionMaintenanceWorkerProvider(),
         ShippingResponseUseCaseProvider(),
         UnitOfWorkProvider(),
         DatabaseSessionProvider(),
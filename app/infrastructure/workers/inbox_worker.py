@@ -1,27 +1,24 @@
-import asyncio
+from typing import Sequence
 
+from app.application.enums.events import EventTypeEnum
+from app.application.interfaces import UnitOfWorkProtocol
 from app.application.use_cases.update_status import UpdateOrderStatusUseCase
-from app.infrastructure.config.database import Database
-from app.infrastructure.uow import UnitOfWork
+from app.infrastructure.repositories.channels import inbox_channel
+from app.infrastructure.workers.base import PollingWorker
 
 
-class InboxWorker:
-    def __init__(
-        self,
-        database: Database,
-    ):
-        self.database = database
+class InboxWorker(PollingWorker):
+    channels = (
+        inbox_channel(EventTypeEnum.ORDER_PAID),
+        inbox_channel(EventTypeEnum.ORDER_SHIPPED),
+        inbox_channel(EventTypeEnum.ORDER_CANCELLED),
+    )
 
-    async def run(self):
-        while True:
-            session = self.database.create_session()
-            try:
-                uow = UnitOfWork(session=session)
-                use_case = UpdateOrderStatusUseCase(uow=uow)
-                await use_case()
-            except Exception:
-                if not session.close:
-                    await session.rollback()
-                    await session.close()
-                raise
-            await asyncio.sleep(5)
+    async def process(
+        self,
+        uow: UnitOfWorkProtocol,
+        batch_size: int,
+        partitions: Sequence[int] | None,
+    ) -> None:
+        use_case = UpdateOrderStatusUseCase(uow=uow)
+        await use_case()
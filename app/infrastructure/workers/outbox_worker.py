@@ -1,81 +1,121 @@
-import asyncio
+from typing import Sequence
 
+from app.application.dto import DispatchResult
+from app.application.enums.events import EventTypeEnum
+from app.application.interfaces import UnitOfWorkProtocol
 from app.application.use_cases import (CreatePaymentUseCase,
                                        RegisterShippingUseCase,
                                        SendNotificationUseCase)
+from app.application.use_cases.send_notification import \
+    NOTIFICATION_EVENT_TYPES
 from app.infrastructure.adapters import NotificationsService, PaymentsService
 from app.infrastructure.broker.producer import KafkaProducer
 from app.infrastructure.config.database import Database
-from app.infrastructure.uow import UnitOfWork
+from app.infrastructure.config.workers import WorkerSettings
+from app.infrastructure.repositories.channels import outbox_channel
+from app.infrastructure.workers.base import PollingWorker
+from app.infrastructure.workers.wakeup import PgWakeupListener
 
 
-class OutboxPaymentsWorker:
+class OutboxPaymentsWorker(PollingWorker):
+    channels = (outbox_channel(EventTypeEnum.PAYMENT_REQUESTED),)
+    shard_group = "payments"
+
     def __init__(
         self,
         database: Database,
         payments_service: PaymentsService,
+        settings: WorkerSettings,
+        wakeup: PgWakeupListener,
     ):
-        self.database = database
+        super().__init__(database=database, settings=settings, wakeup=wakeup)
         self.payments_service = payments_service
 
-    async def run(self):
-        while True:
-            session = self.database.create_session()
-            try:
-                uow = UnitOfWork(session=session)
-                use_case = CreatePaymentUseCase(
-                    uow=uow, payments_service=self.payments_service
-                )
-                await use_case()
-            except Exception:
-                if not session.close:
-                    await session.rollback()
-                    await session.close()
-                raise
-            await asyncio.sleep(5)
+    async def process(
+        self,
+        uow: UnitOfWorkProtocol,
+        batch_size: int,
+        partitions: Sequence[int] | None,
+    ) -> DispatchResult:
+        use_case = CreatePaymentUseCase(
+            uow=uow,
+            payments_service=self.payments_service,
+            lease_owner=self.settings.worker_id,
+            batch_size=batch_size,
+            partitions=partitions,
+            lease_seconds=self.settings.outbox_lease_seconds,
+            retry_policy=self.settings.outbox_retry_policy,
+            concurrency=self.settings.outbox_dispatch_concurrency,
+        )
+        result = await use_case()
+        self.log_result(result)
+        return result
+
 
+class OutboxNotificationsWorker(PollingWorker):
+    channels = tuple(
+        outbox_channel(event_type) for event_type in NOTIFICATION_EVENT_TYPES
+    )
+    shard_group = "notifications"
 
-class OutboxNotificationsWorker:
     def __init__(
         self,
         database: Database,
         notifications_service: NotificationsService,
+        settings: WorkerSettings,
+        wakeup: PgWakeupListener,
     ):
-        self.database = database
+        super().__init__(database=database, settings=settings, wakeup=wakeup)
         self.notifications_service = notifications_service
 
-    async def run(self):
-        while True:
-            session = self.database.create_session()
-            try:
-                uow = UnitOfWork(session=session)
-                use_case = SendNotificationUseCase(
-                    uow=uow, notification_service=self.notifications_service
-                )
-                await use_case()
-            except Exception:
-                if not session.close:
-                    await session.rollback()
-                    await session.close()
-                raise
-            await asyncio.sleep(5)
+    async def process(
+        self,
+        uow: UnitOfWorkProtocol,
+        batch_size: int,
+        partitions: Sequence[int] | None,
+    ) -> DispatchResult:
+        use_case = SendNotificationUseCase(
+            uow=uow,
+            notification_service=self.notifications_service,
+            lease_owner=self.settings.worker_id,
+            batch_size=batch_size,
+            partitions=partitions,
+            lease_seconds=self.settings.outbox_lease_seconds,
+            retry_policy=self.settings.outbox_retry_policy,
+            concurrency=self.settings.outbox_dispatch_concurrency,
+        )
+        result = await use_case()
+        self.log_result(result)
+        return result
+
 
+class OutboxShippingWorker(PollingWorker):
+    channels = (outbox_channel(EventTypeEnum.SHIPPING_REQUESTED),)
+    shard_group = "shipping"
 
-class OutboxShippingWorker:
-    def __init__(self, database: Database, broker: KafkaProducer):
-        self.database = database
+    def __init__(
+        self,
+        database: Database,
+        broker: KafkaProducer,
+        settings: WorkerSettings,
+        wakeup: PgWakeupListener,
+    ):
+        super().__init__(database=database, settings=settings, wakeup=wakeup)
         self.broker = broker
 
-    async def run(self):
-        while True:
-            session = self.database.create_session()
-            try:
-                uow = UnitOfWork(session=session)
-                use_case = RegisterShippingUseCase(uow=uow, broker=self.broker)
-                await use_case()
-            except Exception:
-                if not session.close:
-                    await session.rollback()
-                    await session.close()
-                raise
-            await asyncio.sleep(5)
+    async def process(
+        self,
+        uow: UnitOfWorkProtocol,
+        batch_size: int,
+        partitions: Sequence[int] | None,
+    ) -> DispatchResult:
+        use_case = RegisterShippingUseCase(
+            uow=uow,
+            broker=self.broker,
+            lease_owner=self.settings.worker_id,
+            batch_size=batch_size,
+            partitions=partitions,
+            lease_seconds=self.settings.outbox_lease_seconds,
+            retry_policy=self.settings.outbox_retry_policy,
+        )
+        return await use_case()
@@ -0,0 +1,158 @@
+from datetime import UTC, date, datetime, timedelta
+
+from app.infrastructure.config.database import Database
+from app.infrastructure.config.logging import get_logger
+from app.infrastructure.config.workers import WorkerSettings
+from app.infrastructure.models import (InboxEventStatusEnum,
+                                       OutboxEventStatusEnum)
+from app.infrastructure.repositories.partitions import (
+    PartitionRepository, detach_and_drop_partition)
+from app.infrastructure.workers.base import StoppableWorker
+
+logger = get_logger(__name__)
+
+PARTITIONED_TABLES = ("outbox", "inbox")
+
+
+async def premake_partitions(
+    database: Database, premake_days: int, min_runway_days: int
+) -> None:
+    """Create the next ``premake_days`` days of ``outbox`` and ``inbox``
+    partitions that do not exist yet.
+
+    Never raises: a failure is logged, and an error is logged whenever a
+    table has fewer than ``min_runway_days`` days of partitions left, since
+    its inserts fail once they are used up.
+    """
+    today = datetime.now(UTC).date()
+    for table in PARTITIONED_TABLES:
+        try:
+            await _create_upcoming(database, table, today, premake_days)
+        except Exception as e:
+            logger.warning("Creating partitions failed", table=table, error=str(e))
+        try:
+            runway = await _runway_days(database, table, today)
+        except Exception as e:
+            logger.warning("Checking partitions failed", table=table, error=str(e))
+            continue
+        if runway is not None and runway < min_runway_days:
+            logger.error(
+                "Partitions running out, inserts fail once they are used up",
+                table=table,
+                days_left=runway,
+            )
+
+
+async def _create_upcoming(
+    database: Database, table: str, today: date, premake_days: int
+) -> None:
+    async with database.get_session() as session:
+        partitions = await PartitionRepository(session=session).get_partitions(table)
+    bounded = [p.upper for p in partitions if p.upper is not None]
+    if len(bounded) < len(partitions):
+        return None  # an unbounded partition already takes every new row
+    # Partitions are contiguous, so only extend past the last one.
+    day = max(today, max(bounded).date()) if bounded else today
+    while day < today + timedelta(days=premake_days):
+        async with database.get_session() as session:
+            name = await PartitionRepository(session=session).create_partition(
+                table, day
+            )
+        if name is not None:
+            logger.info("Partition created", table=table, partition=name)
+        day += timedelta(days=1)
+
+
+async def _runway_days(database: Database, table: str, today: date) -> int | None:
+    """Days from ``today`` covered by partitions; ``None`` if unbounded."""
+    async with database.get_session() as session:
+        partitions = await PartitionRepository(session=session).get_partitions(table)
+    if any(p.upper is None for p in partitions):
+        return None
+    if not partitions:
+        return 0
+    return max(0, (max(p.upper for p in partitions).date() - today).days)
+
+
+class PartitionMaintenanceWorker(StoppableWorker):
+    """Keeps the daily ``outbox`` and ``inbox`` partitions in shape.
+
+    Runs at startup and then every ``interval`` seconds. Partitions for the
+    next ``premake_days`` days are created ahead of time, and a partition
+    whose day ended more than the table's retention ago is detached and
+    dropped once all of its events are finished. Dead letters and pending
+    events keep their own partition alive, but not the later ones.
+    """
+
+    def __init__(self, database: Database, settings: WorkerSettings):
+        super().__init__()
+        self.database = database
+        self.premake_days = settings.partition_premake_days
+        self.min_runway_days = settings.partition_min_runway_days
+        self.interval = settings.partition_maintenance_interval
+        self.inbox_retention = timedelta(days=settings.inbox_retention_days)
+        self.tables = (
+            (
+                "outbox",
+                OutboxEventStatusEnum.SENT,
+                timedelta(days=settings.outbox_retention_days),
+            ),
+            ("inbox", InboxEventStatusEnum.PROCESSED, self.inbox_retention),
+        )
+
+    async def run(self):
+        while not self.stopping:
+            try:
+                await self.maintain()
+            except Exception as e:
+                # Partitions are premade days ahead, so a failed run is not
+                # urgent; try again on the next one.
+                logger.warning("Partition maintenance failed", error=str(e))
+            await self.sleep(self.interval)
+
+    async def maintain(self) -> None:
+        await premake_partitions(self.database, self.premake_days, self.min_runway_days)
+        now = datetime.now(UTC)
+        for table, finished_status, retention in self.tables:
+            await self._drop_expired(table, finished_status, cutoff=now - retention)
+        async with self.database.get_session() as session:
+            deleted = await PartitionRepository(
+                session=session
+            ).delete_idempotency_keys_before(now - self.inbox_retention)
+        if deleted:
+            logger.info("Old inbox idempotency keys deleted", keys=deleted)
+
+    async def _drop_expired(
+        self, table: str, finished_status: str, cutoff: datetime
+    ) -> None:
+        async with self.database.get_session() as session:
+            repository = PartitionRepository(session=session)
+            expired = []
+            for partition in await repository.get_partitions(table):
+                if partition.detach_pending:
+                    # Its rows were finished when the interrupted detach began.
+                    expired.append(partition)
+                    continue
+                if partition.upper is None or partition.upper > cutoff:
+                    break
+                if await repository.has_unfinished_rows(
+                    partition.name, finished_status
+                ):
+                    logger.warning(
+                        "Expired partition kept for its unfinished events",
+                        table=table,
+                        partition=partition.name,
+                    )
+                    continue
+                expired.append(partition)
+        if not expired:
+            return None
+        async with self.database.engine.connect() as connection:
+            connection = await connection.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+            for partition in expired:
+                await detach_and_drop_partition(
+                    connection, table, partition.name, partition.detach_pending
+                )
+                logger.info("Partition dropped", table=table, partition=partition.name)
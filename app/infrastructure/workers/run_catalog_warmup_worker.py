@@ -0,0 +1,20 @@
+import asyncio
+import sys
+
+from app.infrastructure.config.logging import get_logger
+from app.infrastructure.config.workers import WorkerNameEnum
+from app.infrastructure.workers.run_workers import main
+
+logger = get_logger(__name__)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main({WorkerNameEnum.CATALOG_WARMUP: 1}))
+    except KeyboardInterrupt:
+        sys.exit(0)
+    except Exception as e:
+        logger.error(
+            "Failed to start worker", worker="CatalogWarmupWorker", error=str(e)
+        )
+        sys.exit(1)
@@ -0,0 +1,30 @@
+import asyncio
+import sys
+
+from app.infrastructure.config.logging import get_logger
+from app.infrastructure.config.workers import WorkerSettings
+from app.infrastructure.workers.supervisor import (WorkerSupervisor,
+                                                   plan_processes)
+
+logger = get_logger(__name__)
+
+
+async def main():
+    settings = WorkerSettings()
+    supervisor = WorkerSupervisor(
+        specs=plan_processes(settings),
+        restart_delay=settings.worker_restart_delay,
+        max_restart_delay=settings.worker_max_restart_delay,
+        stop_timeout=settings.worker_stop_timeout,
+    )
+    await supervisor.run()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        sys.exit(0)
+    except Exception as e:
+        logger.error("Failed to start worker supervisor", error=str(e))
+        sys.exit(1)
@@ -0,0 +1,36 @@
+import asyncio
+import sys
+from typing import Mapping
+
+from app.infrastructure.config.logging import get_logger
+from app.infrastructure.config.workers import WorkerNameEnum, WorkerSettings
+from app.infrastructure.workers.container import create_workers_container
+from app.infrastructure.workers.runtime import WorkerRuntime
+
+logger = get_logger(__name__)
+
+
+async def main(copies: Mapping[WorkerNameEnum, int] | None = None):
+    container = create_workers_container()
+    try:
+        settings = await container.get(WorkerSettings)
+        runtime = WorkerRuntime(
+            container=container,
+            copies=settings.worker_copies if copies is None else copies,
+            restart_delay=settings.worker_restart_delay,
+            max_restart_delay=settings.worker_max_restart_delay,
+            drain_timeout=settings.worker_drain_timeout,
+        )
+        await runtime.run()
+    finally:
+        await container.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        sys.exit(0)
+    except Exception as e:
+        logger.error("Failed to start workers", error=str(e))
+        sys.exit(1)
@@ -0,0 +1,140 @@
+import asyncio
+import signal
+import time
+from typing import Mapping, Protocol
+
+from dishka import AsyncContainer
+
+from app.infrastructure.broker.consumer import KafkaConsumer
+from app.infrastructure.config.logging import get_logger
+from app.infrastructure.config.workers import WorkerNameEnum
+from app.infrastructure.workers.base import PollingWorker
+from app.infrastructure.workers.catalog_warmup_worker import \
+    CatalogWarmupWorker
+from app.infrastructure.workers.inbox_worker import InboxWorker
+from app.infrastructure.workers.outbox_worker import (
+    OutboxNotificationsWorker, OutboxPaymentsWorker, OutboxShippingWorker)
+from app.infrastructure.workers.partition_maintenance_worker import \
+    PartitionMaintenanceWorker
+
+logger = get_logger(__name__)
+
+
+class Worker(Protocol):
+    async def run(self) -> None: ...
+    def shutdown(self) -> None: ...
+
+
+WORKER_TYPES: dict[WorkerNameEnum, type[Worker]] = {
+    WorkerNameEnum.KAFKA_CONSUMER: KafkaConsumer,
+    WorkerNameEnum.INBOX: InboxWorker,
+    WorkerNameEnum.OUTBOX_PAYMENTS: OutboxPaymentsWorker,
+    WorkerNameEnum.OUTBOX_NOTIFICATIONS: OutboxNotificationsWorker,
+    WorkerNameEnum.OUTBOX_SHIPPING: OutboxShippingWorker,
+    WorkerNameEnum.CATALOG_WARMUP: CatalogWarmupWorker,
+    WorkerNameEnum.PARTITION_MAINTENANCE: PartitionMaintenanceWorker,
+}
+
+
+class WorkerRuntime:
+    """Runs several workers as tasks of one event loop.
+
+    Every copy of a worker is resolved in its own request scope of
+    ``container``, so all of them share the APP-scoped database engine,
+    HTTP client pool and LISTEN connection. A copy that crashes (or returns)
+    is restarted after ``restart_delay`` seconds, doubled on every further
+    crash up to ``max_restart_delay`` and reset once the copy has stayed up
+    that long. Copies of a sharded worker split its partitions between
+    them. On SIGTERM or SIGINT every worker is asked to shut down:
+    it stops taking new work and finishes what it holds. Workers still busy
+    after ``drain_timeout`` seconds are cancelled; outbox workers then
+    release the leases of the events they did not get to.
+    """
+
+    def __init__(
+        self,
+        container: AsyncContainer,
+        copies: Mapping[WorkerNameEnum, int],
+        restart_delay: float,
+        max_restart_delay: float,
+        drain_timeout: float,
+    ):
+        self.container = container
+        self.copies = copies
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.drain_timeout = drain_timeout
+        self._stopping = asyncio.Event()
+        self._workers: dict[tuple[WorkerNameEnum, int], Worker] = {}
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, self.stop)
+        tasks = [
+            asyncio.create_task(self._supervise(name, copy), name=f"{name}-{copy}")
+            for name, count in self.copies.items()
+            for copy in range(count)
+        ]
+        logger.info(
+            "Workers started",
+            workers={name.value: count for name, count in self.copies.items()},
+        )
+        try:
+            await self._stopping.wait()
+        finally:
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                loop.remove_signal_handler(signum)
+            logger.info("Draining workers", tasks=len(tasks))
+            for worker in self._workers.values():
+                worker.shutdown()
+            _, pending = await asyncio.wait(tasks, timeout=self.drain_timeout)
+            if pending:
+                logger.warning(
+                    "Workers did not drain in time, cancelling them",
+                    workers=sorted(task.get_name() for task in pending),
+                )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info("Workers stopped")
+
+    async def _supervise(self, name: WorkerNameEnum, copy: int) -> None:
+        delay = self.restart_delay
+        while not self._stopping.is_set():
+            started = time.monotonic()
+            try:
+                async with self.container() as request_container:
+                    worker = await request_container.get(WORKER_TYPES[name])
+                    if isinstance(worker, PollingWorker):
+                        worker.set_copy(copy, self.copies[name])
+                    self._workers[name, copy] = worker
+                    if self._stopping.is_set():
+                        worker.shutdown()
+                    try:
+                        await worker.run()
+                    finally:
+                        del self._workers[name, copy]
+                if self._stopping.is_set():
+                    return None
+                error = "worker returned"
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error = str(e)
+            if time.monotonic() - started >= self.max_restart_delay:
+                delay = self.restart_delay
+            logger.error(
+                "Worker stopped unexpectedly",
+                worker=name.value,
+                copy=copy,
+                error=error,
+                restart_in=delay,
+            )
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+            except TimeoutError:
+                delay = min(delay * 2, self.max_restart_delay)
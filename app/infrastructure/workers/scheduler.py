@@ -0,0 +1,54 @@
+class AdaptiveScheduler:
+    """Chooses the next batch size and the pause before the next poll.
+
+    - A full batch means a backlog: poll again immediately, resizing the
+      batch so that one cycle takes about ``target_cycle_seconds``.
+    - An empty batch doubles the pause, from ``min_interval`` up to
+      ``max_interval``.
+    - A partial batch means the backlog is drained: reset the pause to
+      ``min_interval``.
+    """
+
+    MAX_RESIZE_FACTOR = 2.0
+
+    def __init__(
+        self,
+        batch_size: int,
+        min_batch_size: int,
+        max_batch_size: int,
+        target_cycle_seconds: float,
+        min_interval: float,
+        max_interval: float,
+    ):
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.batch_size = self._clamp_batch_size(batch_size)
+        self.target_cycle_seconds = target_cycle_seconds
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._idle_interval = min_interval
+
+    def record(self, claimed: int, elapsed: float) -> float:
+        """Record one cycle and return the seconds to wait before the next."""
+        if claimed == 0:
+            delay = self._idle_interval
+            self._idle_interval = min(self._idle_interval * 2, self.max_interval)
+            return delay
+
+        self._idle_interval = self.min_interval
+        if claimed < self.batch_size:
+            return self.min_interval
+
+        self._resize(elapsed)
+        return 0.0
+
+    def _resize(self, elapsed: float) -> None:
+        if elapsed <= 0:
+            factor = self.MAX_RESIZE_FACTOR
+        else:
+            factor = self.target_cycle_seconds / elapsed
+        factor = max(1 / self.MAX_RESIZE_FACTOR, min(factor, self.MAX_RESIZE_FACTOR))
+        self.batch_size = self._clamp_batch_size(round(self.batch_size * factor))
+
+    def _clamp_batch_size(self, batch_size: int) -> int:
+        return max(self.min_batch_size, min(batch_size, self.max_batch_size))
@@ -0,0 +1,136 @@
+import time
+import zlib
+
+from app.infrastructure.config.database import Database
+from app.infrastructure.config.logging import get_logger
+from app.infrastructure.config.workers import ShardingModeEnum, WorkerSettings
+from app.infrastructure.models import OUTBOX_PARTITIONS
+from app.infrastructure.repositories.outbox_shard import OutboxShardRepository
+
+logger = get_logger(__name__)
+
+
+class StaticShardAssignment:
+    """Owns the partitions ``p`` with ``p % shard_count == shard_index``.
+
+    Those are split between the ``copies`` of the worker in the process,
+    every ``copies``-th one going to ``copy``.
+    """
+
+    def __init__(
+        self, shard_index: int, shard_count: int, copy: int = 0, copies: int = 1
+    ):
+        self._partitions = [
+            partition
+            for partition in range(OUTBOX_PARTITIONS)
+            if partition % shard_count == shard_index
+        ][copy::copies]
+
+    async def current(self) -> list[int]:
+        return self._partitions
+
+    async def leave(self) -> None:
+        return None
+
+
+class CoordinatedShardAssignment:
+    """Shares partitions between the replicas registered in Postgres.
+
+    Replicas of the same worker type form a ``shard_group``. Each replica
+    heartbeats a row in ``outbox_shard_members`` and assigns
+    every partition to the live member with the highest hash of
+    ``(member, partition)`` (rendezvous hashing), so a replica joining or
+    leaving only moves its own share of partitions. Every copy of a worker
+    is a member of its own. While views of the
+    membership briefly disagree two replicas may poll the same partition;
+    outbox leases still keep each event with a single worker.
+    """
+
+    def __init__(
+        self, database: Database, shard_group: str, worker_id: str, member_ttl: float
+    ):
+        self.database = database
+        self.shard_group = shard_group
+        self.worker_id = worker_id
+        self.member_ttl = member_ttl
+        self._partitions: list[int] = []
+        self._members: list[str] = []
+        self._next_heartbeat = 0.0
+
+    async def current(self) -> list[int]:
+        if time.monotonic() >= self._next_heartbeat:
+            await self._refresh()
+        return self._partitions
+
+    async def leave(self) -> None:
+        async with self.database.get_session() as session:
+            await OutboxShardRepository(session=session).leave(
+                shard_group=self.shard_group, worker_id=self.worker_id
+            )
+
+    async def _refresh(self) -> None:
+        async with self.database.get_session() as session:
+            repository = OutboxShardRepository(session=session)
+            await repository.heartbeat(
+                shard_group=self.shard_group,
+                worker_id=self.worker_id,
+                ttl_seconds=self.member_ttl,
+            )
+            members = await repository.get_live_members(shard_group=self.shard_group)
+        if self.worker_id not in members:
+            members.append(self.worker_id)
+        if members != self._members:
+            self._members = members
+            self._partitions = assign_partitions(self.worker_id, members)
+            logger.info(
+                "Outbox shard assignment changed",
+                shard_group=self.shard_group,
+                worker_id=self.worker_id,
+                members=len(members),
+                partitions=len(self._partitions),
+            )
+        # Heartbeat well within the TTL so a slow cycle does not drop us.
+        self._next_heartbeat = time.monotonic() + self.member_ttl / 3
+
+
+def assign_partitions(worker_id: str, members: list[str]) -> list[int]:
+    return [
+        partition
+        for partition in range(OUTBOX_PARTITIONS)
+        if max(members, key=lambda member: _weight(member, partition)) == worker_id
+    ]
+
+
+def _weight(member: str, partition: int) -> int:
+    return zlib.crc32(f"{member}:{partition}".encode())
+
+
+def build_shard_assignment(
+    database: Database,
+    settings: WorkerSettings,
+    shard_group: str | None,
+    copy: int = 0,
+    copies: int = 1,
+) -> StaticShardAssignment | CoordinatedShardAssignment | None:
+    """Shard assignment of copy ``copy`` out of the ``copies`` of a worker
+    running in this process; ``None`` if the worker is not sharded."""
+    if shard_group is None:
+        return None
+    if settings.sharding == ShardingModeEnum.STATIC:
+        return StaticShardAssignment(
+            shard_index=settings.shard_index,
+            shard_count=settings.shard_count,
+            copy=copy,
+            copies=copies,
+        )
+    if settings.sharding == ShardingModeEnum.COORDINATED:
+        worker_id = settings.worker_id
+        if copies > 1:
+            worker_id = f"{worker_id}-{copy}"
+        return CoordinatedShardAssignment(
+            database=database,
+            shard_group=shard_group,
+            worker_id=worker_id,
+            member_ttl=settings.shard_member_ttl,
+        )
+    return None
@@ -0,0 +1,163 @@
+import asyncio
+import os
+import signal
+import sys
+import time
+from dataclasses import dataclass
+
+from app.infrastructure.config.logging import get_logger
+from app.infrastructure.config.workers import (ShardingModeEnum,
+                                               WorkerNameEnum, WorkerSettings)
+
+logger = get_logger(__name__)
+
+RUN_WORKERS_MODULE = "app.infrastructure.workers.run_workers"
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerProcessSpec:
+    worker: WorkerNameEnum
+    index: int
+    shard_index: int
+    shard_count: int
+    worker_id: str
+    sharding: ShardingModeEnum
+    db_pool_size: int
+    db_max_overflow: int
+
+    def env(self) -> dict[str, str]:
+        env = {
+            **os.environ,
+            "WORKERS": self.worker.value,
+            # The supervisor checked its own WORKERS for partition_maintenance.
+            "PARTITION_MAINTENANCE_EXTERNAL": "true",
+            "WORKER_ID": self.worker_id,
+            # Every child has a pool of its own, so keep them small.
+            "DB_POOL_SIZE": str(self.db_pool_size),
+            "DB_MAX_OVERFLOW": str(self.db_max_overflow),
+        }
+        if self.sharding == ShardingModeEnum.STATIC:
+            env["WORKER_SHARD_INDEX"] = str(self.shard_index)
+            env["WORKER_SHARD_COUNT"] = str(self.shard_count)
+        return env
+
+
+def plan_processes(settings: WorkerSettings) -> list[WorkerProcessSpec]:
+    """One spec per worker process, with its shard among its worker type.
+
+    The shards of this replica (``WORKER_SHARD_INDEX`` out of
+    ``WORKER_SHARD_COUNT``) are split further between its processes, so
+    static sharding keeps working with several supervised replicas. Each
+    process gets a database pool of ``WORKER_PROCESS_DB_POOL_SIZE`` plus
+    ``WORKER_PROCESS_DB_MAX_OVERFLOW`` connections.
+    """
+    specs = []
+    for worker, count in settings.worker_process_counts.items():
+        for index in range(count):
+            specs.append(
+                WorkerProcessSpec(
+                    worker=worker,
+                    index=index,
+                    shard_index=settings.shard_index * count + index,
+                    shard_count=settings.shard_count * count,
+                    worker_id=f"{settings.worker_id}-{worker.value}-{index}",
+                    sharding=settings.sharding,
+                    db_pool_size=settings.worker_process_db_pool_size,
+                    db_max_overflow=settings.worker_process_db_max_overflow,
+                )
+            )
+    return specs
+
+
+class WorkerSupervisor:
+    """Runs each worker process of ``specs`` as a ``run_workers`` child.
+
+    A child that exits is started again after ``restart_delay`` seconds,
+    doubled on every further exit up to ``max_restart_delay`` and reset once
+    the child has stayed up that long. SIGTERM and SIGINT are forwarded to
+    the children as SIGTERM so they can drain; children still running after
+    ``stop_timeout`` seconds are killed.
+    """
+
+    def __init__(
+        self,
+        specs: list[WorkerProcessSpec],
+        restart_delay: float,
+        max_restart_delay: float,
+        stop_timeout: float,
+    ):
+        self.specs = specs
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.stop_timeout = stop_timeout
+        self._stopping = asyncio.Event()
+        self._processes: dict[WorkerProcessSpec, asyncio.subprocess.Process] = {}
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, self.stop)
+        tasks = [asyncio.create_task(self._supervise(spec)) for spec in self.specs]
+        try:
+            await self._stopping.wait()
+        finally:
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                loop.remove_signal_handler(signum)
+            logger.info("Stopping worker processes", processes=len(self._processes))
+            for process in self._processes.values():
+                self._signal(process, signal.SIGTERM)
+            _, pending = await asyncio.wait(tasks, timeout=self.stop_timeout)
+            for process in self._processes.values():
+                logger.warning("Killing worker process", pid=process.pid)
+                self._signal(process, signal.SIGKILL)
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.info("Worker processes stopped")
+
+    async def _supervise(self, spec: WorkerProcessSpec) -> None:
+        delay = self.restart_delay
+        while not self._stopping.is_set():
+            started = time.monotonic()
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", RUN_WORKERS_MODULE, env=spec.env()
+            )
+            self._processes[spec] = process
+            if self._stopping.is_set():
+                # Stopping began while the child was being spawned.
+                self._signal(process, signal.SIGTERM)
+            logger.info(
+                "Worker process started",
+                worker=spec.worker.value,
+                index=spec.index,
+                shard_index=spec.shard_index,
+                shard_count=spec.shard_count,
+                pid=process.pid,
+            )
+            try:
+                exit_code = await process.wait()
+            finally:
+                del self._processes[spec]
+            if self._stopping.is_set():
+                return None
+            if time.monotonic() - started >= self.max_restart_delay:
+                delay = self.restart_delay
+            logger.error(
+                "Worker process exited",
+                worker=spec.worker.value,
+                index=spec.index,
+                exit_code=exit_code,
+                restart_in=delay,
+            )
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+            except TimeoutError:
+                delay = min(delay * 2, self.max_restart_delay)
+
+    @staticmethod
+    def _signal(process: asyncio.subprocess.Process, signum: int) -> None:
+        try:
+            process.send_signal(signum)
+        except ProcessLookupError:
+            pass
@@ -0,0 +1,153 @@
+import asyncio
+from typing import Any, Iterable
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.infrastructure.config.database import Database
+from app.infrastructure.config.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class WakeupSubscription:
+    """One worker's interest in a set of NOTIFY channels."""
+
+    def __init__(self, listener: "PgWakeupListener", channels: Iterable[str]):
+        self.listener = listener
+        self.channels = frozenset(channels)
+        self._event = asyncio.Event()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for a notification; return ``False`` if ``timeout`` ran out."""
+        if self.channels:
+            await self.listener.ensure_listening()
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+        finally:
+            self._event.clear()
+        return True
+
+    def close(self) -> None:
+        self.listener.unsubscribe(self)
+
+    def notify(self) -> None:
+        self._event.set()
+
+
+class PgWakeupListener:
+    """Wakes polling workers when Postgres NOTIFYs one of their channels.
+
+    Holds a single dedicated connection per process that LISTENs on the
+    channels of every subscription, so workers running side by side share
+    it instead of each holding a connection of their own. A subscription's
+    ``wait`` returns as soon as one of its channels is notified, or after
+    ``timeout`` so the worker still polls if a notification is missed or the
+    listening connection is lost (it is re-established on the next ``wait``).
+    """
+
+    def __init__(self, database: Database):
+        self.database = database
+        self._subscriptions: set[WakeupSubscription] = set()
+        self._listening: frozenset[str] = frozenset()
+        self._lock = asyncio.Lock()
+        self._connection: AsyncConnection | None = None
+        self._driver_connection: Any = None
+        self._reader: asyncio.Task[None] | None = None
+
+    @property
+    def channels(self) -> frozenset[str]:
+        return frozenset().union(*(s.channels for s in self._subscriptions))
+
+    @property
+    def is_listening(self) -> bool:
+        driver = self._driver_connection
+        if driver is None:
+            return False
+        if self._reader is not None and self._reader.done():
+            return False
+        # asyncpg exposes is_closed(), psycopg a ``closed`` attribute.
+        if hasattr(driver, "is_closed"):
+            return not driver.is_closed()
+        return not driver.closed
+
+    def subscribe(self, channels: Iterable[str]) -> WakeupSubscription:
+        subscription = WakeupSubscription(self, channels)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: WakeupSubscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    async def ensure_listening(self) -> None:
+        async with self._lock:
+            channels = self.channels
+            if self.is_listening and channels <= self._listening:
+                return None
+            # Channels are only added when workers start, so reconnecting
+            # is simpler than issuing LISTEN on a connection mid-read.
+            await self._close()
+            if channels:
+                await self._start(channels)
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._close()
+
+    async def _start(self, channels: frozenset[str]) -> None:
+        try:
+            self._connection = await self.database.engine.connect()
+            raw = await self._connection.get_raw_connection()
+            self._driver_connection = raw.driver_connection
+            if hasattr(self._driver_connection, "add_listener"):
+                await self._listen_asyncpg(channels)
+            else:
+                await self._listen_psycopg(channels)
+        except Exception as e:
+            logger.warning(
+                "LISTEN unavailable, falling back to polling",
+                channels=sorted(channels),
+                error=str(e),
+            )
+            await self._close()
+            return None
+        self._listening = channels
+        logger.info("Listening for outbox/inbox wakeups", channels=sorted(channels))
+
+    async def _close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        if self._connection is not None:
+            try:
+                await self._connection.invalidate()
+                await self._connection.close()
+            except Exception as e:
+                logger.debug("Closing LISTEN connection failed", error=str(e))
+        self._connection = None
+        self._driver_connection = None
+        self._listening = frozenset()
+
+    def _on_notify(self, channel: str) -> None:
+        for subscription in self._subscriptions:
+            if channel in subscription.channels:
+                subscription.notify()
+
+    async def _listen_asyncpg(self, channels: frozenset[str]) -> None:
+        for channel in channels:
+            await self._driver_connection.add_listener(
+                channel, lambda _conn, _pid, name, _payload: self._on_notify(name)
+            )
+
+    async def _listen_psycopg(self, channels: frozenset[str]) -> None:
+        driver = self._driver_connection
+        await driver.set_autocommit(True)
+        for channel in channels:
+            await driver.execute(f'LISTEN "{channel}"')
+        self._reader = asyncio.create_task(self._read_psycopg_notifies())
+
+    async def _read_psycopg_notifies(self) -> None:
+        async for notify in self._driver_connection.notifies():
+            self._on_notify(notify.channel)
@@ -1,14 +1,44 @@
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+
 import uvicorn
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 
+from app.infrastructure.adapters import BaseHTTPXClient
+from app.infrastructure.config.database import Database
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.config.workers import WorkerSettings
 from app.infrastructure.ioc_container.container import container
+from app.infrastructure.workers import premake_partitions
+from app.presentation.api.v1.admin.router import router as admin_router
+from app.presentation.api.v1.healthcheck.router import \
+    router as healthcheck_router
 from app.presentation.api.v1.routers.router import router
 from app.presentation.exc_handlers import register_error_handlers
+from app.presentation.middlewares import RequestDeadlineMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    # Open the shared HTTP connection pool up front so the first order
+    # does not pay for it, and release every APP-scoped resource on shutdown.
+    await container.get(BaseHTTPXClient)
+    # Orders cannot be stored without today's outbox partition, so do not
+    # rely on the partition_maintenance worker alone to have created it.
+    worker_settings = await container.get(WorkerSettings)
+    await premake_partitions(
+        database=await container.get(Database),
+        premake_days=worker_settings.partition_premake_days,
+        min_runway_days=worker_settings.partition_min_runway_days,
+    )
+    yield
+    await container.close()
 
 
 def create_application() -> FastAPI:
     app = FastAPI(
+        lifespan=lifespan,
         root_path="/api",
         description="Orders API service",
         docs_url="/docs",
@@ -17,8 +47,11 @@ def create_application() -> FastAPI:
     )
 
     register_error_handlers(app=app)
+    app.add_middleware(RequestDeadlineMiddleware, budget=Settings().request_deadline)
     setup_dishka(container, app)
     app.include_router(router=router)
+    app.include_router(router=healthcheck_router)
+    app.include_router(router=admin_router)
     return app
 
 
@@ -0,0 +1,75 @@
+import secrets
+from typing import Annotated
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, Depends, Security, status
+from fastapi.security import APIKeyHeader
+
+from app.application.use_cases import RequeueDeadLettersUseCase
+from app.infrastructure.config.logging import get_logger
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.exceptions.http_exc import AdminAccessDeniedException
+from app.presentation.api.v1.schemas import (ApiResponseSchema,
+                                             RequeuedDeadLettersSchema,
+                                             RequeueDeadLettersSchema)
+
+logger = get_logger(__name__)
+
+admin_key_header = APIKeyHeader(name="X-Admin-Key", auto_error=False)
+
+
+@inject
+async def require_admin_key(
+    settings: FromDishka[Settings],
+    admin_key: Annotated[str | None, Security(admin_key_header)] = None,
+) -> None:
+    if not settings.admin_api_key:
+        raise AdminAccessDeniedException(reason="ADMIN_API_KEY is not configured")
+    if admin_key is None or not secrets.compare_digest(
+        admin_key.encode("utf-8"), settings.admin_api_key.encode("utf-8")
+    ):
+        raise AdminAccessDeniedException(reason="invalid X-Admin-Key header")
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=[
+        "v1 Admin",
+    ],
+    dependencies=[Depends(require_admin_key)],
+)
+
+
+@router.post(
+    path="/outbox/dead-letters/requeue",
+    summary="Requeue outbox dead letters",
+    description="""
+    Make outbox events that exhausted their delivery attempts pending again.
+
+    Events become dead letters after `OUTBOX_MAX_ATTEMPTS` failed deliveries.
+    Requeued events get a fresh attempt budget and are picked up by the
+    outbox workers right away. Requires the `X-Admin-Key` header to match
+    `ADMIN_API_KEY`; the endpoint is disabled while that is not set.
+
+    **Request Body Parameters (at least one):**
+    - `event_ids` (list of UUID, optional): Dead letters to requeue
+    - `event_type` (string, optional): Only requeue dead letters of this event type
+
+    **Response Body:**
+    - `requeued`: IDs of the outbox events that are pending again
+    """,
+    response_model=ApiResponseSchema[RequeuedDeadLettersSchema],
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def requeue_dead_letters(
+    request: RequeueDeadLettersSchema,
+    use_case: FromDishka[RequeueDeadLettersUseCase],
+):
+    requeued = await use_case(
+        event_ids=request.event_ids, event_type=request.event_type
+    )
+    logger.info("Outbox dead letters requeued", count=len(requeued))
+    return ApiResponseSchema(
+        data=RequeuedDeadLettersSchema(requeued=requeued), meta={}, errors=[]
+    )
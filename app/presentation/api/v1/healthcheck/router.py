@@ -0,0 +1,76 @@
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, status
+
+from app.infrastructure.adapters import BaseHTTPXClient, CatalogService
+from app.presentation.api.v1.schemas import ApiResponseSchema
+
+router = APIRouter(
+    prefix="/health",
+    tags=[
+        "v1 Health",
+    ],
+)
+
+
+@router.get(
+    path="/http-pool",
+    summary="Outgoing HTTP connection pool statistics",
+    description="""
+    Per-host statistics of the shared outgoing HTTP connection pool.
+
+    **Response Body:**
+    - `connections`: Connections currently held in the pool for the host
+    - `active_connections`: Connections serving a request right now
+    - `idle_connections`: Keep-alive connections waiting for reuse
+    - `requests_total`: Requests sent to the host since startup
+    - `requests_in_flight`: Requests to the host awaiting a response
+    """,
+    response_model=ApiResponseSchema[dict[str, dict[str, int]]],
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def http_pool_stats(client: FromDishka[BaseHTTPXClient]):
+    return ApiResponseSchema(data=client.pool_stats(), meta={}, errors=[])
+
+
+@router.get(
+    path="/circuit-breakers",
+    summary="State of the outgoing HTTP circuit breakers",
+    description="""
+    Current circuit breaker state per upstream host: `closed`, `open` or `half_open`.
+    """,
+    response_model=ApiResponseSchema[dict[str, str]],
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def circuit_breaker_states(client: FromDishka[BaseHTTPXClient]):
+    return ApiResponseSchema(data=client.circuit_states(), meta={}, errors=[])
+
+
+@router.get(
+    path="/catalog-cache",
+    summary="Catalog cache statistics",
+    description="""
+    Counters of the two-tier catalog item cache.
+
+    **Response Body:**
+    - `size`: Items currently held in the in-process tier
+    - `hits_local`: Lookups served by the in-process tier
+    - `hits_redis`: Lookups served by the Redis tier
+    - `hits_negative`: Lookups answered from the cached "item not found" results
+    - `misses`: Lookups that went to the Catalog service
+    - `evictions`: Items dropped from the in-process tier to respect its size limit
+    - `in_flight`: Catalog requests currently running
+    - `calls`: Catalog requests started on a cache miss
+    - `coalesced`: Lookups that joined an already running request for the same item
+    """,
+    response_model=ApiResponseSchema[dict[str, int]],
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def catalog_cache_stats(catalog: FromDishka[CatalogService]):
+    return ApiResponseSchema(
+        data={**catalog.cache.stats(), **catalog.in_flight.stats()},
+        meta={},
+        errors=[],
+    )
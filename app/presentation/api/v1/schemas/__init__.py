@@ -1,5 +1,7 @@
 from app.presentation.api.v1.schemas.order import (OrderRequestSchema,
                                                    OrderResponseSchema)
+from app.presentation.api.v1.schemas.outbox import (RequeuedDeadLettersSchema,
+                                                    RequeueDeadLettersSchema)
 from app.presentation.api.v1.schemas.payment import PaymentRequestSchema
 from app.presentation.api.v1.schemas.response import ApiResponseSchema
 
@@ -8,4 +10,6 @@ __all__ = [
     "OrderRequestSchema",
     "ApiResponseSchema",
     "PaymentRequestSchema",
+    "RequeueDeadLettersSchema",
+    "RequeuedDeadLettersSchema",
 ]
@@ -12,3 +12,12 @@ class PaymentStatusEnum(StrEnum):
     PENDING = "pending"
     SUCCEEDED = "succeeded"
     FAILED = "failed"
+
+
+class EventTypeEnum(StrEnum):
+    ORDER_CREATED = "order.created"
+    ORDER_CANCELLED = "order.cancelled"
+    ORDER_PAID = "order.paid"
+    ORDER_SHIPPED = "order.shipped"
+    PAYMENT_REQUESTED = "payment.requested"
+    SHIPPING_REQUESTED = "shipping.requested"
@@ -0,0 +1,36 @@
+from typing import Self
+from uuid import UUID
+
+from pydantic import BaseModel, Field, model_validator
+
+from .enums import EventTypeEnum
+
+
+class RequeueDeadLettersSchema(BaseModel):
+    event_ids: list[UUID] | None = Field(
+        default=None,
+        description="Dead letters to requeue",
+        examples=[
+            ["9a4f56ba-1979-4fd1-a16e-b0727c472173"],
+        ],
+    )
+    event_type: EventTypeEnum | None = Field(
+        default=None,
+        description="Only requeue dead letters of this event type",
+        examples=[
+            "payment.requested",
+        ],
+    )
+
+    @model_validator(mode="after")
+    def check_filter(self) -> Self:
+        if not self.event_ids and self.event_type is None:
+            raise ValueError("Pass event_ids, event_type or both")
+        return self
+
+
+class RequeuedDeadLettersSchema(BaseModel):
+    requeued: list[UUID] = Field(
+        ...,
+        description="IDs of the outbox events that are pending again",
+    )
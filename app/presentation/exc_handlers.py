@@ -5,6 +5,9 @@ from fastapi.responses import JSONResponse
 from app.core.exceptions.order import (ItemNotFoundError, NotEnoughStocksError,
                                        OrderAlreadyExistsError)
 from app.infrastructure.exceptions.cache_exc import CacheClientException
+from app.infrastructure.exceptions.http_exc import (AdminAccessDeniedException,
+                                                    CircuitOpenException,
+                                                    DeadlineExceededException)
 from app.infrastructure.exceptions.payment_exc import \
     PaymentServiceUnavailableException
 from app.presentation.api.v1.schemas.response import ApiResponseSchema
@@ -148,3 +151,69 @@ def register_error_handlers(app: FastAPI) -> None:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content=response_data.model_dump(),
         )
+
+    @app.exception_handler(CircuitOpenException)
+    async def circuit_open_handler(
+        request: Request, exc: CircuitOpenException
+    ) -> JSONResponse:
+        response_data = ApiResponseSchema(
+            data={},
+            meta={
+                "path": str(request.url.path),
+                "method": request.method,
+            },
+            errors=[
+                {
+                    "message": str(exc),
+                    "detail": "Service is temporarily unavailable. Please try again later.",
+                }
+            ],
+        )
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=response_data.model_dump(),
+        )
+
+    @app.exception_handler(DeadlineExceededException)
+    async def deadline_exceeded_handler(
+        request: Request, exc: DeadlineExceededException
+    ) -> JSONResponse:
+        response_data = ApiResponseSchema(
+            data={},
+            meta={
+                "path": str(request.url.path),
+                "method": request.method,
+            },
+            errors=[
+                {
+                    "message": str(exc),
+                    "detail": "Request could not be completed in time. Please try again later.",
+                }
+            ],
+        )
+        return JSONResponse(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            content=response_data.model_dump(),
+        )
+
+    @app.exception_handler(AdminAccessDeniedException)
+    async def admin_access_denied_handler(
+        request: Request, exc: AdminAccessDeniedException
+    ) -> JSONResponse:
+        response_data = ApiResponseSchema(
+            data={},
+            meta={
+                "path": str(request.url.path),
+                "method": request.method,
+            },
+            errors=[
+                {
+                    "message": str(exc),
+                    "field": "X-Admin-Key",
+                }
+            ],
+        )
+        return JSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content=response_data.model_dump(),
+        )
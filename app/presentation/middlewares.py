@@ -0,0 +1,23 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.adapters.deadline import deadline_scope
+
+
+class RequestDeadlineMiddleware:
+    """Give every HTTP request an end-to-end deadline for outgoing calls.
+
+    BaseHTTPXClient reads the deadline from a context variable, so retries and
+    per-attempt timeouts of all external calls made while handling the request
+    shrink to fit the remaining budget.
+    """
+
+    def __init__(self, app: ASGIApp, budget: float):
+        self.app = app
+        self.budget = budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with deadline_scope(self.budget):
+            await self.app(scope, receive, send)
@@ -0,0 +1,69 @@
+"""Per-call cost of decoding catalog payloads into ``Item``.
+
+Compares building a Retort for every payload (the previous CatalogService
+behaviour) with the shared, precompiled ``decode_item`` loader.
+
+    python -m benchmarks.bench_item_decoding [--payloads N]
+"""
+
+import argparse
+import time
+import uuid
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import UUID
+
+from adaptix import Retort, loader
+
+from app.core.value_objects.item import Item
+from app.infrastructure.adapters.item_decoder import decode_item
+
+
+def decode_with_new_retort(data: dict[str, Any]) -> Item:
+    retort = Retort(
+        recipe=[
+            loader(Decimal, lambda x: Decimal(str(x))),
+            loader(UUID, lambda x: UUID(str(x))),
+        ]
+    )
+    return retort.load(data, Item)
+
+
+def make_payloads(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"Item {i}",
+            "price": f"{i % 1000}.99",
+            "available_qty": i % 50,
+        }
+        for i in range(count)
+    ]
+
+
+def measure(decode: Callable[[dict[str, Any]], Item], payloads: list) -> float:
+    started = time.perf_counter()
+    for data in payloads:
+        decode(data)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payloads", type=int, default=10_000)
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.payloads)
+    decode_item(payloads[0])  # compile the shared loader outside the timing
+
+    for name, decode in (
+        ("Retort per call", decode_with_new_retort),
+        ("shared decode_item", decode_item),
+    ):
+        elapsed = measure(decode, payloads)
+        per_call_us = elapsed / len(payloads) * 1_000_000
+        print(f"{name:<20} {elapsed:8.3f} s total {per_call_us:10.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
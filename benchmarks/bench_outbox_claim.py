@@ -0,0 +1,146 @@
+"""Latency of the outbox claim query with full vs partial status indexes.
+
+Seeds a copy of the ``outbox`` table in a scratch schema with mostly sent
+rows and a few pending ones, then times ``OutboxRepository.claim_batch``
+with the previous full indexes on ``status`` and ``(event_type, status)``
+and with the partial ``WHERE status = 'pending'`` index. Claims are rolled
+back, so every run sees the same rows. Needs a migrated database reachable
+through POSTGRES_CONNECTION_STRING; the scratch schema is dropped afterwards.
+
+    python -m benchmarks.bench_outbox_claim [--sent N] [--pending N] [--runs N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from app.infrastructure.config.database import Database
+from app.infrastructure.config.settings import Settings
+from app.infrastructure.models import EventTypeEnum
+from app.infrastructure.repositories.outbox import OutboxRepository
+
+SCHEMA = "bench_outbox_claim"
+
+INDEX_LAYOUTS = {
+    "full status indexes": [
+        "CREATE INDEX ON {schema}.outbox (status)",
+        "CREATE INDEX ON {schema}.outbox (event_type, status)",
+    ],
+    "partial pending index": [
+        "CREATE INDEX ON {schema}.outbox (event_type, created_at)"
+        " WHERE status = 'pending'",
+    ],
+}
+
+SEED = """
+INSERT INTO {schema}.outbox (id, event_type, payload, status, created_at)
+SELECT
+    gen_random_uuid(),
+    (enum_range(NULL::eventtypeenum))[1 + i % 6],
+    jsonb_build_object('order_id', gen_random_uuid()),
+    CASE WHEN i % :every = 0 THEN 'pending' ELSE 'sent' END::outboxeventstatusenum,
+    now() - make_interval(secs => :total - i)
+FROM generate_series(1, :total) AS i
+"""
+
+
+async def prepare(engine: AsyncEngine, sent: int, pending: int) -> None:
+    total = sent + pending
+    async with engine.begin() as connection:
+        await connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await connection.execute(
+            text(
+                f"CREATE TABLE {SCHEMA}.outbox"
+                " (LIKE public.outbox INCLUDING DEFAULTS INCLUDING GENERATED)"
+            )
+        )
+        await connection.execute(
+            text(f"ALTER TABLE {SCHEMA}.outbox ADD PRIMARY KEY (id)")
+        )
+        await connection.execute(
+            text(SEED.format(schema=SCHEMA)),
+            {"total": total, "every": max(total // max(pending, 1), 1)},
+        )
+
+
+async def use_layout(engine: AsyncEngine, statements: list[str]) -> int:
+    async with engine.begin() as connection:
+        indexes = await connection.execute(
+            text(
+                "SELECT indexname FROM pg_indexes"
+                " WHERE schemaname = :schema AND indexname NOT LIKE '%pkey'"
+            ),
+            {"schema": SCHEMA},
+        )
+        for (index_name,) in indexes.all():
+            await connection.execute(text(f"DROP INDEX {SCHEMA}.{index_name}"))
+        for statement in statements:
+            await connection.execute(text(statement.format(schema=SCHEMA)))
+        await connection.execute(text(f"ANALYZE {SCHEMA}.outbox"))
+        size = await connection.execute(
+            text(
+                "SELECT coalesce(sum(pg_relation_size(indexrelid)), 0)"
+                " FROM pg_index WHERE indrelid = CAST(:table AS regclass)"
+                " AND NOT indisprimary"
+            ),
+            {"table": f"{SCHEMA}.outbox"},
+        )
+        return size.scalar_one()
+
+
+async def measure(engine: AsyncEngine, runs: int, batch_size: int) -> list[float]:
+    sessions = async_sessionmaker(
+        bind=engine.execution_options(schema_translate_map={None: SCHEMA})
+    )
+    timings = []
+    for run in range(runs + 1):
+        async with sessions() as session:
+            started = time.perf_counter()
+            await OutboxRepository(session=session).claim_batch(
+                event_type=EventTypeEnum.PAYMENT_REQUESTED,
+                lease_owner="bench",
+                limit=batch_size,
+            )
+            elapsed = time.perf_counter() - started
+            await session.rollback()
+        if run:  # the first run only warms the connection and caches
+            timings.append(elapsed)
+    return timings
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sent", type=int, default=2_000_000)
+    parser.add_argument("--pending", type=int, default=2_000)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    engine = Database(url=Settings().db_url).engine
+    engine.echo = False
+    try:
+        print(f"Seeding {args.sent} sent and {args.pending} pending outbox rows...")
+        await prepare(engine, sent=args.sent, pending=args.pending)
+        for name, statements in INDEX_LAYOUTS.items():
+            index_size = await use_layout(engine, statements)
+            timings = await measure(engine, runs=args.runs, batch_size=args.batch_size)
+            timings_ms = sorted(t * 1000 for t in timings)
+            p95 = timings_ms[int(len(timings_ms) * 0.95) - 1]
+            print(
+                f"{name:<22} p50 {statistics.median(timings_ms):8.2f} ms"
+                f"  p95 {p95:8.2f} ms"
+                f"  status index size {index_size / 1024 / 1024:8.1f} MiB"
+            )
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
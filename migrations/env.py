@@ -7,6 +7,7 @@ from app.infrastructure.config.settings import Settings
 # Import all models so Alembic can detect them
 from app.infrastructure.models import order, outbox  # noqa: F401
 from app.infrastructure.models.base import BaseModel
+from app.infrastructure.repositories.partitions import PARTITION_NAME
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -29,6 +30,15 @@ target_metadata = BaseModel.metadata
 # ... etc.
 
 
+def include_name(name, type_, parent_names):
+    """Leave the outbox/inbox partitions, managed at runtime, to their parents."""
+    if type_ == "table":
+        return not PARTITION_NAME.match(name)
+    if type_ == "index":
+        return not PARTITION_NAME.match(parent_names.get("table_name") or "")
+    return True
+
+
 def get_url():
     """Get database URL from environment variables or Settings"""
     # First, try to get DATABASE_URL directly
@@ -94,7 +104,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
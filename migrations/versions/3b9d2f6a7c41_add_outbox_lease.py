@@ -0,0 +1,35 @@
+"""Add lease columns to outbox
+
+Revision ID: 3b9d2f6a7c41
+Revises: f0ecaa8f00a7
+Create Date: 2026-10-18 10:12:40.518233
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9d2f6a7c41"
+down_revision: Union[str, Sequence[str], None] = "f0ecaa8f00a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "outbox", sa.Column("lease_owner", sa.String(length=255), nullable=True)
+    )
+    op.add_column(
+        "outbox",
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("outbox", "lease_expires_at")
+    op.drop_column("outbox", "lease_owner")
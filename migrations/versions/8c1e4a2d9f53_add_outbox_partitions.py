@@ -0,0 +1,75 @@
+"""Add outbox partition column and shard members table
+
+Revision ID: 8c1e4a2d9f53
+Revises: 3b9d2f6a7c41
+Create Date: 2026-10-18 14:03:27.941604
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c1e4a2d9f53"
+down_revision: Union[str, Sequence[str], None] = "3b9d2f6a7c41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must equal OUTBOX_PARTITIONS in app/infrastructure/models/outbox.py, which the
+# shard assignment iterates over; migrations keep their own copy so they do not
+# change when the model does.
+OUTBOX_PARTITIONS = 64
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "outbox",
+        sa.Column(
+            "partition",
+            sa.SmallInteger(),
+            sa.Computed(
+                "abs(hashtext(coalesce(payload ->> 'order_id', id::text))"
+                f" % {OUTBOX_PARTITIONS})",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "idx_outbox_partition_status",
+        "outbox",
+        ["partition", "status"],
+        unique=False,
+    )
+    op.create_table(
+        "outbox_shard_members",
+        sa.Column("shard_group", sa.String(length=64), nullable=False),
+        sa.Column("worker_id", sa.String(length=255), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("shard_group", "worker_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("outbox_shard_members")
+    op.drop_index("idx_outbox_partition_status", table_name="outbox")
+    op.drop_column("outbox", "partition")
@@ -0,0 +1,36 @@
+"""Index unsent outbox events by order
+
+Revision ID: a2c5e8f1b3d6
+Revises: f7a3c6e9d1b2
+Create Date: 2026-10-18 19:24:51.318204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a2c5e8f1b3d6"
+down_revision: Union[str, Sequence[str], None] = "f7a3c6e9d1b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Partitioned tables cannot be indexed concurrently; the index is small
+    # since it skips sent events.
+    op.create_index(
+        "idx_outbox_unsent_order",
+        "outbox",
+        [sa.text("(payload ->> 'order_id')"), "created_at"],
+        unique=False,
+        postgresql_where=sa.text("status <> 'sent'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_outbox_unsent_order", table_name="outbox")
@@ -0,0 +1,62 @@
+"""Add outbox retry columns and dead letter status
+
+Revision ID: d4e7a1c9b2f8
+Revises: 8c1e4a2d9f53
+Create Date: 2026-10-18 15:21:09.318274
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e7a1c9b2f8"
+down_revision: Union[str, Sequence[str], None] = "8c1e4a2d9f53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A new enum value must be committed before it can be used.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TYPE outboxeventstatusenum ADD VALUE IF NOT EXISTS 'dead_letter'"
+        )
+    op.add_column(
+        "outbox",
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "outbox",
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.add_column("outbox", sa.Column("last_error", sa.Text(), nullable=True))
+    op.create_index(
+        "idx_outbox_due",
+        "outbox",
+        ["event_type", "next_attempt_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Postgres cannot drop an enum value; park dead letters as pending instead.
+    op.execute("UPDATE outbox SET status = 'pending' WHERE status = 'dead_letter'")
+    op.drop_index(
+        "idx_outbox_due",
+        table_name="outbox",
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.drop_column("outbox", "last_error")
+    op.drop_column("outbox", "next_attempt_at")
+    op.drop_column("outbox", "attempts")
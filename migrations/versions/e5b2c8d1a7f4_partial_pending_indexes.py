@@ -0,0 +1,121 @@
+"""Replace outbox and inbox status indexes with partial pending indexes
+
+Revision ID: e5b2c8d1a7f4
+Revises: d4e7a1c9b2f8
+Create Date: 2026-10-18 16:02:44.507183
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b2c8d1a7f4"
+down_revision: Union[str, Sequence[str], None] = "d4e7a1c9b2f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so that large tables keep taking writes meanwhile.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_outbox_pending",
+            "outbox",
+            ["event_type", "created_at"],
+            unique=False,
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_outbox_dead_letter",
+            "outbox",
+            ["event_type"],
+            unique=False,
+            postgresql_where=sa.text("status = 'dead_letter'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_inbox_pending",
+            "inbox",
+            ["created_at"],
+            unique=False,
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for index_name, table_name in (
+            ("idx_status", "outbox"),
+            ("idx_event_type_status_type", "outbox"),
+            ("idx_outbox_partition_status", "outbox"),
+            ("idx_outbox_due", "outbox"),
+            ("idx_status_inbox", "inbox"),
+        ):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_status_inbox",
+            "inbox",
+            ["status"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_outbox_due",
+            "outbox",
+            ["event_type", "next_attempt_at"],
+            unique=False,
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_outbox_partition_status",
+            "outbox",
+            ["partition", "status"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_event_type_status_type",
+            "outbox",
+            ["event_type", "status"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_status",
+            "outbox",
+            ["status"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for index_name, table_name in (
+            ("idx_inbox_pending", "inbox"),
+            ("idx_outbox_dead_letter", "outbox"),
+            ("idx_outbox_pending", "outbox"),
+        ):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
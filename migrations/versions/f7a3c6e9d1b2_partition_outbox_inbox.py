@@ -0,0 +1,180 @@
+"""Partition outbox and inbox by created_at
+
+Revision ID: f7a3c6e9d1b2
+Revises: e5b2c8d1a7f4
+Create Date: 2026-10-18 17:12:05.662918
+
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a3c6e9d1b2"
+down_revision: Union[str, Sequence[str], None] = "e5b2c8d1a7f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Days of partitions created up front; PartitionMaintenanceWorker keeps
+# creating them from then on.
+PREMAKE_DAYS = 7
+
+OUTBOX_COLUMNS = (
+    "id, created_at, updated_at, event_type, payload, status, lease_owner,"
+    " lease_expires_at, attempts, next_attempt_at, last_error"
+)
+INBOX_COLUMNS = (
+    "id, created_at, updated_at, event_type, payload, status, idempotency_key"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows up to the end of today stay where they are, in the legacy
+    # partition, which is dropped by retention once fully processed.
+    first_day = datetime.now(UTC).date() + timedelta(days=1)
+
+    op.create_table(
+        "inbox_idempotency_keys",
+        sa.Column("idempotency_key", sa.UUID(), nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("idempotency_key"),
+    )
+    op.create_index(
+        "idx_inbox_idempotency_keys_created_at",
+        "inbox_idempotency_keys",
+        ["created_at"],
+        unique=False,
+    )
+    op.execute(
+        "INSERT INTO inbox_idempotency_keys (id, idempotency_key, created_at)"
+        " SELECT gen_random_uuid(), idempotency_key, created_at FROM inbox"
+    )
+    op.drop_constraint("inbox_idempotency_key_key", "inbox", type_="unique")
+
+    _partition_table(
+        "outbox",
+        legacy_indexes=("idx_outbox_pending", "idx_outbox_dead_letter"),
+        first_day=first_day,
+    )
+    op.create_index(
+        "idx_outbox_pending",
+        "outbox",
+        ["event_type", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "idx_outbox_dead_letter",
+        "outbox",
+        ["event_type"],
+        unique=False,
+        postgresql_where=sa.text("status = 'dead_letter'"),
+    )
+
+    _partition_table(
+        "inbox", legacy_indexes=("idx_inbox_pending",), first_day=first_day
+    )
+    op.create_index(
+        "idx_inbox_pending",
+        "inbox",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "idx_inbox_idempotency_key", "inbox", ["idempotency_key"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _unpartition_table("outbox", columns=OUTBOX_COLUMNS)
+    op.create_index(
+        "idx_outbox_pending",
+        "outbox",
+        ["event_type", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "idx_outbox_dead_letter",
+        "outbox",
+        ["event_type"],
+        unique=False,
+        postgresql_where=sa.text("status = 'dead_letter'"),
+    )
+
+    _unpartition_table("inbox", columns=INBOX_COLUMNS)
+    op.create_index(
+        "idx_inbox_pending",
+        "inbox",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_unique_constraint(
+        "inbox_idempotency_key_key", "inbox", ["idempotency_key"]
+    )
+
+    op.drop_index(
+        "idx_inbox_idempotency_keys_created_at", table_name="inbox_idempotency_keys"
+    )
+    op.drop_table("inbox_idempotency_keys")
+
+
+def _partition_table(
+    table: str, legacy_indexes: Sequence[str], first_day: date
+) -> None:
+    legacy = f"{table}_legacy"
+    op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+    # Free the index names for the parent; creating the parent's indexes
+    # then adopts these instead of building them again.
+    for index in legacy_indexes:
+        op.execute(f"ALTER INDEX {index} RENAME TO {legacy}_{index}")
+    # The primary key of a partitioned table must include the partition key.
+    op.execute(f"ALTER TABLE {legacy} DROP CONSTRAINT {table}_pkey")
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING GENERATED)"
+        " PARTITION BY RANGE (created_at)"
+    )
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, created_at)")
+    op.execute(
+        f"ALTER TABLE {table} ATTACH PARTITION {legacy}"
+        f" FOR VALUES FROM (MINVALUE) TO ('{first_day.isoformat()} 00:00:00+00')"
+    )
+    for offset in range(PREMAKE_DAYS):
+        day = first_day + timedelta(days=offset)
+        next_day = day + timedelta(days=1)
+        op.execute(
+            f"CREATE TABLE {table}_p{day:%Y%m%d} PARTITION OF {table}"
+            f" FOR VALUES FROM ('{day.isoformat()} 00:00:00+00')"
+            f" TO ('{next_day.isoformat()} 00:00:00+00')"
+        )
+
+
+def _unpartition_table(table: str, columns: str) -> None:
+    plain = f"{table}_unpartitioned"
+    op.execute(
+        f"CREATE TABLE {plain} (LIKE {table} INCLUDING DEFAULTS INCLUDING GENERATED)"
+    )
+    op.execute(f"INSERT INTO {plain} ({columns}) SELECT {columns} FROM {table}")
+    op.execute(f"DROP TABLE {table} CASCADE")
+    op.execute(f"ALTER TABLE {plain} RENAME TO {table}")
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")